@@ -1,15 +1,20 @@
 from fastapi import FastAPI, APIRouter, Depends, HTTPException, UploadFile, File, Form, WebSocket, WebSocketDisconnect, Request
-from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse, Response, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.encoders import jsonable_encoder
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import InsertOne, ReturnDocument, UpdateOne, UpdateMany
+from pymongo.errors import DuplicateKeyError, OperationFailure
+from bson import json_util
 import os
 import logging
 from pathlib import Path
 import uvicorn
 from pydantic import BaseModel, Field, EmailStr
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, AsyncIterator
 import uuid
 from datetime import datetime, timezone, timedelta
 import jwt
@@ -25,6 +30,19 @@ import base64
 import secrets
 import requests
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config as BotoConfig
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from collections import OrderedDict, deque
+from types import MappingProxyType
+import functools
+import itertools
+import multiprocessing
+from abc import ABC, abstractmethod
+import time
+import asyncio
+import shutil
+import numpy as np
 
 ROOT_DIR = Path(__file__).resolve().parent
 load_dotenv(ROOT_DIR / '.env')
@@ -64,6 +82,21 @@ AWS_S3_BUCKET = os.getenv("AWS_S3_BUCKET")
 AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 
+# Blocking boto3 calls run on a bounded pool (see S3Executor). A managed upload
+# (upload_fileobj) on one of those workers starts up to S3_TRANSFER_CONCURRENCY transfer
+# threads of its own, so the HTTP connection pool is sized executor x transfer threads
+# and no thread waits on a connection.
+S3_MAX_CONCURRENCY = int(os.getenv("S3_MAX_CONCURRENCY", "16"))
+S3_TRANSFER_CONCURRENCY = int(os.getenv("S3_TRANSFER_CONCURRENCY", "4"))
+S3_TRANSFER_CONFIG = TransferConfig(max_concurrency=S3_TRANSFER_CONCURRENCY)
+S3_BOTO_CONFIG = BotoConfig(
+    max_pool_connections=S3_MAX_CONCURRENCY * S3_TRANSFER_CONCURRENCY,
+    retries={"max_attempts": 4, "mode": "adaptive"},
+    connect_timeout=5,
+    read_timeout=60,
+    tcp_keepalive=True,
+)
+
 S3_CLIENT = None
 if VIDEO_STORAGE == "s3":
     try:
@@ -73,10 +106,11 @@ if VIDEO_STORAGE == "s3":
                 region_name=AWS_REGION,
                 aws_access_key_id=AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
+                config=S3_BOTO_CONFIG,
             )
         else:
             # fall back to default credential chain
-            S3_CLIENT = boto3.client("s3", region_name=AWS_REGION)
+            S3_CLIENT = boto3.client("s3", region_name=AWS_REGION, config=S3_BOTO_CONFIG)
         logging.info(f"S3 client initialized for bucket: {AWS_S3_BUCKET} in region: {AWS_REGION}")
     except Exception as e:
         logging.error(f"Failed to initialize S3 client: {e}")
@@ -103,6 +137,62 @@ async def require_seb(request: Request):
         raise HTTPException(status_code=403, detail="SEB validation failed")
     return True
 
+# Multipart uploads are spooled to a temp file by the form parser before the endpoint
+# (and its copy-time limit in HashingReader) runs, so their bodies are capped while the
+# request streams in: up front on Content-Length, and by counting received bytes when
+# the body is chunked. Limits are read per request (the MAX_*_BYTES settings follow).
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+UPLOAD_BODY_LIMITS = [
+    (re.compile(r"^/api/candidates/resume$"), lambda: MAX_RESUME_BYTES),
+    (re.compile(r"^/api/recordings/upload$"), lambda: MAX_RECORDING_BYTES),
+    (re.compile(r"^/api/interviews/[^/]+/upload-recording$"), lambda: MAX_RECORDING_BYTES),
+    # webcam, screen and audio in one form
+    (re.compile(r"^/api/secure-interview/[^/]+/upload$"), lambda: 3 * MAX_RECORDING_BYTES),
+]
+
+
+class UploadBodyLimit:
+    """ASGI middleware answering 413 as soon as an upload body is known to exceed its limit."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        max_bytes = None
+        if scope["type"] == "http" and scope.get("method") in ("POST", "PUT"):
+            for pattern, limit_of in UPLOAD_BODY_LIMITS:
+                if pattern.match(scope.get("path", "")):
+                    max_bytes = limit_of()
+                    break
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+        limit = max_bytes + MULTIPART_OVERHEAD_BYTES
+        too_large = _too_large(max_bytes)
+        length = dict(scope.get("headers") or []).get(b"content-length", b"")
+        if length.isdigit() and int(length) > limit:
+            response = Response(content=json.dumps({"detail": too_large.detail}), status_code=413,
+                                media_type="application/json")
+            await response(scope, receive, send)
+            return
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside the form parser; FastAPI passes HTTPExceptions through
+                    raise too_large
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+# Added before CORS so that 413 responses still carry CORS headers
+app.add_middleware(UploadBodyLimit)
+
 # CORS configuration (localhost-only for development)
 _origins_list = [
     "http://localhost:3000",
@@ -117,11 +207,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
 # --- Interview Rounds Configuration ---
 ROUND_COUNTS = {1: 25, 2: 15, 3: 10}
 ROUND_DURATIONS_SEC = {1: 5 * 60, 2: 20 * 60, 3: 15 * 60}
+ROUND_PASS_PERCENTAGE = 60.0
+# Run submitRound's writes in one multi-document transaction (needs a replica set / Atlas).
+# Without it the writes are ordered so the interview is only marked completed after its
+# results are stored; a failure part-way can still leave a stored result for a round the
+# interview does not list yet, which a resubmission overwrites.
+SUBMIT_ROUND_TRANSACTIONS = os.getenv("SUBMIT_ROUND_TRANSACTIONS", "false").lower() == "true"
 
 def _generate_mcq(index: int, prefix: str) -> Dict[str, Any]:
     options = ["Option A", "Option B", "Option C", "Option D"]
@@ -548,14 +645,22 @@ REAL_ROUND3_QUESTIONS: List[Dict[str, Any]] = [
 
 # --- Multi-round Interview Endpoints (MCQ-only) ---
 @api_router.get("/interview/getRoundQuestions")
-async def get_round_questions(round: int):
+async def get_round_questions(round: int, interview_id: Optional[str] = None):
     try:
         r = int(round)
     except Exception:
         raise HTTPException(status_code=400, detail="invalid round")
-    questions = build_round_questions(r)
-    # Return all questions; no artificial limits
-    return {"round": r, "count": len(questions), "questions": questions, "duration_sec": ROUND_DURATIONS_SEC.get(r)}
+    compiled = COMPILED_ROUNDS.get(r)
+    if compiled is None:
+        raise HTTPException(status_code=400, detail="invalid round")
+    if interview_id:
+        # Per-interview paper: seeded question sample and option order, stable across reloads
+        sample = await load_round_sample(interview_id, r, draw=True)
+        if sample is None:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        return Response(content=sample.body(), media_type="application/json")
+    # Return all questions; no artificial limits. The body is serialized once at startup.
+    return Response(content=compiled.body, media_type="application/json")
 
 
 class SubmitRoundPayload(BaseModel):
@@ -570,137 +675,161 @@ class SubmitRoundPayload(BaseModel):
 
 @api_router.post("/interview/submitRound")
 async def submit_round(data: SubmitRoundPayload):
-    # Basic validation: interview exists; derive candidate_id from interview to avoid import-order issues
-    interview = await db.interviews.find_one({"id": data.interview_id})
-    if not interview:
-        raise HTTPException(status_code=404, detail="Interview not found")
-    candidate_id = interview.get("candidate_id")
-    if not candidate_id:
-        raise HTTPException(status_code=400, detail="Interview missing candidate_id")
-
     round_num = int(data.round)
+    compiled = COMPILED_ROUNDS.get(round_num)
+    if compiled is None:
+        raise HTTPException(status_code=400, detail="invalid round")
     now = datetime.now(timezone.utc)
-
-    # Store or upsert per-round raw submission (for audit/history)
-    submission_doc = {
-        "interview_id": data.interview_id,
-        "candidate_id": candidate_id,
-        "round": round_num,
-        "answers": data.answers,
-        "duration_sec": int(data.duration_sec or 0),
-        "warnings": int(data.warnings or 0),
-        "submitted_at": now,
-    }
-    await db.interview_round_submissions.update_one(
-        {"interview_id": data.interview_id, "candidate_id": candidate_id, "round": round_num},
-        {"$set": submission_doc},
-        upsert=True,
-    )
-
-    # --- Per-answer storage in candidate_answers ---
-    # Build correct answer map from the round question set
-    questions_for_round = build_round_questions(round_num)
-    correct_map: Dict[str, int | None] = {}
-    for q in questions_for_round:
-        qid = q.get("id")
-        if qid is not None:
-            correct_map[str(qid)] = q.get("correctIndex")
-
-    answer_docs = []
-    correct_count = 0
+    # Interviews served a sampled paper are graded against it; answers are mapped back to
+    # pool option indices, so candidate_answers stays comparable across papers.
+    sample = await load_round_sample(data.interview_id, round_num)
+
+    # --- Grade in memory; the only read above is the (usually cached) sample ---
+    answer_rows = []
+    positions: List[int] = []
+    options: List[int] = []
     # wrong_count will be derived from total questions so that unanswered count as wrong
-
     for item in data.answers or []:
-        qid = str(item.get("questionId")) if item.get("questionId") is not None else None
-        # Frontend may send the selected option index as a string (e.g. "1") or an int; normalize to int when possible
-        raw_selected = item.get("answer")
-        selected_option: Optional[int]
-        if isinstance(raw_selected, int):
-            selected_option = raw_selected
+        if item.get("questionId") is None:
+            continue
+        qid = str(item.get("questionId"))
+        selected_option = coerce_selected_option(item.get("answer"))
+        if sample is not None:
+            position, selected_option = sample.resolve(qid, selected_option)
         else:
-            try:
-                selected_option = int(raw_selected) if raw_selected is not None and str(raw_selected).strip() != "" else None
-            except (TypeError, ValueError):
-                selected_option = None
-        correct_idx = correct_map.get(qid) if qid is not None else None
-        is_correct = (
-            isinstance(selected_option, int)
-            and isinstance(correct_idx, int)
-            and selected_option == correct_idx
+            position = compiled.positions.get(qid, -1)
+            position = position if position < compiled.sample_size else -1
+        positions.append(position)
+        options.append(option_index(selected_option))
+        # A pool question that was not on this candidate's paper never scores
+        off_paper = position < 0 and qid in compiled.positions
+        answer_rows.append((qid, selected_option, item.get("timeSpent"), off_paper))
+
+    # The whole submission is graded in one vectorized pass
+    row_correct, correct_counts = compiled.grade_batch(np.zeros(len(positions)), positions, options, 1)
+    correct_count = int(correct_counts[0])
+    total_questions = sample.count if sample is not None else compiled.sample_size
+    wrong_count, percentage, round_status = round_outcome(correct_count, total_questions)
+    completed = round_num >= 3
+
+    async def write(session=None) -> tuple:
+        # Basic validation: interview exists; candidate_id is derived from the interview
+        owner_doc = await db.interviews.find_one(
+            {"id": data.interview_id}, {"_id": 0, "candidate_id": 1}, session=session
         )
-
-        if is_correct:
-            correct_count += 1
-
-        if qid is not None:
-            answer_docs.append(
-                {
-                    "interview_id": data.interview_id,
-                    "candidate_id": candidate_id,
-                    "round": round_num,
-                    "question_id": qid,
-                    "selected_option": selected_option,
-                    "is_correct": bool(is_correct),
-                    "time_spent_sec": item.get("timeSpent"),
-                    "timestamp": now,
-                }
-            )
-
-    if answer_docs:
-        # Append; we keep history of each submission attempt
-        await db.candidate_answers.insert_many(answer_docs)
-
-    total_questions = len(questions_for_round)
-    wrong_count = max(0, total_questions - correct_count)
-    percentage = float((correct_count / total_questions) * 100.0) if total_questions > 0 else 0.0
-    round_status = "Passed" if percentage >= 60.0 else "Failed"
-
-    # --- Round-wise score storage in round_results ---
-    round_result_doc = {
-        "interview_id": data.interview_id,
-        "candidate_id": candidate_id,
-        "round": round_num,
-        "correctAnswers": correct_count,
-        "wrongAnswers": wrong_count,
-        "percentage": percentage,
-        "roundStatus": round_status,
-        "warnings": int(data.warnings or 0),
-        "duration_sec": int(data.duration_sec or 0),
-        "webcamUrl": data.webcam_url,
-        "screenUrl": data.screen_url,
-        "updated_at": now,
-    }
-    await db.round_results.update_one(
-        {"interview_id": data.interview_id, "candidate_id": candidate_id, "round": round_num},
-        {"$set": round_result_doc},
-        upsert=True,
-    )
-
-    # After last round, mark interview completed and set candidate finalStatus
-    completed = False
-    if round_num >= 3:
-        completed = True
-        await db.interviews.update_one(
+        if owner_doc is None:
+            raise HTTPException(status_code=404, detail="Interview not found")
+        candidate_id = owner_doc.get("candidate_id")
+        if not candidate_id:
+            raise HTTPException(status_code=400, detail="Interview missing candidate_id")
+        owner = {"interview_id": data.interview_id, "candidate_id": candidate_id, "round": round_num}
+
+        # Per-round raw submission (for audit/history)
+        submission_doc = {
+            **owner,
+            "answers": data.answers,
+            "duration_sec": int(data.duration_sec or 0),
+            "warnings": int(data.warnings or 0),
+            "submitted_at": now,
+        }
+        # Per-answer storage in candidate_answers; we keep history of each submission attempt
+        answer_ops = [
+            InsertOne({
+                **owner,
+                "question_id": qid,
+                "selected_option": selected_option,
+                "is_correct": bool(is_correct),
+                "time_spent_sec": time_spent,
+                "timestamp": now,
+                **({"off_paper": True} if off_paper else {}),
+            })
+            for (qid, selected_option, time_spent, off_paper), is_correct in zip(answer_rows, row_correct)
+        ]
+        # Round-wise score storage in round_results
+        round_result_doc = {
+            **owner,
+            "correctAnswers": correct_count,
+            "wrongAnswers": wrong_count,
+            "percentage": percentage,
+            "roundStatus": round_status,
+            "warnings": int(data.warnings or 0),
+            "duration_sec": int(data.duration_sec or 0),
+            "webcamUrl": data.webcam_url,
+            "screenUrl": data.screen_url,
+            "updated_at": now,
+        }
+        writes = [
+            db.interview_round_submissions.bulk_write(
+                [UpdateOne(owner, {"$set": submission_doc}, upsert=True)], session=session
+            ),
+            db.round_results.find_one_and_update(
+                owner,
+                {"$set": round_result_doc},
+                upsert=True,
+                projection={"_id": 0, "percentage": 1, "roundStatus": 1},
+                session=session,
+            ),
+        ]
+        if answer_ops:
+            writes.append(db.candidate_answers.bulk_write(answer_ops, ordered=False, session=session))
+        if session is None:
+            results = await asyncio.gather(*writes)
+        else:
+            # Operations on one session must not overlap
+            results = [await w for w in writes]
+        previous_result = results[1]
+
+        # Only once the submission, answers and result are stored is the round recorded on
+        # the interview (and, after the last round, the interview closed), so a failed write
+        # above never leaves a completed interview without results. The interview carries a
+        # round -> roundStatus map, so this one round trip also hands back every round's
+        # status for finalStatus.
+        interview_update: Dict[str, Any] = {f"round_statuses.{round_num}": round_status}
+        if completed:
+            interview_update.update({"status": "completed", "ended_at": now})
+        interview = await db.interviews.find_one_and_update(
             {"id": data.interview_id},
-            {"$set": {"status": "completed", "ended_at": now}},
+            {"$set": interview_update},
+            projection={"_id": 0, "candidate_id": 1, "company_id": 1, "round_statuses": 1},
+            return_document=ReturnDocument.AFTER,
+            session=session,
         )
+        if interview is None:
+            raise HTTPException(status_code=404, detail="Interview not found")
+
+        final_status = None
+        if completed:
+            statuses = interview.get("round_statuses") or {}
+            if all(str(r) in statuses for r in (1, 2, 3)):
+                # Consider only rounds 1-3, require all marked as Passed
+                final_status = "Selected" if all(statuses[str(r)] == "Passed" for r in (1, 2, 3)) else "Rejected"
+                await db.candidates.update_one(
+                    {"id": candidate_id}, {"$set": {"finalStatus": final_status}}, session=session
+                )
+        return interview, previous_result, final_status
+
+    if SUBMIT_ROUND_TRANSACTIONS:
+        async with await client.start_session() as session:
+            interview, previous_result, final_status = await session.with_transaction(write)
+    else:
+        interview, previous_result, final_status = await write()
+    candidate_id = interview["candidate_id"]
 
-        # Determine finalStatus based on all round_results for this interview
-        all_results = await db.round_results.find(
-            {"interview_id": data.interview_id, "candidate_id": candidate_id}
-        ).to_list(10)
-        # Consider only rounds 1-3, require all marked as Passed
-        has_all_rounds = any(r.get("round") == 1 for r in all_results) and any(
-            r.get("round") == 2 for r in all_results
-        ) and any(r.get("round") == 3 for r in all_results)
-        all_passed = has_all_rounds and all(
-            r.get("roundStatus") == "Passed" for r in all_results if r.get("round") in [1, 2, 3]
-        )
-        final_status = "Selected" if all_passed else "Rejected"
-        await db.candidates.update_one(
-            {"id": candidate_id},
-            {"$set": {"finalStatus": final_status}},
-        )
+    if completed:
+        if final_status is None:
+            # Interviews that started before round_statuses existed: derive from round_results
+            await refresh_final_status(data.interview_id, candidate_id)
+        else:
+            invalidate_principal(candidate_id)
+
+    # Keep the company's aptitude rollup current; a resubmission replaces its earlier result
+    previous_result = previous_result or {}
+    rollup_key = f"aptitude.{round_num}"
+    await _bump_company_rollup(interview.get("company_id"), {
+        f"{rollup_key}.submissions": 0 if previous_result else 1,
+        f"{rollup_key}.passed": int(round_status == "Passed") - int(previous_result.get("roundStatus") == "Passed"),
+        f"{rollup_key}.percentage_sum": percentage - float(previous_result.get("percentage") or 0.0),
+    })
 
     return {
         "ok": True,
@@ -712,18 +841,66 @@ async def submit_round(data: SubmitRoundPayload):
         "roundStatus": round_status,
     }
 
-def build_round_questions(round_num: int) -> List[Dict[str, Any]]:
+def coerce_selected_option(raw_selected: Any) -> Optional[int]:
+    # Frontend may send the selected option index as a string (e.g. "1") or an int; normalize to int when possible
+    if isinstance(raw_selected, bool):
+        return int(raw_selected)
+    if isinstance(raw_selected, int):
+        return raw_selected
+    try:
+        return int(raw_selected) if raw_selected is not None and str(raw_selected).strip() != "" else None
+    except (TypeError, ValueError):
+        return None
+
+
+def option_index(selected_option: Optional[int]) -> int:
+    """Selected option as a grading index; -1 for no (or an out-of-range) answer."""
+    return selected_option if selected_option is not None and 0 <= selected_option < 2 ** 15 else -1
+
+
+def round_outcome(correct_count: int, total_questions: int) -> tuple:
+    """(wrong_count, percentage, roundStatus); unanswered questions count as wrong."""
+    wrong_count = max(0, total_questions - correct_count)
+    percentage = float((correct_count / total_questions) * 100.0) if total_questions > 0 else 0.0
+    return wrong_count, percentage, "Passed" if percentage >= ROUND_PASS_PERCENTAGE else "Failed"
+
+
+async def refresh_final_status(interview_id: str, candidate_id: str) -> str:
+    """Set the candidate's finalStatus from all round_results of an interview."""
+    all_results = await db.round_results.find(
+        {"interview_id": interview_id, "candidate_id": candidate_id}
+    ).to_list(10)
+    # Consider only rounds 1-3, require all marked as Passed
+    has_all_rounds = any(r.get("round") == 1 for r in all_results) and any(
+        r.get("round") == 2 for r in all_results
+    ) and any(r.get("round") == 3 for r in all_results)
+    all_passed = has_all_rounds and all(
+        r.get("roundStatus") == "Passed" for r in all_results if r.get("round") in [1, 2, 3]
+    )
+    final_status = "Selected" if all_passed else "Rejected"
+    await db.candidates.update_one(
+        {"id": candidate_id},
+        {"$set": {"finalStatus": final_status}},
+    )
+    invalidate_principal(candidate_id)
+    return final_status
+
+
+def build_round_questions(round_num: int, pool: bool = False) -> List[Dict[str, Any]]:
     """Build MCQ list for a given round.
     Attempts to use assigned question set in DB if present later; for now, generate MCQs with no artificial limits.
+    With pool=True returns the round's whole bank (the REAL_ROUND*_QUESTIONS lists are append-only:
+    stored samples refer to questions by their position in it).
     """
     total = ROUND_COUNTS.get(round_num)
     if not total:
         raise HTTPException(status_code=400, detail="invalid round")
+    limit = None if pool else total
 
     # Round 1: use fixed real aptitude (mixed) questions
     if int(round_num) == 1:
         questions: List[Dict[str, Any]] = []
-        for idx, q in enumerate(REAL_ROUND1_QUESTIONS[:total]):
+        for idx, q in enumerate(REAL_ROUND1_QUESTIONS[:limit]):
             questions.append(
                 {
                     "id": f"r1q{idx+1}",
@@ -738,7 +915,7 @@ def build_round_questions(round_num: int) -> List[Dict[str, Any]]:
     # Round 2: use fixed logical reasoning questions
     if int(round_num) == 2:
         questions: List[Dict[str, Any]] = []
-        for idx, q in enumerate(REAL_ROUND2_QUESTIONS[:total]):
+        for idx, q in enumerate(REAL_ROUND2_QUESTIONS[:limit]):
             questions.append(
                 {
                     "id": f"r2q{idx+1}",
@@ -753,7 +930,7 @@ def build_round_questions(round_num: int) -> List[Dict[str, Any]]:
     # Round 3: use fixed analytical/quant/logical mix questions
     if int(round_num) == 3:
         questions: List[Dict[str, Any]] = []
-        for idx, q in enumerate(REAL_ROUND3_QUESTIONS[:total]):
+        for idx, q in enumerate(REAL_ROUND3_QUESTIONS[:limit]):
             questions.append(
                 {
                     "id": f"r3q{idx+1}",
@@ -772,6 +949,182 @@ def build_round_questions(round_num: int) -> List[Dict[str, Any]]:
         questions.append(_generate_mcq(i, prefix))
     return questions
 
+def _served_question(question: Dict[str, Any]) -> Dict[str, Any]:
+    # The answer key stays on the server; submitRound grades
+    return {k: v for k, v in question.items() if k != "correctIndex"}
+
+
+class CompiledRound:
+    """A round's question pool, built once: a positional answer key over the whole pool plus
+    the response bytes for the fixed (unsampled) paper, its first `sample_size` questions."""
+
+    __slots__ = ("round", "questions", "question_ids", "positions", "answer_key", "option_counts",
+                 "sample_size", "body", "version")
+
+    def __init__(self, round_num: int, questions: List[Dict[str, Any]], sample_size: Optional[int] = None):
+        self.round = round_num
+        self.questions = tuple(questions)
+        self.sample_size = len(questions) if sample_size is None else min(sample_size, len(questions))
+        self.question_ids = tuple(str(q["id"]) for q in questions)
+        self.positions = MappingProxyType({qid: i for i, qid in enumerate(self.question_ids)})
+        key = np.array([q.get("correctIndex") if isinstance(q.get("correctIndex"), int) else -1 for q in questions],
+                       dtype=np.int16)
+        key.setflags(write=False)
+        self.answer_key = key
+        option_counts = np.array([len(q.get("options") or []) for q in questions], dtype=np.int16)
+        option_counts.setflags(write=False)
+        self.option_counts = option_counts
+        self.body = json.dumps({
+            "round": round_num,
+            "count": self.sample_size,
+            "questions": [_served_question(q) for q in questions[:self.sample_size]],
+            "duration_sec": ROUND_DURATIONS_SEC.get(round_num),
+        }).encode()
+        # Changes whenever a question, option, answer key or the paper length changes
+        self.version = hashlib.sha256(
+            json.dumps([self.sample_size, questions], sort_keys=True).encode()
+        ).hexdigest()[:16]
+
+    @property
+    def count(self) -> int:
+        """Pool size."""
+        return len(self.question_ids)
+
+    def draw(self, seed: int) -> np.ndarray:
+        """Pool positions of a seeded sample of `sample_size` questions, in serving order."""
+        rng = np.random.default_rng([seed, self.round])
+        return rng.choice(self.count, size=self.sample_size, replace=False).astype(np.int16)
+
+    def option_order(self, seed: int, position: int) -> np.ndarray:
+        """Displayed option i is pool option option_order(...)[i]. Seeded per question, so it
+        does not depend on which other questions were drawn."""
+        rng = np.random.default_rng([seed, self.round, int(position)])
+        return rng.permutation(int(self.option_counts[position]))
+
+    def grade_batch(self, submission, positions, selected, n_submissions: int) -> tuple:
+        """Grade many answers in one pass.
+
+        Row i says submission `submission[i]` picked option `selected[i]` for question
+        position `positions[i]` (-1: not in this round). Returns (per-row correctness,
+        correct count per submission). A question answered twice in one submission is
+        scored once, by its last answer (rows without an answer don't override it).
+        """
+        submission = np.asarray(submission, dtype=np.int64)
+        positions = np.asarray(positions, dtype=np.int64)
+        selected = np.asarray(selected, dtype=np.int64)
+        valid = (positions >= 0) & (positions < self.count)
+        key = np.where(valid, self.answer_key[np.where(valid, positions, 0)], -1)
+        row_correct = valid & (key >= 0) & (selected == key)
+
+        # Only the last answered row for every (submission, position) pair is counted
+        answered = np.flatnonzero(valid & (selected >= 0))
+        pair = submission[answered] * self.count + positions[answered]
+        _, first_from_end = np.unique(pair[::-1], return_index=True)
+        last = answered[len(answered) - 1 - first_from_end]
+        counted = last[row_correct[last]]
+        correct = np.bincount(submission[counted], minlength=n_submissions)
+        return row_correct, correct
+
+
+def compile_round_bank() -> "MappingProxyType[int, CompiledRound]":
+    return MappingProxyType({
+        r: CompiledRound(r, build_round_questions(r, pool=True), ROUND_COUNTS[r]) for r in sorted(ROUND_COUNTS)
+    })
+
+
+COMPILED_ROUNDS = compile_round_bank()
+
+
+class RoundSample:
+    """One interview's paper for a round: a seed plus the drawn pool positions. Option order
+    is re-derived from the seed, so only `seed` and `order` (int16 bytes) are stored, under
+    interviews.question_samples.<round>. Rebuilding the key is O(questions)."""
+
+    __slots__ = ("compiled", "seed", "order", "slots", "option_orders", "_body")
+
+    def __init__(self, compiled: CompiledRound, seed: int, order: np.ndarray):
+        self.compiled = compiled
+        self.seed = int(seed)
+        self.order = order
+        self.slots = {compiled.question_ids[p]: int(p) for p in order.tolist()}
+        self.option_orders = {p: compiled.option_order(seed, p) for p in self.slots.values()}
+        self._body: Optional[bytes] = None
+
+    @classmethod
+    def from_doc(cls, compiled: CompiledRound, doc: Dict[str, Any]) -> "RoundSample":
+        return cls(compiled, doc["seed"], np.frombuffer(bytes(doc["order"]), dtype="<i2"))
+
+    def to_doc(self) -> Dict[str, Any]:
+        return {"seed": self.seed, "order": self.order.astype("<i2").tobytes()}
+
+    @property
+    def count(self) -> int:
+        return len(self.order)
+
+    def resolve(self, question_id: str, displayed: Optional[int]) -> tuple:
+        """(pool position or -1, pool option index or None) for an answer as the candidate saw it."""
+        position = self.slots.get(question_id)
+        if position is None:
+            return -1, displayed
+        options = self.option_orders[position]
+        if displayed is None or not 0 <= displayed < len(options):
+            return position, None
+        return position, int(options[displayed])
+
+    def body(self) -> bytes:
+        if self._body is None:
+            questions = []
+            for p in self.order.tolist():
+                q = self.compiled.questions[p]
+                questions.append({
+                    **_served_question(q),
+                    "options": [q["options"][o] for o in self.option_orders[p].tolist()],
+                })
+            self._body = json.dumps({
+                "round": self.compiled.round,
+                "count": len(questions),
+                "questions": questions,
+                "duration_sec": ROUND_DURATIONS_SEC.get(self.compiled.round),
+                "sampled": True,
+            }).encode()
+        return self._body
+
+
+async def load_round_sample(interview_id: str, round_num: int, draw: bool = False) -> Optional[RoundSample]:
+    """The interview's stored sample for a round; with draw=True one is drawn (and stored,
+    first writer wins) if none exists. None when there is no sample (or no interview)."""
+    cache_key = (interview_id, round_num)
+    sample = question_sample_cache.get(cache_key)
+    if sample is not None:
+        return sample
+    compiled = COMPILED_ROUNDS[round_num]
+    field = f"question_samples.{round_num}"
+    interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, "id": 1, field: 1})
+    if interview is None:
+        return None
+    stored = (interview.get("question_samples") or {}).get(str(round_num))
+    if stored is None:
+        if not draw:
+            return None
+        seed = secrets.randbits(63)
+        fresh = RoundSample(compiled, seed, compiled.draw(seed))
+        result = await db.interviews.update_one(
+            {"id": interview_id, field: {"$exists": False}},
+            {"$set": {field: {**fresh.to_doc(), "drawn_at": datetime.now(timezone.utc)}}},
+        )
+        if result.modified_count:
+            sample = fresh
+        else:
+            # Another request drew first; serve the stored paper
+            interview = await db.interviews.find_one({"id": interview_id}, {"_id": 0, field: 1})
+            stored = ((interview or {}).get("question_samples") or {}).get(str(round_num))
+            if stored is None:
+                return None
+    if sample is None:
+        sample = RoundSample.from_doc(compiled, stored)
+    question_sample_cache.set(cache_key, sample)
+    return sample
+
 # Enums for ATS
 class PipelineStage(str, Enum):
     NEW = "new"
@@ -1228,9 +1581,165 @@ def generate_verification_code() -> str:
     return ''.join(random.choices(string.digits, k=6))
 
 # --- Simple login audit helper ---
+# --- Write-behind buffer ---
+class WriteBehindBuffer:
+    """In-process write-behind queue for fire-and-forget audit and telemetry writes.
+
+    Callers enqueue a document (insert) or a pymongo write op (e.g. UpdateOne) and return
+    immediately; a background task coalesces them per collection into insert_many /
+    bulk_write batches, flushing when a collection reaches `max_batch` items or every
+    `flush_interval` seconds. At most `max_queued` items are held, counting batches still
+    being written; when full, `policy` decides: "block" waits for the next flush,
+    "drop_oldest"/"drop_new" discard and count. Writes to `never_drop` collections always
+    block instead of being dropped. When the worker is not running (before startup, after
+    shutdown, CLI use) writes go straight through.
+    """
+
+    POLICIES = ("block", "drop_oldest", "drop_new")
+
+    def __init__(self, database=None, max_batch: int = 500, flush_interval: float = 0.25,
+                 max_queued: int = 20000, policy: str = "block", never_drop: tuple = ()):
+        if policy not in self.POLICIES:
+            raise ValueError(f"unknown write-behind policy {policy!r}")
+        self._database = database
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queued = max_queued
+        self.policy = policy
+        self.never_drop = frozenset(never_drop)
+        self._pending: Dict[str, deque] = {}
+        self._queued = 0
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._drained: Optional[asyncio.Event] = None
+        self.counters = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0, "blocked": 0}
+
+    @property
+    def database(self):
+        return self._database if self._database is not None else db
+
+    def start(self) -> None:
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._drained = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Stop the worker and flush everything still queued."""
+        task, self._task = self._task, None
+        if task is not None:
+            self._wakeup.set()
+            await task
+        await self.flush()
+
+    async def insert(self, collection: str, doc: Dict[str, Any]) -> None:
+        await self._enqueue(collection, doc)
+
+    async def write(self, collection: str, op: Any) -> None:
+        await self._enqueue(collection, op)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.counters,
+            "queued": self._queued,
+            "max_queued": self.max_queued,
+            "policy": self.policy,
+            "running": self._task is not None,
+        }
+
+    async def _enqueue(self, collection: str, item: Any) -> None:
+        if self._task is None:
+            await self._write(collection, [item])
+            return
+        if self._queued >= self.max_queued:
+            policy = "block" if collection in self.never_drop else self.policy
+            if policy == "drop_oldest":
+                droppable = [name for name, items in self._pending.items() if items and name not in self.never_drop]
+                if droppable:
+                    self._pending[max(droppable, key=lambda name: len(self._pending[name]))].popleft()
+                    self._queued -= 1
+                    self.counters["dropped"] += 1
+                else:
+                    # Everything older is already being written; the newest item goes instead
+                    policy = "drop_new"
+            if policy == "drop_new":
+                self.counters["dropped"] += 1
+                return
+            if policy == "block":
+                self.counters["blocked"] += 1
+                while self._queued >= self.max_queued and self._task is not None:
+                    self._drained.clear()
+                    self._wakeup.set()
+                    await self._drained.wait()
+                if self._task is None:
+                    await self._write(collection, [item])
+                    return
+        self._pending.setdefault(collection, deque()).append(item)
+        self._queued += 1
+        self.counters["enqueued"] += 1
+        if len(self._pending[collection]) >= self.max_batch:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while self._task is not None:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        batches = []
+        for name, items in pending.items():
+            items = list(items)
+            batches += [(name, items[i:i + self.max_batch]) for i in range(0, len(items), self.max_batch)]
+        if batches:
+            await asyncio.gather(*(self._write_queued(name, items) for name, items in batches))
+        if self._drained is not None:
+            self._drained.set()
+
+    async def _write_queued(self, collection: str, items: List[Any]) -> None:
+        # Items count against max_queued until their write has finished
+        try:
+            await self._write(collection, items)
+        finally:
+            self._queued -= len(items)
+
+    async def _write(self, collection: str, items: List[Any]) -> None:
+        coll = self.database[collection]
+        docs = [item for item in items if isinstance(item, dict)]
+        ops = [item for item in items if not isinstance(item, dict)]
+        try:
+            if docs:
+                await coll.insert_many(docs, ordered=False)
+            if ops:
+                await coll.bulk_write(ops, ordered=False)
+            self.counters["written"] += len(items)
+            self.counters["batches"] += 1
+        except Exception as e:
+            self.counters["failed"] += len(items)
+            logging.warning(f"write-behind flush to {collection} failed ({len(items)} items): {e}")
+
+
+write_buffer = WriteBehindBuffer(
+    max_batch=int(os.getenv("WRITE_BEHIND_BATCH", "500")),
+    flush_interval=int(os.getenv("WRITE_BEHIND_FLUSH_MS", "250")) / 1000.0,
+    max_queued=int(os.getenv("WRITE_BEHIND_MAX_QUEUED", "20000")),
+    policy=os.getenv("WRITE_BEHIND_POLICY", "block"),
+    never_drop=("security_violations",),
+)
+
+
+@app.on_event("startup")
+async def start_write_buffer():
+    write_buffer.start()
+
+
 async def log_login_event(role: str, user_id: str, method: str, email: str = None, success: bool = True):
     try:
-        await db.login_events.insert_one({
+        await write_buffer.insert("login_events", {
             "user_id": user_id,
             "role": role,
             "email": email,
@@ -1242,6 +1751,281 @@ async def log_login_event(role: str, user_id: str, method: str, email: str = Non
         # Best-effort; do not block auth flows on logging errors
         pass
 
+# --- Batched enrichment loader ---
+class EnrichmentLoader:
+    """Per-request DataLoader-style batcher for enrichment lookups.
+
+    List endpoints collect the ids they need and call load_many() once per collection
+    instead of find_one() per row. Ids are deduplicated, results are cached for the
+    lifetime of the loader (one request) and `_id` is stripped by projection.
+    """
+
+    def __init__(self, database):
+        self._db = database
+        self._cache: Dict[tuple, Dict[Any, Optional[dict]]] = {}
+
+    async def load_many(self, collection: str, ids, key: str = "id") -> Dict[Any, dict]:
+        """Return {key_value: doc} for the given ids with one $in query for the uncached ones."""
+        wanted = {i for i in ids if i is not None}
+        cache = self._cache.setdefault((collection, key), {})
+        missing = [i for i in wanted if i not in cache]
+        if missing:
+            docs = await self._db[collection].find({key: {"$in": missing}}, {"_id": 0}).to_list(None)
+            for i in missing:
+                cache[i] = None
+            for doc in docs:
+                # Keep the first match, like find_one would
+                if cache.get(doc.get(key)) is None:
+                    cache[doc.get(key)] = doc
+        return {i: cache[i] for i in wanted if cache.get(i) is not None}
+
+    async def load_grouped(self, collection: str, ids, key: str, sort: Optional[List[tuple]] = None) -> Dict[Any, List[dict]]:
+        """Return {key_value: [docs]} for one-to-many lookups (e.g. interviews per application)."""
+        wanted = list({i for i in ids if i is not None})
+        if not wanted:
+            return {}
+        cursor = self._db[collection].find({key: {"$in": wanted}}, {"_id": 0})
+        if sort:
+            cursor = cursor.sort(sort)
+        grouped: Dict[Any, List[dict]] = {}
+        for doc in await cursor.to_list(None):
+            grouped.setdefault(doc.get(key), []).append(doc)
+        return grouped
+
+
+def get_enrichment_loader() -> EnrichmentLoader:
+    # FastAPI dependency: a fresh loader (and cache) per request
+    return EnrichmentLoader(db)
+
+# ----------------------
+# Keyset pagination
+# ----------------------
+# List endpoints page with opaque cursors instead of a hard to_list(1000). A cursor is the
+# sort-key values of the last row returned (base64 of extended JSON, so datetimes and
+# ObjectIds survive), and the next page is everything strictly beyond it in sort order.
+# Every sort must end in a unique field (_id or id) so the order is total. Array
+# responses carry the cursor in the X-Next-Cursor header; object responses also include
+# it as next_cursor. Pages are small by default: clients that want everything follow the
+# cursor (the frontend's getAllPages does).
+PAGE_LIMIT_DEFAULT = 100
+PAGE_LIMIT_MAX = 1000
+
+
+def encode_cursor(values: List[Any]) -> str:
+    return base64.urlsafe_b64encode(json_util.dumps(values).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json_util.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception:
+        values = None
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="invalid cursor")
+    return values
+
+
+def _keyset_beyond(field: str, direction: int, value: Any) -> Optional[Dict[str, Any]]:
+    """Condition for rows strictly after `value` on one sort key; None/missing sorts lowest."""
+    if value is None:
+        return {field: {"$ne": None}} if direction == 1 else None
+    if direction == 1:
+        return {field: {"$gt": value}}
+    return {"$or": [{field: {"$lt": value}}, {field: None}]}
+
+
+def keyset_query(query: Dict[str, Any], sort: List[tuple], after: Optional[str]) -> Optional[Dict[str, Any]]:
+    """`query` narrowed to rows after the cursor; None when nothing can follow it."""
+    if not after:
+        return query
+    values = decode_cursor(after, len(sort))
+    branches = []
+    for i, (field, direction) in enumerate(sort):
+        beyond = _keyset_beyond(field, direction, values[i])
+        if beyond is None:
+            continue
+        ties = [{f: values[j]} for j, (f, _) in enumerate(sort[:i])]
+        branches.append({"$and": ties + [beyond]} if ties else beyond)
+    if not branches:
+        return None
+    return {"$and": [query, {"$or": branches}]} if query else {"$or": branches}
+
+
+def clamp_limit(limit: Optional[int], default: int = PAGE_LIMIT_DEFAULT, maximum: int = PAGE_LIMIT_MAX) -> int:
+    return max(1, min(maximum, int(limit or default)))
+
+
+async def paginate_find(collection, query: Dict[str, Any], sort: List[tuple], limit: int,
+                        after: Optional[str] = None, projection: Optional[Dict[str, Any]] = None) -> tuple:
+    """One page of `collection.find(query)` in `sort` order; returns (docs, next_cursor).
+
+    `_id` may be used as a sort key even when `projection` hides it; it is fetched for the
+    cursor and stripped again.
+    """
+    strip_id = bool(projection) and projection.get("_id") == 0 and any(f == "_id" for f, _ in sort)
+    if strip_id:
+        projection = {k: v for k, v in projection.items() if k != "_id"} or None
+    query = keyset_query(query, sort, after)
+    if query is None:
+        return [], None
+    docs = await collection.find(query, projection).sort(sort).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(docs) > limit:
+        docs = docs[:limit]
+        next_cursor = encode_cursor([_sort_value(docs[-1], f) for f, _ in sort])
+    if strip_id:
+        for doc in docs:
+            doc.pop("_id", None)
+    return docs, next_cursor
+
+
+def _sort_value(doc: Dict[str, Any], field: str) -> Any:
+    value: Any = doc
+    for part in field.split("."):
+        value = value.get(part) if isinstance(value, dict) else None
+    return value
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+# ----------------------
+# Streaming upload helpers
+# ----------------------
+# Uploads are copied in fixed-size chunks on worker threads (no whole-file reads on the
+# event loop); size limits, byte counts and sha256 are computed during the copy.
+UPLOAD_CHUNK_BYTES = 1024 * 1024
+MAX_RECORDING_BYTES = int(os.getenv("MAX_RECORDING_MB", "2048")) * 1024 * 1024
+MAX_RESUME_BYTES = int(os.getenv("MAX_RESUME_MB", "10")) * 1024 * 1024
+
+
+class UploadTooLarge(Exception):
+    pass
+
+
+class HashingReader:
+    """File-like wrapper that hashes and counts bytes as they are read.
+    Raises UploadTooLarge once more than `max_bytes` have been read.
+    """
+
+    def __init__(self, raw, max_bytes: int):
+        self._raw = raw
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._digest = hashlib.sha256()
+
+    def read(self, n: int = -1) -> bytes:
+        chunk = self._raw.read(n if n and n > 0 else UPLOAD_CHUNK_BYTES)
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise UploadTooLarge(self.size)
+        self._digest.update(chunk)
+        return chunk
+
+    @property
+    def sha256(self) -> str:
+        return self._digest.hexdigest()
+
+
+def _too_large(max_bytes: int) -> HTTPException:
+    return HTTPException(status_code=413, detail=f"File exceeds {max_bytes // (1024 * 1024)} MB limit")
+
+
+# ----------------------
+# Recording playback (HTTP Range / ETag)
+# ----------------------
+RECORDING_MEDIA_TYPES = {
+    ".webm": "video/webm",
+    ".mp4": "video/mp4",
+    ".m4v": "video/mp4",
+    ".mkv": "video/x-matroska",
+    ".ogg": "audio/ogg",
+    ".m4a": "audio/mp4",
+    ".wav": "audio/wav",
+}
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def recording_media_type(path: Path) -> str:
+    return RECORDING_MEDIA_TYPES.get(path.suffix.lower(), "application/octet-stream")
+
+
+class RangeFileResponse(Response):
+    """Sends bytes [start, end] of a file. Uses the ASGI zero-copy send extension when the
+    server offers it, otherwise reads the file in chunks on the threadpool."""
+
+    def __init__(self, path: Path, start: int, end: int, status_code: int, headers: Dict[str, str], media_type: str):
+        super().__init__(status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.end = end
+        self.headers["content-length"] = str(max(0, end - start + 1))
+
+    async def __call__(self, scope, receive, send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        count = max(0, self.end - self.start + 1)
+        if scope.get("method") == "HEAD" or count == 0:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+            return
+        fh = await run_in_threadpool(open, self.path, "rb")
+        try:
+            if "http.response.zerocopysend" in (scope.get("extensions") or {}):
+                await send({"type": "http.response.zerocopysend", "file": fh, "offset": self.start, "count": count})
+                return
+            await run_in_threadpool(fh.seek, self.start)
+            remaining = count
+            while remaining > 0:
+                chunk = await run_in_threadpool(fh.read, min(UPLOAD_CHUNK_BYTES, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                await send({"type": "http.response.body", "body": b"", "more_body": False})
+        finally:
+            await run_in_threadpool(fh.close)
+
+
+def serve_file_with_range(request: Request, path: Path, filename: Optional[str] = None) -> Response:
+    """Serve a local file honouring Range / If-Range / If-None-Match (single byte ranges)."""
+    stat = path.stat()
+    size = stat.st_size
+    etag = f'"{stat.st_mtime_ns:x}-{size:x}"'
+    headers = {
+        "accept-ranges": "bytes",
+        "etag": etag,
+        "last-modified": datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+        "cache-control": "private, max-age=3600",
+    }
+    if filename:
+        headers["content-disposition"] = f'inline; filename="{filename}"'
+    media_type = recording_media_type(Path(filename) if filename else path)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (if_none_match.strip() == "*" or etag in [t.strip() for t in if_none_match.split(",")]):
+        return Response(status_code=304, headers=headers)
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if range_header and (not if_range or if_range.strip() == etag):
+        match = _RANGE_RE.match(range_header.strip())
+        start = end = None
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                end = min(int(match.group(2)), size - 1) if match.group(2) else size - 1
+            else:
+                start = max(0, size - int(match.group(2)))  # suffix range: last N bytes
+                end = size - 1
+        if start is None or start > end or start >= size:
+            return Response(status_code=416, headers={**headers, "content-range": f"bytes */{size}"})
+        headers["content-range"] = f"bytes {start}-{end}/{size}"
+        return RangeFileResponse(path, start, end, 206, headers, media_type)
+
+    return RangeFileResponse(path, 0, size - 1, 200, headers, media_type)
+
+
 # ----------------------
 # S3 Helper Functions
 # ----------------------
@@ -1254,6 +2038,14 @@ def s3_upload_bytes(session_id: str, filename: str, content: bytes, content_type
     extra = {"ContentType": content_type} if content_type else {}
     S3_CLIENT.put_object(Bucket=AWS_S3_BUCKET, Key=_s3_key(session_id, filename), Body=content, **extra)
 
+def s3_upload_fileobj(session_id: str, filename: str, fileobj, content_type: str | None = None) -> None:
+    # Managed transfer: boto3 reads fileobj in parts (multipart above its threshold)
+    if not S3_CLIENT or not AWS_S3_BUCKET:
+        raise HTTPException(status_code=500, detail="S3 not configured")
+    extra = {"ContentType": content_type} if content_type else None
+    S3_CLIENT.upload_fileobj(fileobj, AWS_S3_BUCKET, _s3_key(session_id, filename), ExtraArgs=extra,
+                             Config=S3_TRANSFER_CONFIG)
+
 def s3_list_session(session_id: str) -> list[dict]:
     if not S3_CLIENT or not AWS_S3_BUCKET:
         raise HTTPException(status_code=500, detail="S3 not configured")
@@ -1282,6 +2074,391 @@ def s3_presign_get(session_id: str, filename: str, expires_in: int = 3600) -> st
         ExpiresIn=expires_in
     )
 
+class S3Executor:
+    """Runs blocking boto3 calls off the event loop on a bounded thread pool.
+
+    At most `max_concurrency` calls are in flight; further callers wait on a semaphore
+    (counted as `waiting`). Per-operation latency and error counts are kept for /metrics.
+    """
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self._pool = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="s3")
+        self._limit: Optional[asyncio.Semaphore] = None
+        self.in_flight = 0
+        self.waiting = 0
+        self._ops: Dict[str, Dict[str, float]] = {}
+
+    async def run(self, op: str, fn, *args, **kwargs):
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+        self.waiting += 1
+        try:
+            await self._limit.acquire()
+        finally:
+            self.waiting -= 1
+        self.in_flight += 1
+        stats = self._ops.setdefault(op, {"calls": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            self.in_flight -= 1
+            self._limit.release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "ops": {
+                op: {
+                    "calls": int(v["calls"]),
+                    "errors": int(v["errors"]),
+                    "avg_ms": round(v["total_ms"] / v["calls"], 2) if v["calls"] else 0.0,
+                    "max_ms": round(v["max_ms"], 2),
+                }
+                for op, v in self._ops.items()
+            },
+        }
+
+    def close(self) -> None:
+        self._pool.shutdown(wait=False)
+
+
+s3_io = S3Executor(S3_MAX_CONCURRENCY)
+
+
+class TTLCache:
+    """Small in-process cache: entries expire after `ttl` seconds, LRU-evicted past `maxsize`."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Any) -> Any:
+        entry = self._data.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Any, value: Any, ttl: Optional[float] = None) -> None:
+        self._data[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        self._data.pop(key, None)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# Presigned GET URLs are reused until PRESIGN_CACHE_MARGIN seconds before they expire, so a
+# URL handed out from the cache is always valid for at least that long.
+PRESIGN_EXPIRES_SECONDS = 3600
+PRESIGN_CACHE_MARGIN = 600
+S3_LISTING_CACHE_SECONDS = int(os.getenv("S3_LISTING_CACHE_SECONDS", "30"))
+presign_cache = TTLCache(maxsize=10000, ttl=PRESIGN_EXPIRES_SECONDS - PRESIGN_CACHE_MARGIN)
+s3_listing_cache = TTLCache(maxsize=2000, ttl=S3_LISTING_CACHE_SECONDS)
+# session_id -> listing version, bumped on every upload. Kept well past the longest S3 list
+# call (retries included) so a listing fetched before an upload can never be cached after it.
+s3_listing_versions = TTLCache(maxsize=20000, ttl=600)
+_listing_version_counter = itertools.count(1)
+# (interview_id, round) -> RoundSample; samples never change once drawn
+question_sample_cache = TTLCache(maxsize=int(os.getenv("QUESTION_SAMPLE_CACHE_SIZE", "20000")), ttl=6 * 3600)
+
+
+def _s3_credentials_expiry() -> Optional[datetime]:
+    """Expiry of the S3 client's temporary (STS/role) credentials; None for static keys."""
+    credentials = getattr(getattr(S3_CLIENT, "_request_signer", None), "_credentials", None)
+    return getattr(credentials, "_expiry_time", None)
+
+
+async def cached_presign_get(session_id: str, filename: str) -> str:
+    url = presign_cache.get((session_id, filename))
+    if url is None:
+        # Presigning is local HMAC signing, no network call: run inline, not on the S3 pool
+        url = s3_presign_get(session_id, filename, expires_in=PRESIGN_EXPIRES_SECONDS)
+        # A URL signed with temporary credentials stops working when they expire
+        ttl = presign_cache.ttl
+        expiry = _s3_credentials_expiry()
+        if expiry is not None:
+            ttl = min(ttl, (expiry - datetime.now(timezone.utc)).total_seconds() - PRESIGN_CACHE_MARGIN)
+        if ttl > 0:
+            presign_cache.set((session_id, filename), url, ttl=ttl)
+    return url
+
+
+def invalidate_session_listing(session_id: str) -> None:
+    """Call after an upload: drops the cached listing and stops in-flight fetches re-caching it."""
+    s3_listing_versions.set(session_id, next(_listing_version_counter))
+    s3_listing_cache.pop(session_id)
+
+
+async def cached_list_session(session_id: str) -> list[dict]:
+    items = s3_listing_cache.get(session_id)
+    if items is None:
+        version = s3_listing_versions.get(session_id)
+        items = await s3_io.run("list", s3_list_session, session_id)
+        if s3_listing_versions.get(session_id) == version:
+            s3_listing_cache.set(session_id, items)
+    return items
+
+
+# ----------------------
+# Storage backends
+# ----------------------
+# One interface for recording/resume blobs. put() streams a sync file-like object (read on
+# a worker thread, hashed and size-checked as it goes) and returns
+# {"storage", "key", "size_bytes", "sha256", "deduplicated"}. The logical name a file is
+# served under lives in the recording_files collection, mapping (namespace, owner,
+# filename) to a backend key.
+class StorageBackend(ABC):
+    name = "base"
+
+    @abstractmethod
+    async def put(self, fileobj, name: str, max_bytes: int, content_type: Optional[str] = None) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def iter_chunks(self, key: str, chunk_size: int = UPLOAD_CHUNK_BYTES) -> AsyncIterator[bytes]:
+        """Async generator over the object's bytes."""
+
+    @abstractmethod
+    async def exists(self, key: str) -> bool:
+        ...
+
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path for zero-copy/range serving, when the backend has one."""
+        return None
+
+
+class LocalContentStore(StorageBackend):
+    """Content-addressed local store: objects live at <root>/<aa>/<bb>/<sha256>, so an
+    identical upload is stored once whatever name it arrives under."""
+
+    name = "local"
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def local_path(self, key: str) -> Optional[Path]:
+        if not re.fullmatch(r"[0-9a-f]{64}", key or ""):
+            return None
+        return self.root / key[:2] / key[2:4] / key
+
+    async def put(self, fileobj, name: str, max_bytes: int, content_type: Optional[str] = None) -> Dict[str, Any]:
+        def write() -> Dict[str, Any]:
+            reader = HashingReader(fileobj, max_bytes)
+            tmp_dir = self.root / "tmp"
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            tmp = tmp_dir / uuid.uuid4().hex
+            try:
+                with open(tmp, "wb") as out:
+                    shutil.copyfileobj(reader, out, UPLOAD_CHUNK_BYTES)
+                final = self.local_path(reader.sha256)
+                deduplicated = final.exists()
+                if deduplicated:
+                    tmp.unlink()
+                else:
+                    final.parent.mkdir(parents=True, exist_ok=True)
+                    os.replace(tmp, final)
+            finally:
+                tmp.unlink(missing_ok=True)
+            return {"storage": self.name, "key": reader.sha256, "size_bytes": reader.size,
+                    "sha256": reader.sha256, "deduplicated": deduplicated}
+
+        return await run_in_threadpool(write)
+
+    async def iter_chunks(self, key: str, chunk_size: int = UPLOAD_CHUNK_BYTES):
+        path = self.local_path(key)
+        fh = await run_in_threadpool(open, path, "rb")
+        try:
+            while True:
+                chunk = await run_in_threadpool(fh.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            await run_in_threadpool(fh.close)
+
+    async def exists(self, key: str) -> bool:
+        path = self.local_path(key)
+        return bool(path) and await run_in_threadpool(path.is_file)
+
+
+class S3Storage(StorageBackend):
+    """S3 objects keyed by their logical name (<owner>/<filename>, see _s3_key), so existing
+    prefix listings and presigned URLs keep working. Calls run on the S3 executor."""
+
+    name = "s3"
+
+    def __init__(self, client, bucket: str):
+        self.client = client
+        self.bucket = bucket
+
+    async def put(self, fileobj, name: str, max_bytes: int, content_type: Optional[str] = None) -> Dict[str, Any]:
+        reader = HashingReader(fileobj, max_bytes)
+        extra = {"ContentType": content_type} if content_type else None
+        try:
+            await s3_io.run("upload", self.client.upload_fileobj, reader, self.bucket, name, ExtraArgs=extra,
+                            Config=S3_TRANSFER_CONFIG)
+        except Exception as e:
+            if isinstance(e, UploadTooLarge) or isinstance(e.__cause__ or e.__context__, UploadTooLarge):
+                raise UploadTooLarge(reader.size)
+            raise
+        return {"storage": self.name, "key": name, "size_bytes": reader.size,
+                "sha256": reader.sha256, "deduplicated": False}
+
+    async def iter_chunks(self, key: str, chunk_size: int = UPLOAD_CHUNK_BYTES):
+        obj = await s3_io.run("get", self.client.get_object, Bucket=self.bucket, Key=key)
+        body = obj["Body"]
+        try:
+            while True:
+                chunk = await s3_io.run("read", body.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            body.close()
+
+    async def exists(self, key: str) -> bool:
+        try:
+            await s3_io.run("head", self.client.head_object, Bucket=self.bucket, Key=key)
+            return True
+        except Exception:
+            return False
+
+
+class MemoryStorage(StorageBackend):
+    """In-process, content-addressed store for tests and benchmarks."""
+
+    name = "memory"
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+
+    async def put(self, fileobj, name: str, max_bytes: int, content_type: Optional[str] = None) -> Dict[str, Any]:
+        def read() -> tuple:
+            reader = HashingReader(fileobj, max_bytes)
+            buf = io.BytesIO()
+            shutil.copyfileobj(reader, buf, UPLOAD_CHUNK_BYTES)
+            return reader, buf.getvalue()
+
+        reader, data = await run_in_threadpool(read)
+        deduplicated = reader.sha256 in self.objects
+        self.objects.setdefault(reader.sha256, data)
+        return {"storage": self.name, "key": reader.sha256, "size_bytes": reader.size,
+                "sha256": reader.sha256, "deduplicated": deduplicated}
+
+    async def iter_chunks(self, key: str, chunk_size: int = UPLOAD_CHUNK_BYTES):
+        data = self.objects[key]
+        for i in range(0, len(data), chunk_size):
+            yield data[i:i + chunk_size]
+
+    async def exists(self, key: str) -> bool:
+        return key in self.objects
+
+
+STORAGE_DIR = Path(os.getenv("STORAGE_DIR") or str(ROOT_DIR / "storage"))
+file_store = LocalContentStore(STORAGE_DIR)
+STORAGE_BACKENDS: Dict[str, StorageBackend] = {"local": file_store}
+if VIDEO_STORAGE == "s3" and S3_CLIENT and AWS_S3_BUCKET:
+    STORAGE_BACKENDS["s3"] = S3Storage(S3_CLIENT, AWS_S3_BUCKET)
+# Proctoring recordings (/recordings/*) follow VIDEO_STORAGE. Secure-interview uploads
+# and resumes have always been kept on local disk, whatever VIDEO_STORAGE says.
+recording_storage: StorageBackend = STORAGE_BACKENDS.get("s3", file_store)
+interview_recording_storage: StorageBackend = file_store
+resume_storage: StorageBackend = file_store
+
+
+async def store_upload(backend: StorageBackend, namespace: str, owner: str, filename: str,
+                       fileobj, max_bytes: int, content_type: Optional[str] = None) -> Dict[str, Any]:
+    """Stream a file into `backend` and record it in recording_files. 413 past `max_bytes`."""
+    try:
+        stored = await backend.put(fileobj, _s3_key(owner, filename), max_bytes, content_type)
+    except UploadTooLarge:
+        raise _too_large(max_bytes)
+    await register_stored_file(namespace, owner, filename, stored, content_type)
+    return stored
+
+
+async def register_stored_file(namespace: str, owner: str, filename: str, stored: Dict[str, Any],
+                               content_type: Optional[str] = None) -> None:
+    await db.recording_files.update_one(
+        {"namespace": namespace, "owner": owner, "filename": filename},
+        {"$set": {
+            "storage": stored["storage"],
+            "key": stored["key"],
+            "size_bytes": stored["size_bytes"],
+            "sha256": stored.get("sha256"),
+            "content_type": content_type,
+            "created_at": datetime.now(timezone.utc),
+        }},
+        upsert=True,
+    )
+
+
+async def stored_file_response(request: Request, stored: Dict[str, Any]) -> Response:
+    """Serve a recording_files entry: range-capable local file, S3 redirect, or a stream."""
+    filename = stored.get("filename")
+    backend = STORAGE_BACKENDS.get(stored.get("storage"))
+    if backend is None:
+        raise HTTPException(status_code=404, detail="Storage backend unavailable")
+    path = backend.local_path(stored["key"])
+    if path is not None:
+        if not path.is_file():
+            raise HTTPException(status_code=404, detail="File missing on server")
+        return serve_file_with_range(request, path, filename=filename)
+    if backend.name == "s3":
+        return RedirectResponse(url=await cached_presign_get(stored["owner"], filename), status_code=307)
+    return StreamingResponse(
+        backend.iter_chunks(stored["key"]),
+        media_type=stored.get("content_type") or recording_media_type(Path(filename or "")),
+    )
+
+
+async def bench_storage_cli(files: int = 16, size_mb: int = 8) -> int:
+    """Write/dedupe/read throughput of the local and in-memory backends (python server.py --bench-storage)."""
+    import tempfile
+    payloads = [os.urandom(size_mb * 1024 * 1024) for _ in range(files)]
+    total_mb = files * size_mb
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in (LocalContentStore(Path(tmp)), MemoryStorage()):
+            started = time.perf_counter()
+            keys = [(await backend.put(io.BytesIO(p), f"bench/{i}", len(p)))["key"] for i, p in enumerate(payloads)]
+            write_s = time.perf_counter() - started
+            started = time.perf_counter()
+            dupes = sum([(await backend.put(io.BytesIO(p), f"bench/dup{i}", len(p)))["deduplicated"] for i, p in enumerate(payloads)])
+            dedupe_s = time.perf_counter() - started
+            started = time.perf_counter()
+            read_bytes = 0
+            for key in keys:
+                async for chunk in backend.iter_chunks(key):
+                    read_bytes += len(chunk)
+            read_s = time.perf_counter() - started
+            print(f"{backend.name:7s} write {total_mb / write_s:8.1f} MB/s  "
+                  f"dedupe {total_mb / dedupe_s:8.1f} MB/s ({dupes}/{files})  "
+                  f"read {read_bytes / (1024 * 1024) / read_s:8.1f} MB/s")
+    return 0
+
 # ----------------------
 # Proctoring API
 # ----------------------
@@ -1382,14 +2559,16 @@ async def ai_scheduler_propose(req: ScheduleProposeRequest, credentials: HTTPAut
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
     now = datetime.now(timezone.utc)
+    # Conflict checks need every open interview, so fetch just the timing fields without a cap
+    slot_fields = {"_id": 0, "scheduled_date": 1, "duration_minutes": 1}
     company_interviews = await db.interviews.find({
         "company_id": recruiter_doc["company_id"],
         "status": {"$in": ["scheduled", "in_progress"]}
-    }).to_list(1000)
+    }, slot_fields).to_list(None)
     candidate_interviews = await db.interviews.find({
         "candidate_id": req.candidate_id,
         "status": {"$in": ["scheduled", "in_progress"]}
-    }).to_list(1000)
+    }, slot_fields).to_list(None)
 
     conflicts = []
     for it in company_interviews + candidate_interviews:
@@ -1449,7 +2628,7 @@ async def ai_scheduler_book(req: ScheduleBookRequest, credentials: HTTPAuthoriza
     existing = await db.interviews.find({
         "company_id": recruiter_doc["company_id"],
         "status": {"$in": ["scheduled", "in_progress"]}
-    }).to_list(1000)
+    }, {"_id": 0, "scheduled_date": 1, "duration_minutes": 1}).to_list(None)
     for it in existing:
         it_st = it.get("scheduled_date")
         dur = int(it.get("duration_minutes") or 60)
@@ -1482,10 +2661,10 @@ async def list_recordings(session_id: str):
     # Lists files from S3 or local recordings dir
     if VIDEO_STORAGE == "s3":
         try:
-            items = s3_list_session(session_id)
+            items = await cached_list_session(session_id)
+            presigned_urls = await asyncio.gather(*(cached_presign_get(session_id, it["filename"]) for it in items))
             files = []
-            for it in items:
-                presigned = s3_presign_get(session_id, it["filename"], expires_in=3600)
+            for it, presigned in zip(items, presigned_urls):
                 files.append({
                     "filename": it["filename"],
                     "path": f"/api/recordings/{session_id}/{it['filename']}",
@@ -1497,34 +2676,55 @@ async def list_recordings(session_id: str):
         except Exception as e:
             raise HTTPException(status_code=500, detail=f"S3 list error: {e}")
     else:
+        stored = await db.recording_files.find(
+            {"namespace": "recordings", "owner": session_id}, {"_id": 0, "filename": 1}
+        ).to_list(1000)
+        names = [d["filename"] for d in stored]
+        # Files written before the storage backend existed sit directly in the session dir
         session_dir = Path(RECORDINGS_DIR) / session_id
-        files = []
         if session_dir.exists():
-            for f in session_dir.iterdir():
-                if f.is_file() and f.suffix.lower() in {".webm", ".mp4", ".mkv"}:
-                    files.append({"filename": f.name, "path": f"/api/recordings/{session_id}/{f.name}"})
+            names += [f.name for f in session_dir.iterdir() if f.is_file() and f.name not in names]
+        files = [
+            {"filename": name, "path": f"/api/recordings/{session_id}/{name}"}
+            for name in names if Path(name).suffix.lower() in {".webm", ".mp4", ".mkv"}
+        ]
         return {"files": files}
 
 
 @api_router.get("/recordings/{session_id}/{filename}")
-async def download_recording(session_id: str, filename: str):
+async def download_recording(session_id: str, filename: str, request: Request):
     if VIDEO_STORAGE == "s3":
         try:
-            presigned = s3_presign_get(session_id, filename, expires_in=3600)
+            presigned = await cached_presign_get(session_id, filename)
             return RedirectResponse(url=presigned, status_code=307)
         except Exception as e:
             raise HTTPException(status_code=404, detail=f"S3 file not found or error: {e}")
     else:
-        target = Path(RECORDINGS_DIR) / session_id / filename
-        if not target.exists():
-            raise HTTPException(status_code=404, detail="File not found")
-        return FileResponse(str(target))
+        stored = await db.recording_files.find_one(
+            {"namespace": "recordings", "owner": session_id, "filename": filename}, {"_id": 0}
+        )
+        if stored:
+            return await stored_file_response(request, stored)
+        # Legacy layout: proctoring uploads under RECORDINGS_DIR, interview uploads under ROOT_DIR/recordings
+        for root in (Path(RECORDINGS_DIR), ROOT_DIR / "recordings"):
+            target = root / session_id / filename
+            if target.is_file():
+                return serve_file_with_range(request, target)
+        raise HTTPException(status_code=404, detail="File not found")
+
+
+def _recording_filename(source: str, original: Optional[str]) -> str:
+    ts = int(datetime.now(timezone.utc).timestamp())
+    suffix = Path(original or '').suffix or '.webm'
+    safe_suffix = suffix if len(suffix) <= 6 else '.webm'
+    # The random part keeps two uploads from the same source in one second apart
+    return f"{source}_{ts}_{uuid.uuid4().hex[:8]}{safe_suffix}"
 
 
 @api_router.post("/recordings/upload")
 async def upload_recording(sessionId: str, source: str, file: UploadFile = File(...)):
     """
-    Save uploaded recording file to RECORDINGS_DIR/<sessionId>/
+    Save uploaded recording file under <sessionId>/ in the recording storage backend
     source: 'laptop' | 'phone'
     """
     if not sessionId:
@@ -1532,80 +2732,331 @@ async def upload_recording(sessionId: str, source: str, file: UploadFile = File(
     if source not in {"laptop", "phone"}:
         raise HTTPException(status_code=400, detail="invalid source")
 
-    ts = int(datetime.now(timezone.utc).timestamp())
-    suffix = Path(file.filename or '').suffix or '.webm'
-    safe_suffix = suffix if len(suffix) <= 6 else '.webm'
-    filename = f"{source}_{ts}{safe_suffix}"
-    content = await file.read()
+    filename = _recording_filename(source, file.filename)
+    content_type = getattr(file, 'content_type', None)
 
-    if VIDEO_STORAGE == "s3":
-        try:
-            s3_upload_bytes(sessionId, filename, content, getattr(file, 'content_type', None))
-            presigned = s3_presign_get(sessionId, filename, expires_in=3600)
-            return {
-                "ok": True,
-                "filename": filename,
-                "url": f"/api/recordings/{sessionId}/{filename}",
-                "presignedUrl": presigned,
-                "storage": "s3"
-            }
-        except Exception as e:
-            raise HTTPException(status_code=500, detail=f"S3 upload error: {e}")
-    else:
-        session_dir = Path(RECORDINGS_DIR) / sessionId
-        session_dir.mkdir(parents=True, exist_ok=True)
-        dest = session_dir / filename
-        with open(dest, 'wb') as f:
-            f.write(content)
-        return {
-            "ok": True,
-            "filename": filename,
-            "url": f"/api/recordings/{sessionId}/{filename}",
-            "storage": "local"
-        }
+    try:
+        stored = await store_upload(recording_storage, "recordings", sessionId, filename, file.file,
+                                    MAX_RECORDING_BYTES, content_type)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"{recording_storage.name} upload error: {e}")
+    result = {
+        "ok": True,
+        "filename": filename,
+        "url": f"/api/recordings/{sessionId}/{filename}",
+        "size_bytes": stored["size_bytes"],
+        "sha256": stored["sha256"],
+        "storage": stored["storage"],
+    }
+    if stored["storage"] == "s3":
+        invalidate_session_listing(sessionId)
+        result["presignedUrl"] = await cached_presign_get(sessionId, filename)
+    return result
 
 
-# --- Recording state control (for client MediaRecorder) ---
-class RecordingStateRequest(BaseModel):
+# --- Resumable multipart recording uploads ---
+# init -> PUT part N (any order, retryable) -> complete. Part state lives in the
+# recording_uploads collection. Local storage keeps parts under RECORDINGS_DIR/.uploads/<id>/
+# and streams them into the content store on complete; with VIDEO_STORAGE=s3 each call maps onto the
+# corresponding S3 multipart-upload call, so part bytes never accumulate in memory.
+UPLOAD_PART_MAX_BYTES = int(os.getenv("UPLOAD_PART_MAX_MB", "64")) * 1024 * 1024
+UPLOAD_PART_DEFAULT_BYTES = 8 * 1024 * 1024  # S3 requires >= 5 MiB for all but the last part
+
+
+class RecordingUploadInit(BaseModel):
     sessionId: str
-    recording: bool
+    source: str
+    filename: Optional[str] = None
+    content_type: Optional[str] = None
+    part_size: Optional[int] = None
 
 
-@api_router.post("/recordings/state")
-async def set_recording_state(req: RecordingStateRequest):
-    if not req.sessionId:
-        raise HTTPException(status_code=400, detail="sessionId required")
-    _record_state[req.sessionId] = bool(req.recording)
-    return {"ok": True, "sessionId": req.sessionId, "recording": _record_state[req.sessionId]}
+def _upload_parts_dir(upload_id: str) -> Path:
+    return Path(RECORDINGS_DIR) / ".uploads" / upload_id
 
 
-@api_router.get("/recordings/state")
-async def get_recording_state(sessionId: str):
-    return {"sessionId": sessionId, "recording": bool(_record_state.get(sessionId, False))}
+async def _get_open_upload(upload_id: str) -> Dict[str, Any]:
+    upload = await db.recording_uploads.find_one({"id": upload_id}, {"_id": 0})
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    if upload.get("status") != "open":
+        raise HTTPException(status_code=409, detail=f"Upload is {upload.get('status')}")
+    return upload
 
 
-# --- Optional: LiveKit Egress composite recording stubs ---
-@api_router.post("/egress/start")
-async def egress_start(sessionId: str):
-    if not sessionId:
+def _upload_status(upload: Dict[str, Any]) -> Dict[str, Any]:
+    parts = upload.get("parts") or {}
+    return {
+        "upload_id": upload["id"],
+        "status": upload.get("status"),
+        "filename": upload.get("filename"),
+        "part_size": upload.get("part_size"),
+        "storage": upload.get("storage"),
+        "parts": sorted(
+            ({"part_number": int(n), "size": p.get("size"), "etag": p.get("etag")} for n, p in parts.items()),
+            key=lambda p: p["part_number"],
+        ),
+        "received_bytes": sum(int(p.get("size") or 0) for p in parts.values()),
+    }
+
+
+@api_router.post("/recordings/uploads")
+async def init_recording_upload(req: RecordingUploadInit):
+    if not req.sessionId:
         raise HTTPException(status_code=400, detail="sessionId required")
+    if req.source not in {"laptop", "phone"}:
+        raise HTTPException(status_code=400, detail="invalid source")
+    part_size = max(5 * 1024 * 1024, min(UPLOAD_PART_MAX_BYTES, int(req.part_size or UPLOAD_PART_DEFAULT_BYTES)))
+    filename = _recording_filename(req.source, req.filename)
+    upload = {
+        "id": str(uuid.uuid4()),
+        "session_id": req.sessionId,
+        "source": req.source,
+        "filename": filename,
+        "content_type": req.content_type,
+        "part_size": part_size,
+        "storage": "s3" if VIDEO_STORAGE == "s3" else "local",
+        "parts": {},
+        "status": "open",
+        "created_at": datetime.now(timezone.utc),
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if upload["storage"] == "s3":
+        if not S3_CLIENT or not AWS_S3_BUCKET:
+            raise HTTPException(status_code=500, detail="S3 not configured")
+        extra = {"ContentType": req.content_type} if req.content_type else {}
+        try:
+            created = await s3_io.run(
+                "create_multipart_upload", S3_CLIENT.create_multipart_upload,
+                Bucket=AWS_S3_BUCKET, Key=_s3_key(req.sessionId, filename), **extra
+            )
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"S3 multipart init error: {e}")
+        upload["s3_upload_id"] = created["UploadId"]
+    await db.recording_uploads.insert_one(dict(upload))
+    return _upload_status(upload)
+
+
+@api_router.get("/recordings/uploads/{upload_id}/status")
+async def get_recording_upload(upload_id: str):
+    """Parts received so far, so a client can resume by re-sending only the missing ones."""
+    upload = await db.recording_uploads.find_one({"id": upload_id}, {"_id": 0})
+    if not upload:
+        raise HTTPException(status_code=404, detail="Upload not found")
+    return _upload_status(upload)
+
+
+@api_router.put("/recordings/uploads/{upload_id}/parts/{part_number}")
+async def put_recording_upload_part(upload_id: str, part_number: int, request: Request):
+    """Raw request body is the part. Re-sending a part replaces it."""
+    if not 1 <= part_number <= 10000:
+        raise HTTPException(status_code=400, detail="part_number must be 1..10000")
+    upload = await _get_open_upload(upload_id)
+    received = sum(int(p.get("size") or 0) for n, p in (upload.get("parts") or {}).items() if int(n) != part_number)
+
+    # Spool the body to disk in chunks (bounded memory), hashing as it arrives
+    parts_dir = _upload_parts_dir(upload_id)
+    part_path = parts_dir / f"{part_number:05d}.part"
+    # Unique per request: a retried PUT of the same part may overlap the original
+    tmp_path = part_path.with_name(f"{part_path.name}.{uuid.uuid4().hex}.tmp")
+    await run_in_threadpool(parts_dir.mkdir, parents=True, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    out = await run_in_threadpool(open, tmp_path, "wb")
     try:
-        resp = requests.post(f"{EGRESS_SERVICE_URL}/start", json={"sessionId": sessionId}, timeout=15)
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=resp.status_code, detail=resp.text)
-        return resp.json()
-    except requests.RequestException as e:
-        raise HTTPException(status_code=502, detail=f"egress service error: {e}")
+        buffered = bytearray()
+        async for chunk in request.stream():
+            size += len(chunk)
+            if size > UPLOAD_PART_MAX_BYTES or received + size > MAX_RECORDING_BYTES:
+                raise _too_large(min(UPLOAD_PART_MAX_BYTES, MAX_RECORDING_BYTES))
+            digest.update(chunk)
+            buffered += chunk
+            if len(buffered) >= UPLOAD_CHUNK_BYTES:
+                await run_in_threadpool(out.write, bytes(buffered))
+                buffered.clear()
+        if buffered:
+            await run_in_threadpool(out.write, bytes(buffered))
+    except BaseException:
+        await run_in_threadpool(out.close)
+        tmp_path.unlink(missing_ok=True)
+        raise
+    await run_in_threadpool(out.close)
+    if size == 0:
+        tmp_path.unlink(missing_ok=True)
+        raise HTTPException(status_code=400, detail="empty part")
+
+    part = {"size": size, "sha256": digest.hexdigest(), "etag": digest.hexdigest()}
+    if upload["storage"] == "s3":
+        def send_part():
+            try:
+                with open(tmp_path, "rb") as body:
+                    return S3_CLIENT.upload_part(
+                        Bucket=AWS_S3_BUCKET, Key=_s3_key(upload["session_id"], upload["filename"]),
+                        UploadId=upload["s3_upload_id"], PartNumber=part_number, Body=body, ContentLength=size,
+                    )
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        try:
+            sent = await s3_io.run("upload_part", send_part)
+        except Exception as e:
+            raise HTTPException(status_code=502, detail=f"S3 part upload error: {e}")
+        part["etag"] = sent["ETag"]
+    else:
+        await run_in_threadpool(os.replace, tmp_path, part_path)
 
+    await db.recording_uploads.update_one(
+        {"id": upload_id, "status": "open"},
+        {"$set": {f"parts.{part_number}": part, "updated_at": datetime.now(timezone.utc)}},
+    )
+    return {"upload_id": upload_id, "part_number": part_number, "size": size, "etag": part["etag"]}
 
-@api_router.post("/egress/stop")
-async def egress_stop(egressId: str):
-    if not egressId:
-        raise HTTPException(status_code=400, detail="egressId required")
-    try:
-        resp = requests.post(f"{EGRESS_SERVICE_URL}/stop", json={"egressId": egressId}, timeout=15)
-        if resp.status_code >= 400:
-            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+
+class _PartsReader:
+    """Sequential file-like reader over the stored part files of an upload."""
+
+    def __init__(self, paths: List[Path]):
+        self._paths = list(paths)
+        self._current = None
+
+    def read(self, n: int = -1) -> bytes:
+        while True:
+            if self._current is None:
+                if not self._paths:
+                    return b""
+                self._current = open(self._paths.pop(0), "rb")
+            chunk = self._current.read(n)
+            if chunk:
+                return chunk
+            self._current.close()
+            self._current = None
+
+    def close(self) -> None:
+        if self._current is not None:
+            self._current.close()
+            self._current = None
+
+
+@api_router.post("/recordings/uploads/{upload_id}/complete")
+async def complete_recording_upload(upload_id: str):
+    upload = await _get_open_upload(upload_id)
+    parts = upload.get("parts") or {}
+    numbers = sorted(int(n) for n in parts)
+    if not numbers or numbers != list(range(1, len(numbers) + 1)):
+        raise HTTPException(status_code=400, detail=f"parts must be contiguous from 1; have {numbers}")
+    # Claim the upload so concurrent completes cannot both assemble it
+    claimed = await db.recording_uploads.update_one(
+        {"id": upload_id, "status": "open"}, {"$set": {"status": "completing"}}
+    )
+    if claimed.modified_count == 0:
+        raise HTTPException(status_code=409, detail="Upload is already completing")
+
+    session_id, filename = upload["session_id"], upload["filename"]
+    total = sum(int(parts[str(n)]["size"]) for n in numbers)
+    result: Dict[str, Any] = {
+        "ok": True,
+        "filename": filename,
+        "url": f"/api/recordings/{session_id}/{filename}",
+        "size_bytes": total,
+        "storage": upload["storage"],
+    }
+    try:
+        if upload["storage"] == "s3":
+            await s3_io.run(
+                "complete_multipart_upload", S3_CLIENT.complete_multipart_upload,
+                Bucket=AWS_S3_BUCKET, Key=_s3_key(session_id, filename), UploadId=upload["s3_upload_id"],
+                MultipartUpload={"Parts": [{"PartNumber": n, "ETag": parts[str(n)]["etag"]} for n in numbers]},
+            )
+            await register_stored_file(
+                "recordings", session_id, filename,
+                {"storage": "s3", "key": _s3_key(session_id, filename), "size_bytes": total},
+                upload.get("content_type"),
+            )
+            invalidate_session_listing(session_id)
+            result["presignedUrl"] = await cached_presign_get(session_id, filename)
+        else:
+            parts_dir = _upload_parts_dir(upload_id)
+            reader = _PartsReader([parts_dir / f"{n:05d}.part" for n in numbers])
+            try:
+                stored = await store_upload(file_store, "recordings", session_id, filename, reader,
+                                            MAX_RECORDING_BYTES, upload.get("content_type"))
+            finally:
+                reader.close()
+            await run_in_threadpool(shutil.rmtree, parts_dir, True)
+            result["sha256"] = stored["sha256"]
+    except Exception as e:
+        await db.recording_uploads.update_one({"id": upload_id}, {"$set": {"status": "open"}})
+        raise HTTPException(status_code=500, detail=f"Upload completion error: {e}")
+
+    await db.recording_uploads.update_one(
+        {"id": upload_id},
+        {"$set": {"status": "completed", "size_bytes": total, "sha256": result.get("sha256"),
+                  "completed_at": datetime.now(timezone.utc)}},
+    )
+    return result
+
+
+@api_router.delete("/recordings/uploads/{upload_id}")
+async def abort_recording_upload(upload_id: str):
+    upload = await _get_open_upload(upload_id)
+    if upload["storage"] == "s3":
+        try:
+            await s3_io.run(
+                "abort_multipart_upload", S3_CLIENT.abort_multipart_upload,
+                Bucket=AWS_S3_BUCKET, Key=_s3_key(upload["session_id"], upload["filename"]), UploadId=upload["s3_upload_id"],
+            )
+        except Exception as e:
+            logging.warning(f"S3 multipart abort failed for {upload_id}: {e}")
+    else:
+        await run_in_threadpool(shutil.rmtree, _upload_parts_dir(upload_id), True)
+    await db.recording_uploads.update_one(
+        {"id": upload_id}, {"$set": {"status": "aborted", "updated_at": datetime.now(timezone.utc)}}
+    )
+    return {"ok": True, "upload_id": upload_id, "status": "aborted"}
+
+
+# --- Recording state control (for client MediaRecorder) ---
+class RecordingStateRequest(BaseModel):
+    sessionId: str
+    recording: bool
+
+
+@api_router.post("/recordings/state")
+async def set_recording_state(req: RecordingStateRequest):
+    if not req.sessionId:
+        raise HTTPException(status_code=400, detail="sessionId required")
+    _record_state[req.sessionId] = bool(req.recording)
+    return {"ok": True, "sessionId": req.sessionId, "recording": _record_state[req.sessionId]}
+
+
+@api_router.get("/recordings/state")
+async def get_recording_state(sessionId: str):
+    return {"sessionId": sessionId, "recording": bool(_record_state.get(sessionId, False))}
+
+
+# --- Optional: LiveKit Egress composite recording stubs ---
+@api_router.post("/egress/start")
+async def egress_start(sessionId: str):
+    if not sessionId:
+        raise HTTPException(status_code=400, detail="sessionId required")
+    try:
+        resp = requests.post(f"{EGRESS_SERVICE_URL}/start", json={"sessionId": sessionId}, timeout=15)
+        if resp.status_code >= 400:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text)
+        return resp.json()
+    except requests.RequestException as e:
+        raise HTTPException(status_code=502, detail=f"egress service error: {e}")
+
+
+@api_router.post("/egress/stop")
+async def egress_stop(egressId: str):
+    if not egressId:
+        raise HTTPException(status_code=400, detail="egressId required")
+    try:
+        resp = requests.post(f"{EGRESS_SERVICE_URL}/stop", json={"egressId": egressId}, timeout=15)
+        if resp.status_code >= 400:
+            raise HTTPException(status_code=resp.status_code, detail=resp.text)
         return resp.json()
     except requests.RequestException as e:
         raise HTTPException(status_code=502, detail=f"egress service error: {e}")
@@ -1623,64 +3074,891 @@ def create_jwt_token(user_id: str, email: str, role: str, company_id: str = None
     }
     return jwt.encode(payload, JWT_SECRET, algorithm="HS256")
 
-async def get_current_recruiter(credentials: HTTPAuthorizationCredentials = Depends(security)):
+# Authenticated principals are cached per token (keyed by its SHA-256) so the hot
+# telemetry/heartbeat paths skip both jwt.decode and the user lookup. Entries live at most
+# PRINCIPAL_CACHE_SECONDS and never past the token's exp. Profile writes call
+# invalidate_principal(user_id), which bumps a per-user generation taken from one
+# process-wide counter; other worker processes converge within the TTL. Each cache entry
+# is stamped with the counter as read before its user lookup, and is only served while
+# that stamp is at least its user's generation, so a lookup that raced a bump is never
+# served. A generation only has to outlive the entries it invalidates, so it is dropped
+# PRINCIPAL_CACHE_SECONDS after the bump; the highest dropped generation is kept as a
+# floor that users without a live generation are held to, so an entry stamped before a
+# dropped bump cannot become valid again. Recruiter records have no update path yet;
+# any added later must call invalidate_principal as the candidate profile writes do.
+PRINCIPAL_CACHE_SECONDS = float(os.getenv("PRINCIPAL_CACHE_SECONDS", "30"))
+principal_cache = TTLCache(maxsize=int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000")), ttl=PRINCIPAL_CACHE_SECONDS)
+# user_id -> (generation, expires_at), oldest first
+_principal_generation: "OrderedDict[str, tuple]" = OrderedDict()
+_principal_generation_last = 0
+_principal_generation_floor = 0
+
+
+def _principal_generation_of(user_id: str) -> int:
+    entry = _principal_generation.get(user_id)
+    return entry[0] if entry else _principal_generation_floor
+
+
+def invalidate_principal(user_id: Optional[str]) -> None:
+    global _principal_generation_last, _principal_generation_floor
+    if not user_id:
+        return
+    now = time.monotonic()
+    # Expiry times are appended in order, so expired generations sit at the front
+    while _principal_generation and next(iter(_principal_generation.values()))[1] <= now:
+        _, (generation, _) = _principal_generation.popitem(last=False)
+        _principal_generation_floor = max(_principal_generation_floor, generation)
+    _principal_generation.pop(user_id, None)
+    _principal_generation_last += 1
+    _principal_generation[user_id] = (_principal_generation_last, now + PRINCIPAL_CACHE_SECONDS)
+
+
+async def _resolve_principal(credentials: HTTPAuthorizationCredentials, role: str, collection: str, model):
+    token_key = hashlib.sha256(credentials.credentials.encode()).hexdigest()
+    cached = principal_cache.get(token_key)
+    if cached is not None:
+        user_id, stamp, cached_role, principal = cached
+        if stamp >= _principal_generation_of(user_id):
+            if cached_role != role:
+                raise HTTPException(status_code=403, detail="Access denied")
+            return principal.model_copy(deep=True)
+        principal_cache.pop(token_key)
     try:
         payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=["HS256"])
-        if payload.get("role") != "recruiter":
+        if payload.get("role") != role:
             raise HTTPException(status_code=403, detail="Access denied")
-        recruiter = await db.recruiters.find_one({"id": payload["user_id"]})
-        if recruiter:
-            return Recruiter(**recruiter)
-        raise HTTPException(status_code=401, detail="Invalid token")
+        user_id = payload["user_id"]
+        stamp = _principal_generation_last
+        doc = await db[collection].find_one({"id": user_id})
+        if not doc:
+            raise HTTPException(status_code=401, detail="Invalid token")
+        principal = model(**doc)
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
     except jwt.InvalidTokenError:
         raise HTTPException(status_code=401, detail="Invalid token")
+    ttl = PRINCIPAL_CACHE_SECONDS
+    if payload.get("exp"):
+        ttl = min(ttl, float(payload["exp"]) - time.time())
+    if ttl > 0:
+        principal_cache.set(token_key, (user_id, stamp, role, principal), ttl=ttl)
+    return principal.model_copy(deep=True)
+
+
+async def get_current_recruiter(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    return await _resolve_principal(credentials, "recruiter", "recruiters", Recruiter)
 
 async def get_current_candidate(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    try:
-        payload = jwt.decode(credentials.credentials, JWT_SECRET, algorithms=["HS256"])
-        if payload.get("role") != "candidate":
-            raise HTTPException(status_code=403, detail="Access denied")
-        candidate = await db.candidates.find_one({"id": payload["user_id"]})
-        if candidate:
-            return CandidateUser(**candidate)
-        raise HTTPException(status_code=401, detail="Invalid token")
-    except jwt.ExpiredSignatureError:
-        raise HTTPException(status_code=401, detail="Token expired")
-    except jwt.InvalidTokenError:
-        raise HTTPException(status_code=401, detail="Invalid token")
+    return await _resolve_principal(credentials, "candidate", "candidates", CandidateUser)
+
+
+# Process-local counters for operations dashboards
+@app.get("/metrics")
+async def process_metrics(current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    """Queue, S3, cache and resume-parse internals for this worker process. Admins only."""
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can view process metrics")
+    return {
+        "write_behind": write_buffer.stats(),
+        "s3": s3_io.stats(),
+        "caches": {
+            "presign": presign_cache.stats(),
+            "s3_listing": s3_listing_cache.stats(),
+            "principal": principal_cache.stats(),
+            "question_sample": question_sample_cache.stats(),
+            "item_analysis": item_analysis_cache.stats(),
+        },
+        "resume_parsing": {**resume_parse_stats, "workers": RESUME_PARSE_WORKERS},
+        "match_index": match_index.stats(),
+    }
+
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text content from PDF resume"""
     try:
-        pdf_reader = PyPDF2.PdfReader(io.BytesIO(file_content))
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+        return "\n".join(iter_pdf_pages(io.BytesIO(file_content)))
     except Exception as e:
         logging.error(f"PDF parsing error: {e}")
         return ""
 
+def iter_pdf_pages(stream):
+    """Yield the text of each page; a page that fails to extract yields an empty string."""
+    pdf_reader = PyPDF2.PdfReader(stream)
+    for page in pdf_reader.pages:
+        try:
+            yield page.extract_text() or ""
+        except Exception as e:
+            logging.warning(f"PDF page extraction failed: {e}")
+            yield ""
+
+# ----------------------
+# Skill taxonomy and matcher
+# ----------------------
+# Skills are matched against resume text with an Aho-Corasick automaton built from the
+# skill_taxonomy collection ({name, aliases, category}); DEFAULT_SKILL_TAXONOMY is used
+# until the collection has entries. A scan is linear in the text length whatever the
+# taxonomy size. Matches must sit on word boundaries ("Java" does not match inside
+# "JavaScript"), and overlapping hits resolve to the longest one ("C++" over "C").
+DEFAULT_SKILL_TAXONOMY: List[Dict[str, Any]] = [
+    {"name": "Python", "aliases": ["Python3"]},
+    {"name": "JavaScript", "aliases": ["JS", "ECMAScript"]},
+    {"name": "Java", "aliases": []},
+    {"name": "React", "aliases": ["React.js", "ReactJS"]},
+    # No bare "Node": it matches "node" in graph, cluster and network text
+    {"name": "Node.js", "aliases": ["NodeJS"]},
+    {"name": "SQL", "aliases": []},
+    {"name": "MongoDB", "aliases": ["Mongo"]},
+    {"name": "Docker", "aliases": []},
+    {"name": "Kubernetes", "aliases": ["K8s"]},
+    {"name": "AWS", "aliases": ["Amazon Web Services"]},
+    {"name": "Azure", "aliases": ["Microsoft Azure"]},
+    {"name": "GCP", "aliases": ["Google Cloud", "Google Cloud Platform"]},
+    {"name": "Machine Learning", "aliases": ["ML"]},
+    {"name": "Data Science", "aliases": []},
+    {"name": "HTML", "aliases": ["HTML5"]},
+    {"name": "CSS", "aliases": ["CSS3"]},
+    {"name": "TypeScript", "aliases": []},
+    {"name": "Angular", "aliases": ["AngularJS"]},
+    {"name": "Vue.js", "aliases": ["Vue", "VueJS"]},
+    {"name": "FastAPI", "aliases": []},
+    {"name": "Django", "aliases": []},
+    {"name": "Flask", "aliases": []},
+    {"name": "PostgreSQL", "aliases": ["Postgres"]},
+    {"name": "Redis", "aliases": []},
+    {"name": "Git", "aliases": []},
+    {"name": "Linux", "aliases": []},
+    {"name": "Project Management", "aliases": []},
+    {"name": "Agile", "aliases": []},
+    {"name": "Scrum", "aliases": []},
+    {"name": "Leadership", "aliases": []},
+    {"name": "Communication", "aliases": []},
+]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize_skill_text(text: str) -> str:
+    return _WHITESPACE_RE.sub(" ", text.lower())
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over skill names and aliases, reporting canonical names."""
+
+    def __init__(self, entries: List[Dict[str, Any]]):
+        self.entries = [{"name": e["name"], "aliases": list(e.get("aliases") or [])} for e in entries if e.get("name")]
+        self.names: List[str] = []
+        self.terms: Dict[str, int] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple]] = [[]]  # (pattern length, index into names)
+        for entry in self.entries:
+            idx = len(self.names)
+            self.names.append(entry["name"])
+            for term in {_normalize_skill_text(t).strip() for t in [entry["name"], *entry["aliases"]]}:
+                if term:
+                    self.terms.setdefault(term, idx)
+                    self._add(term, idx)
+        self._build()
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
+    def canonical(self, skill: str) -> str:
+        """Canonical name for a skill or alias ("k8s" -> "Kubernetes"); unknown skills pass through."""
+        term = _normalize_skill_text(skill).strip()
+        idx = self.terms.get(term)
+        return self.names[idx] if idx is not None else skill.strip()
+
+    def _add(self, term: str, idx: int) -> None:
+        node = 0
+        for ch in term:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(term), idx))
+
+    def _build(self) -> None:
+        queue = list(self._goto[0].values())
+        for node in queue:  # BFS; the list grows as we go
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> List[str]:
+        """Canonical skill names found in `text`, in order of first appearance."""
+        text = _normalize_skill_text(text)
+        hits = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, idx in self._out[node]:
+                start = i - length + 1
+                if (start == 0 or not text[start - 1].isalnum()) and (i + 1 == len(text) or not text[i + 1].isalnum()):
+                    hits.append((start, -length, idx))
+
+        found: List[str] = []
+        seen = set()
+        covered_until = -1
+        for start, neg_length, idx in sorted(hits):
+            if start <= covered_until:
+                continue
+            covered_until = start - neg_length - 1
+            if idx not in seen:
+                seen.add(idx)
+                found.append(self.names[idx])
+        return found
+
+
+skill_matcher = SkillMatcher(DEFAULT_SKILL_TAXONOMY)
+
+
 def parse_resume_skills(resume_text: str) -> List[str]:
-    """Extract skills from resume text using simple keyword matching"""
-    common_skills = [
-        "Python", "JavaScript", "Java", "React", "Node.js", "SQL", "MongoDB", 
-        "Docker", "Kubernetes", "AWS", "Azure", "GCP", "Machine Learning", 
-        "Data Science", "HTML", "CSS", "TypeScript", "Angular", "Vue.js",
-        "FastAPI", "Django", "Flask", "PostgreSQL", "Redis", "Git", "Linux",
-        "Project Management", "Agile", "Scrum", "Leadership", "Communication"
-    ]
-    
-    found_skills = []
-    resume_lower = resume_text.lower()
-    
-    for skill in common_skills:
-        if skill.lower() in resume_lower:
-            found_skills.append(skill)
-    
-    return found_skills
+    """Extract skills from resume text using the skill taxonomy"""
+    return skill_matcher.find(resume_text or "")
+
+
+def _install_skill_matcher(entries: List[Dict[str, Any]]) -> None:
+    """Process-pool initializer: workers match with the parent's taxonomy, not the default."""
+    global skill_matcher
+    skill_matcher = SkillMatcher(entries)
+
+
+async def load_skill_taxonomy() -> int:
+    """(Re)build skill_matcher from the skill_taxonomy collection; returns the entry count.
+
+    The resume pool is recycled so new workers start with the new taxonomy.
+    """
+    global skill_matcher
+    entries = await db.skill_taxonomy.find({}, {"_id": 0, "name": 1, "aliases": 1}).to_list(None)
+    matcher = SkillMatcher(entries or DEFAULT_SKILL_TAXONOMY)
+    skill_matcher = matcher
+    recycle_resume_pool()
+    logging.info(f"Skill taxonomy loaded: {len(matcher.names)} skills, {matcher.size} automaton states")
+    if match_index.loaded:
+        # Aliases may have changed, so skill keys in the match index must be recomputed
+        await load_match_index()
+    return len(matcher.names)
+
+
+class SkillTaxonomyEntry(BaseModel):
+    name: str
+    aliases: List[str] = []
+    category: Optional[str] = None
+
+
+@app.on_event("startup")
+async def load_skill_taxonomy_on_startup():
+    global _match_sync_task
+    # Changes noted while the index loads are picked up by the first sync
+    since = datetime.now(timezone.utc)
+    try:
+        await load_skill_taxonomy()
+    except Exception as e:
+        logging.warning(f"Skill taxonomy load failed, using defaults: {e}")
+    try:
+        await load_match_index()
+    except Exception as e:
+        logging.warning(f"Match index load failed: {e}")
+    if MATCH_INDEX_SYNC_SECONDS > 0 and _match_sync_task is None:
+        _match_sync_task = asyncio.create_task(_match_sync_loop(since))
+
+
+@api_router.get("/skills/taxonomy")
+async def get_skill_taxonomy(current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    entries = await db.skill_taxonomy.find({}, {"_id": 0}).sort("name", 1).to_list(None)
+    return {"source": "database" if entries else "default", "skills": entries or DEFAULT_SKILL_TAXONOMY}
+
+
+@api_router.put("/skills/taxonomy")
+async def upsert_skill_taxonomy(
+    entries: List[SkillTaxonomyEntry],
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    """Add or replace taxonomy entries (by name) and hot-reload the matcher. Admins only."""
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can edit the skill taxonomy")
+    now = datetime.now(timezone.utc)
+    if entries:
+        await db.skill_taxonomy.bulk_write([
+            UpdateOne({"name": e.name}, {"$set": {**e.dict(), "updated_at": now}}, upsert=True)
+            for e in entries
+        ], ordered=False)
+    skills = await load_skill_taxonomy()
+    await note_match_change("taxonomy")
+    return {"skills": skills}
+
+
+@api_router.delete("/skills/taxonomy/{name}")
+async def delete_skill_taxonomy_entry(name: str, current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can edit the skill taxonomy")
+    result = await db.skill_taxonomy.delete_one({"name": name})
+    if result.deleted_count == 0:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    skills = await load_skill_taxonomy()
+    await note_match_change("taxonomy")
+    return {"skills": skills}
+
+
+@api_router.post("/skills/taxonomy/reload")
+async def reload_skill_taxonomy(current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    """Re-read skill_taxonomy, e.g. after it was edited directly in MongoDB."""
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can reload the skill taxonomy")
+    return {"skills": await load_skill_taxonomy()}
+
+
+# ----------------------
+# Resume parsing pipeline
+# ----------------------
+# PDF text extraction is CPU-bound, so it runs in a process pool rather than on the event
+# loop or the shared thread pool. upload_resume stores the file, marks the candidate
+# "pending" and schedules process_resume(); the parsed text and skills are written back
+# once the worker finishes. Bulk re-parses (python server.py --reparse-resumes) fan out
+# over the same pool, one resume per worker.
+RESUME_PARSE_WORKERS = max(1, int(os.getenv("RESUME_PARSE_WORKERS", str(os.cpu_count() or 2))))
+RESUME_TEXT_MAX_CHARS = int(os.getenv("RESUME_TEXT_MAX_CHARS", "200000"))
+
+_resume_pool: Optional[ProcessPoolExecutor] = None
+_resume_tasks: set = set()
+resume_parse_stats: Dict[str, int] = {"queued": 0, "in_flight": 0, "parsed": 0, "failed": 0}
+
+
+def parse_resume_file(path: str) -> Dict[str, Any]:
+    """Worker-side: extract text page by page and match skills. Must stay picklable (module level)."""
+    with open(path, "rb") as f:
+        is_pdf = f.read(5) == b"%PDF-"
+        f.seek(0)
+        if is_pdf:
+            pages = list(iter_pdf_pages(f))
+        else:
+            pages = [f.read().decode(errors="ignore")]
+    text = "\n".join(pages)
+    return {"text": text[:RESUME_TEXT_MAX_CHARS], "pages": len(pages), "skills": parse_resume_skills(text)}
+
+
+def get_resume_pool() -> ProcessPoolExecutor:
+    global _resume_pool
+    if _resume_pool is None:
+        # Never fork: by now the event loop, Motor and executor threads exist, and a forked
+        # child can inherit a lock held by one of them. forkserver children start from a
+        # clean single-threaded process (spawn where forkserver is unavailable).
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _resume_pool = ProcessPoolExecutor(
+            max_workers=RESUME_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context(method),
+            initializer=_install_skill_matcher,
+            initargs=(skill_matcher.entries,),
+        )
+    return _resume_pool
+
+
+def recycle_resume_pool() -> None:
+    """Retire the current pool (queued parses still finish); the next parse starts a fresh one."""
+    global _resume_pool
+    if _resume_pool is not None:
+        _resume_pool.shutdown(wait=False)
+        _resume_pool = None
+
+
+def close_resume_pool() -> None:
+    global _resume_pool
+    if _resume_pool is not None:
+        _resume_pool.shutdown(wait=False, cancel_futures=True)
+        _resume_pool = None
+
+
+async def process_resume(candidate_id: str, path: str, sha256: Optional[str] = None) -> bool:
+    """Parse one stored resume off-loop and persist text/skills on the candidate.
+
+    The write is conditioned on resume_sha256 so a slow parse of an older upload never
+    overwrites the result for a newer one.
+    """
+    match: Dict[str, Any] = {"id": candidate_id}
+    if sha256:
+        match["resume_sha256"] = sha256
+    resume_parse_stats["in_flight"] += 1
+    try:
+        parsed = await asyncio.get_running_loop().run_in_executor(get_resume_pool(), parse_resume_file, path)
+    except Exception as e:
+        resume_parse_stats["failed"] += 1
+        logging.error(f"Resume parsing failed for candidate {candidate_id}: {e}")
+        await db.candidates.update_one(match, {"$set": {"resume_parse_status": "failed", "resume_parse_error": str(e)[:500]}})
+        return False
+    finally:
+        resume_parse_stats["in_flight"] -= 1
+
+    update: Dict[str, Any] = {
+        "$set": {
+            "resume_text": parsed["text"],
+            "resume_pages": parsed["pages"],
+            "resume_parse_status": "parsed",
+            "resume_parsed_at": datetime.now(timezone.utc),
+        },
+        "$unset": {"resume_parse_error": ""},
+    }
+    if parsed["skills"]:
+        update["$addToSet"] = {"skills": {"$each": parsed["skills"]}}
+    await db.candidates.update_one(match, update)
+    invalidate_principal(candidate_id)
+    resume_parse_stats["parsed"] += 1
+    await refresh_candidate_match(candidate_id)
+    await note_match_change("candidate", candidate_id)
+    return True
+
+
+def schedule_resume_parse(candidate_id: str, path: str, sha256: Optional[str] = None) -> None:
+    """Fire-and-forget process_resume(); the task is held until done so it is not collected."""
+    resume_parse_stats["queued"] += 1
+    task = asyncio.create_task(process_resume(candidate_id, path, sha256))
+    _resume_tasks.add(task)
+    task.add_done_callback(_resume_tasks.discard)
+
+
+async def reparse_resumes_cli() -> int:
+    """Re-extract every stored resume across the process pool (python server.py --reparse-resumes)."""
+    await load_skill_taxonomy()
+    limit = asyncio.Semaphore(RESUME_PARSE_WORKERS)
+    started = time.perf_counter()
+
+    async def one(doc: Dict[str, Any]) -> bool:
+        async with limit:
+            if not Path(doc["resume_path"]).is_file():
+                logging.warning(f"Resume file missing for candidate {doc['id']}: {doc['resume_path']}")
+                return False
+            return await process_resume(doc["id"], doc["resume_path"])
+
+    candidates = await db.candidates.find(
+        {"resume_path": {"$exists": True, "$ne": None}}, {"_id": 0, "id": 1, "resume_path": 1}
+    ).to_list(None)
+    try:
+        results = await asyncio.gather(*(one(doc) for doc in candidates))
+    finally:
+        close_resume_pool()
+    ok = sum(results)
+    print(f"re-parsed {ok}/{len(candidates)} resumes with {RESUME_PARSE_WORKERS} workers "
+          f"in {time.perf_counter() - started:.1f}s")
+    return 0 if ok == len(candidates) else 1
+
+
+# ----------------------
+# Candidate/job matching index
+# ----------------------
+# In-memory inverted index from canonical skill to candidates and to jobs, with per-row
+# experience arrays, so ranking is a handful of NumPy scatter-adds plus argpartition
+# instead of scanning /candidates. A job's skills weigh 1.0; skills found in its
+# technical_requirements text weigh 0.5. The score is 0.75 * weighted skill coverage of
+# the job + 0.25 * experience fit. Loaded at startup and updated incrementally when
+# candidates, jobs or resumes change.
+EXPERIENCE_LEVEL_YEARS: Dict[str, tuple] = {
+    "entry": (0, 2), "junior": (0, 2), "mid": (2, 5), "senior": (5, 50), "lead": (8, 50),
+}
+MATCH_SKILL_WEIGHT = 0.75
+MATCH_TECH_REQUIREMENT_WEIGHT = 0.5
+
+
+def _skill_list(value) -> List[str]:
+    # Profiles occasionally store skills as one comma-separated string
+    if isinstance(value, str):
+        value = value.split(",")
+    return [v for v in value or [] if isinstance(v, str) and v.strip()]
+
+
+class MatchIndex:
+    """Skill postings for candidates and jobs. Rows are never reused; reload() compacts."""
+
+    def __init__(self):
+        self.loaded = False
+        self.skill_ids: Dict[str, int] = {}
+        self.skill_names: List[str] = []
+        # candidates
+        self.cand_rows: Dict[str, int] = {}
+        self.cand_ids: List[str] = []
+        self.cand_skills: List[set] = []
+        self.cand_exp = np.zeros(0, dtype=np.float32)
+        self.cand_alive = np.zeros(0, dtype=bool)
+        self.cand_postings: Dict[int, set] = {}
+        # jobs
+        self.job_rows: Dict[str, int] = {}
+        self.job_ids: List[str] = []
+        self.job_weights: List[Dict[int, float]] = []
+        self.job_lo = np.zeros(0, dtype=np.float32)
+        self.job_hi = np.zeros(0, dtype=np.float32)
+        self.job_norm = np.ones(0, dtype=np.float32)
+        self.job_active = np.zeros(0, dtype=bool)
+        self.job_postings: Dict[int, Dict[int, float]] = {}
+        self._arrays: Dict[tuple, tuple] = {}  # (side, skill) -> cached posting arrays
+        # While load_match_index() builds a replacement, updates are also recorded
+        # here so they can be replayed onto the new index before it is swapped in.
+        self.journal: Optional[List[tuple]] = None
+
+    # -- keys and storage ------------------------------------------------------
+    def _skill(self, name: str) -> Optional[int]:
+        key = skill_matcher.canonical(name).lower()
+        if not key:
+            return None
+        sid = self.skill_ids.get(key)
+        if sid is None:
+            sid = self.skill_ids[key] = len(self.skill_names)
+            self.skill_names.append(skill_matcher.canonical(name))
+        return sid
+
+    @staticmethod
+    def _grow(arr: np.ndarray, n: int, fill) -> np.ndarray:
+        if n <= len(arr):
+            return arr
+        grown = np.full(max(n, 2 * len(arr), 64), fill, dtype=arr.dtype)
+        grown[:len(arr)] = arr
+        return grown
+
+    def _row(self, rows: Dict[str, int], ids: List[str], entity_id: str) -> int:
+        row = rows.get(entity_id)
+        if row is None:
+            row = rows[entity_id] = len(ids)
+            ids.append(entity_id)
+        return row
+
+    # -- updates -----------------------------------------------------------------
+    def _record(self, op: str, arg) -> None:
+        if self.journal is not None:
+            self.journal.append((op, arg))
+
+    def replay(self, journal: List[tuple]) -> None:
+        for op, arg in journal:
+            getattr(self, op)(arg)
+
+    def upsert_candidate(self, doc: Dict[str, Any]) -> None:
+        self._record("upsert_candidate", doc)
+        row = self._row(self.cand_rows, self.cand_ids, doc["id"])
+        if row == len(self.cand_skills):
+            self.cand_skills.append(set())
+            self.cand_exp = self._grow(self.cand_exp, row + 1, 0.0)
+            self.cand_alive = self._grow(self.cand_alive, row + 1, False)
+        skills = {sid for sid in map(self._skill, _skill_list(doc.get("skills"))) if sid is not None}
+        for sid in self.cand_skills[row] ^ skills:
+            postings = self.cand_postings.setdefault(sid, set())
+            if sid in skills:
+                postings.add(row)
+            else:
+                postings.discard(row)
+            self._arrays.pop(("cand", sid), None)
+        self.cand_skills[row] = skills
+        self.cand_exp[row] = float(doc.get("experience_years") or 0)
+        self.cand_alive[row] = True
+
+    def upsert_job(self, doc: Dict[str, Any]) -> None:
+        if doc.get("status") in (JobStatus.CLOSED, JobStatus.CLOSED.value):
+            self.remove_job(doc["id"])
+            return
+        self._record("upsert_job", doc)
+        row = self._row(self.job_rows, self.job_ids, doc["id"])
+        if row == len(self.job_weights):
+            self.job_weights.append({})
+            self.job_lo = self._grow(self.job_lo, row + 1, 0.0)
+            self.job_hi = self._grow(self.job_hi, row + 1, 50.0)
+            self.job_norm = self._grow(self.job_norm, row + 1, 1.0)
+            self.job_active = self._grow(self.job_active, row + 1, False)
+        weights: Dict[int, float] = {}
+        for name in skill_matcher.find(" ; ".join(doc.get("technical_requirements") or [])):
+            sid = self._skill(name)
+            if sid is not None:
+                weights[sid] = MATCH_TECH_REQUIREMENT_WEIGHT
+        for name in _skill_list(doc.get("skills")):
+            sid = self._skill(name)
+            if sid is not None:
+                weights[sid] = 1.0
+        for sid in set(self.job_weights[row]) | set(weights):
+            postings = self.job_postings.setdefault(sid, {})
+            if sid in weights:
+                postings[row] = weights[sid]
+            else:
+                postings.pop(row, None)
+            self._arrays.pop(("job", sid), None)
+        self.job_weights[row] = weights
+        lo, hi = EXPERIENCE_LEVEL_YEARS.get(str(doc.get("experience_level") or "").lower(), (0, 50))
+        self.job_lo[row], self.job_hi[row] = lo, hi
+        self.job_norm[row] = sum(weights.values()) or 1.0
+        self.job_active[row] = doc.get("status") in (JobStatus.ACTIVE, JobStatus.ACTIVE.value)
+
+    def remove_candidate(self, candidate_id: str) -> None:
+        row = self.cand_rows.get(candidate_id)
+        if row is not None:
+            self.upsert_candidate({"id": candidate_id, "skills": []})
+            self.cand_alive[row] = False
+        # Recorded after the inner upsert so a replay ends with the row dead
+        self._record("remove_candidate", candidate_id)
+
+    def remove_job(self, job_id: str) -> None:
+        """Drop a closed or deleted job's postings; its row stays unused until reload()."""
+        self._record("remove_job", job_id)
+        row = self.job_rows.get(job_id)
+        if row is None:
+            return
+        for sid in self.job_weights[row]:
+            self.job_postings.get(sid, {}).pop(row, None)
+            self._arrays.pop(("job", sid), None)
+        self.job_weights[row] = {}
+        self.job_norm[row] = 1.0
+        self.job_active[row] = False
+
+    # -- scoring -----------------------------------------------------------------
+    def _cand_array(self, sid: int) -> np.ndarray:
+        arr = self._arrays.get(("cand", sid))
+        if arr is None:
+            postings = self.cand_postings.get(sid) or ()
+            arr = self._arrays[("cand", sid)] = (np.fromiter(postings, dtype=np.int64, count=len(postings)),)
+        return arr[0]
+
+    def _job_arrays(self, sid: int) -> tuple:
+        arr = self._arrays.get(("job", sid))
+        if arr is None:
+            postings = self.job_postings.get(sid) or {}
+            arr = self._arrays[("job", sid)] = (
+                np.fromiter(postings.keys(), dtype=np.int64, count=len(postings)),
+                np.fromiter(postings.values(), dtype=np.float32, count=len(postings)),
+            )
+        return arr
+
+    @staticmethod
+    def _experience_fit(years, lo, hi):
+        # 1 inside the band, falling to 0 three years outside it
+        gap = np.maximum(lo - years, 0) + np.maximum(years - hi, 0)
+        return np.clip(1.0 - gap / 3.0, 0.0, 1.0)
+
+    @staticmethod
+    def _top(total: np.ndarray, mask: np.ndarray, k: int) -> List[int]:
+        candidates = np.flatnonzero(mask)
+        if not len(candidates) or k <= 0:
+            return []
+        scores = total[candidates]
+        if len(candidates) > k:
+            part = np.argpartition(-scores, k - 1)[:k]
+            candidates, scores = candidates[part], scores[part]
+        order = np.argsort(-scores, kind="stable")
+        return candidates[order].tolist()
+
+    def top_candidates(self, job_id: str, k: int) -> List[Dict[str, Any]]:
+        row = self.job_rows.get(job_id)
+        if row is None:
+            return []
+        weights = self.job_weights[row]
+        n = len(self.cand_ids)
+        coverage = np.zeros(n, dtype=np.float32)
+        for sid, w in weights.items():
+            coverage[self._cand_array(sid)] += w
+        coverage /= self.job_norm[row]
+        total = MATCH_SKILL_WEIGHT * coverage + (1 - MATCH_SKILL_WEIGHT) * self._experience_fit(
+            self.cand_exp[:n], self.job_lo[row], self.job_hi[row])
+        results = []
+        for r in self._top(total, (coverage > 0) & self.cand_alive[:n], k):
+            matched = self.cand_skills[r] & weights.keys()
+            results.append({
+                "candidate_id": self.cand_ids[r],
+                "score": round(float(total[r]), 4),
+                "skill_coverage": round(float(coverage[r]), 4),
+                "matched_skills": sorted(self.skill_names[s] for s in matched),
+                "missing_skills": sorted(self.skill_names[s] for s in weights.keys() - matched),
+            })
+        return results
+
+    def top_jobs(self, candidate_id: str, k: int) -> List[Dict[str, Any]]:
+        row = self.cand_rows.get(candidate_id)
+        if row is None:
+            return []
+        skills = self.cand_skills[row]
+        n = len(self.job_ids)
+        coverage = np.zeros(n, dtype=np.float32)
+        for sid in skills:
+            rows, weights = self._job_arrays(sid)
+            coverage[rows] += weights
+        coverage /= self.job_norm[:n]
+        total = MATCH_SKILL_WEIGHT * coverage + (1 - MATCH_SKILL_WEIGHT) * self._experience_fit(
+            self.cand_exp[row], self.job_lo[:n], self.job_hi[:n])
+        results = []
+        for r in self._top(total, (coverage > 0) & self.job_active[:n], k):
+            required = self.job_weights[r]
+            matched = skills & required.keys()
+            results.append({
+                "job_id": self.job_ids[r],
+                "score": round(float(total[r]), 4),
+                "skill_coverage": round(float(coverage[r]), 4),
+                "matched_skills": sorted(self.skill_names[s] for s in matched),
+                "missing_skills": sorted(self.skill_names[s] for s in required.keys() - matched),
+            })
+        return results
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "loaded": self.loaded,
+            "skills": len(self.skill_names),
+            "candidates": int(self.cand_alive.sum()),
+            "jobs": len(self.job_ids),
+            "active_jobs": int(self.job_active.sum()),
+        }
+
+
+match_index = MatchIndex()
+
+
+async def load_match_index() -> MatchIndex:
+    """Rebuild the match index from MongoDB and swap it in.
+
+    Updates applied to the live index while the reads are in flight are journaled
+    and replayed onto the new index, so they are not lost by the swap.
+    """
+    global match_index
+    index = MatchIndex()
+    live = match_index
+    journal: List[tuple] = []
+    live.journal = journal
+    try:
+        candidates, jobs = await asyncio.gather(
+            db.candidates.find({}, {"_id": 0, "id": 1, "skills": 1, "experience_years": 1}).to_list(None),
+            db.jobs.find({}, {"_id": 0, "id": 1, "skills": 1, "technical_requirements": 1,
+                              "experience_level": 1, "status": 1}).to_list(None),
+        )
+    finally:
+        live.journal = None
+    for doc in candidates:
+        if doc.get("id"):
+            index.upsert_candidate(doc)
+    for doc in jobs:
+        if doc.get("id"):
+            index.upsert_job(doc)
+    # No await between the replay and the swap
+    index.replay(journal)
+    index.loaded = True
+    match_index = index
+    logging.info(f"Match index loaded: {index.stats()}")
+    return index
+
+
+async def refresh_candidate_match(candidate_id: str) -> None:
+    doc = await db.candidates.find_one({"id": candidate_id}, {"_id": 0, "id": 1, "skills": 1, "experience_years": 1})
+    if doc:
+        match_index.upsert_candidate(doc)
+    else:
+        match_index.remove_candidate(candidate_id)
+
+
+async def refresh_job_match(job_id: str) -> None:
+    doc = await db.jobs.find_one({"id": job_id}, {"_id": 0, "id": 1, "skills": 1, "technical_requirements": 1,
+                                                  "experience_level": 1, "status": 1})
+    if doc:
+        match_index.upsert_job(doc)
+    else:
+        match_index.remove_job(job_id)
+
+
+# The index lives in each worker process. Writers note what they changed in
+# match_index_changes; every worker polls it each MATCH_INDEX_SYNC_SECONDS and refreshes
+# the candidates/jobs other processes changed straight from MongoDB (0 turns polling
+# off: single-worker deployments). Refreshing is idempotent, so each poll overlaps the
+# previous one by an interval to catch writes that became visible late. Notes expire
+# after MATCH_INDEX_CHANGE_TTL; a worker that fell further behind reloads everything.
+MATCH_INDEX_SYNC_SECONDS = float(os.getenv("MATCH_INDEX_SYNC_SECONDS", "5"))
+MATCH_INDEX_CHANGE_TTL = 3600
+PROCESS_ID = uuid.uuid4().hex
+_match_sync_task: Optional[asyncio.Task] = None
+
+
+async def note_match_change(kind: str, entity_id: Optional[str] = None) -> None:
+    """Tell other workers a candidate, job or the skill taxonomy changed."""
+    if MATCH_INDEX_SYNC_SECONDS <= 0:
+        return
+    try:
+        await db.match_index_changes.insert_one({"kind": kind, "entity_id": entity_id, "origin": PROCESS_ID,
+                                                 "at": datetime.now(timezone.utc)})
+    except Exception as e:
+        logging.warning(f"Match index change not recorded for {kind} {entity_id}: {e}")
+
+
+async def sync_match_index(since: datetime) -> datetime:
+    """Apply changes other workers noted at or after `since`; returns the next `since`."""
+    polled_at = datetime.now(timezone.utc)
+    if polled_at - since > timedelta(seconds=MATCH_INDEX_CHANGE_TTL - 60):
+        await load_match_index()
+        return polled_at
+    changes = await db.match_index_changes.find(
+        {"at": {"$gte": since}, "origin": {"$ne": PROCESS_ID}}, {"_id": 0, "kind": 1, "entity_id": 1}
+    ).to_list(None)
+    changed = {(c["kind"], c.get("entity_id")) for c in changes}
+    if ("taxonomy", None) in changed:
+        await load_skill_taxonomy()  # also reloads the match index
+        return polled_at - timedelta(seconds=MATCH_INDEX_SYNC_SECONDS)
+    for kind, entity_id in changed:
+        if kind == "candidate":
+            await refresh_candidate_match(entity_id)
+        elif kind == "job":
+            await refresh_job_match(entity_id)
+    return polled_at - timedelta(seconds=MATCH_INDEX_SYNC_SECONDS)
+
+
+async def _match_sync_loop(since: datetime) -> None:
+    while True:
+        await asyncio.sleep(MATCH_INDEX_SYNC_SECONDS)
+        try:
+            since = await sync_match_index(since)
+        except Exception as e:
+            logging.warning(f"Match index sync failed: {e}")
+
+
+@api_router.get("/jobs/{job_id}/recommended-candidates")
+async def recommended_candidates(
+    job_id: str,
+    limit: int = 20,
+    current_recruiter: Recruiter = Depends(get_current_recruiter),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    """Top candidates for one of the recruiter's jobs, ranked by skill coverage and experience fit."""
+    job = await db.jobs.find_one({"id": job_id, "company_id": current_recruiter.company_id}, {"_id": 0, "id": 1})
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job_id not in match_index.job_rows:
+        await refresh_job_match(job_id)
+    ranked = match_index.top_candidates(job_id, max(1, min(200, limit)))
+    candidates = await loader.load_many("candidates", (r["candidate_id"] for r in ranked))
+    results = []
+    for r in ranked:
+        candidate = candidates.get(r["candidate_id"])
+        if candidate:
+            candidate.pop("password_hash", None)
+            results.append({**r, "candidate": CandidateUser(**candidate)})
+    return results
+
+
+@api_router.get("/candidates/recommended-jobs")
+async def recommended_jobs(
+    limit: int = 20,
+    current_candidate: CandidateUser = Depends(get_current_candidate),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    """Top active jobs for the current candidate."""
+    if current_candidate.id not in match_index.cand_rows:
+        match_index.upsert_candidate(current_candidate.dict())
+    ranked = match_index.top_jobs(current_candidate.id, max(1, min(200, limit)))
+    jobs = await loader.load_many("jobs", (r["job_id"] for r in ranked))
+    companies = await loader.load_many("companies", (j.get("company_id") for j in jobs.values()))
+    results = []
+    for r in ranked:
+        job = jobs.get(r["job_id"])
+        if job and job.get("status") == JobStatus.ACTIVE.value:
+            company = companies.get(job.get("company_id"))
+            results.append({**r, "job": Job(**job), "company_name": company.get("name") if company else None})
+    return results
 
 # Recruiter Authentication Routes
 @api_router.post("/recruiters/auth/register")
@@ -1757,6 +4035,8 @@ async def register_candidate(candidate_data: CandidateRegister):
     # Store candidate and password
     await db.candidates.insert_one(candidate.dict())
     await db.user_passwords.insert_one({"user_id": candidate.id, "password": hashed_password, "role": "candidate"})
+    match_index.upsert_candidate(candidate.dict())
+    await note_match_change("candidate", candidate.id)
     
     # Generate email verification
     email_code = generate_verification_code()
@@ -1842,6 +4122,7 @@ async def verify_email(user_id: str, verification_code: str):
         {"id": user_id},
         {"$set": {"is_email_verified": True}}
     )
+    invalidate_principal(user_id)
     
     return {"message": "Email verified successfully"}
 
@@ -1873,6 +4154,7 @@ async def verify_phone(user_id: str, otp_code: str):
         {"id": user_id},
         {"$set": {"is_phone_verified": True}}
     )
+    invalidate_principal(user_id)
     
     return {"message": "Phone verified successfully"}
 
@@ -1951,6 +4233,8 @@ async def register_candidate(candidate_data: CandidateRegister):
     candidate_dict["password_hash"] = password_hash
     
     await db.candidates.insert_one(candidate_dict)
+    match_index.upsert_candidate(candidate_dict)
+    await note_match_change("candidate", candidate_dict["id"])
     
     # Generate JWT token
     token_data = {
@@ -1995,88 +4279,214 @@ async def login_candidate(login_data: CandidateLogin):
     }
 
 # Candidate Job Routes
+async def _enrich_jobs_for_candidate(jobs: List[Dict[str, Any]], candidate_id: str,
+                                     loader: EnrichmentLoader) -> List[Dict[str, Any]]:
+    """Attach company and has-applied state to job rows with two batched lookups."""
+    job_ids = [j.get("id") for j in jobs]
+    companies_by_id, applications = await asyncio.gather(
+        loader.load_many("companies", (j.get("company_id") for j in jobs)),
+        db.candidate_applications.find(
+            {"candidate_id": candidate_id, "job_id": {"$in": job_ids}},
+            {"_id": 0, "id": 1, "job_id": 1},
+        ).to_list(None),
+    )
+    application_by_job = {a.get("job_id"): a for a in applications}
+
+    enriched_jobs = []
+    for job_payload in jobs:
+        existing_application = application_by_job.get(job_payload.get("id"))
+        enriched_jobs.append({
+            "job": job_payload,
+            "company": companies_by_id.get(job_payload.get("company_id")),
+            "has_applied": bool(existing_application),
+            "application_id": existing_application["id"] if existing_application else None
+        })
+    return enriched_jobs
+
+
+def _job_filters(location: Optional[str], experience_level: Optional[str]) -> tuple:
+    # User input is escaped before it reaches $regex
+    location_filter = {"location": {"$regex": re.escape(location), "$options": "i"}} if location else {}
+    experience_filter = {"experience_level": experience_level} if experience_level else {}
+    return location_filter, experience_filter
+
+
+def _job_keyword_filter(search: str) -> Dict[str, Any]:
+    """Case-insensitive substring match, used when the jobs_text index is unavailable."""
+    pattern = {"$regex": re.escape(search), "$options": "i"}
+    return {"$or": [{"title": pattern}, {"description": pattern}, {"skills": pattern}]}
+
+
+def _missing_text_index(exc: OperationFailure) -> bool:
+    # IndexNotFound: "text index required for $text query"
+    return exc.code == 27 or "text index required" in str(exc)
+
+
 @api_router.get("/candidates/jobs")
 async def get_available_jobs(
+    response: Response,
     search: Optional[str] = None,
     location: Optional[str] = None,
     job_type: Optional[str] = None,
     experience_level: Optional[str] = None,
-    current_candidate: CandidateUser = Depends(get_current_candidate)
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_candidate: CandidateUser = Depends(get_current_candidate),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
 ):
-    query = {"status": "active"}
+    """List active jobs with company and has-applied enrichment, oldest first (by _id).
+    Paginated: pass the X-Next-Cursor response header back as `after`.
+    `search` filters through the jobs text index, so it matches whole (stemmed) words rather
+    than substrings: "dev" no longer matches "developer". Without the index it falls back to a
+    substring match. Use /candidates/jobs/search for relevance order.
+    """
+    query: Dict[str, Any] = {"status": "active"}
     
     if search:
-        query["$or"] = [
-            {"title": {"$regex": search, "$options": "i"}},
-            {"description": {"$regex": search, "$options": "i"}},
-            {"skills": {"$in": [re.compile(search, re.IGNORECASE)]}}
-        ]
+        query["$text"] = {"$search": search}
     
-    if location:
-        query["location"] = {"$regex": location, "$options": "i"}
+    location_filter, experience_filter = _job_filters(location, experience_level)
+    query.update(location_filter)
+    query.update(experience_filter)
     
     if job_type:
         query["job_type"] = job_type
-        
-    if experience_level:
-        query["experience_level"] = experience_level
-    
-    jobs = await db.jobs.find(query).to_list(1000)
-    enriched_jobs = []
-    for job_doc in jobs:
-        # Sanitize job
-        job_payload = {k: v for k, v in dict(job_doc).items() if k != "_id"}
-
-        # Fetch and sanitize company
-        company_doc = await db.companies.find_one({"id": job_payload.get("company_id")})
-        company_payload = None
-        if company_doc:
-            company_payload = {k: v for k, v in dict(company_doc).items() if k != "_id"}
-
-        # Check if candidate already applied
-        existing_application = await db.candidate_applications.find_one({
-            "job_id": job_payload.get("id"),
-            "candidate_id": current_candidate.id
-        })
 
-        enriched_jobs.append({
-            "job": job_payload,
-            "company": company_payload,
-            "has_applied": bool(existing_application),
-            "application_id": existing_application["id"] if existing_application else None
-        })
-    
+    try:
+        jobs, next_cursor = await paginate_find(db.jobs, query, [("_id", 1)], clamp_limit(limit), after, {"_id": 0})
+    except OperationFailure as e:
+        if not search or not _missing_text_index(e):
+            raise
+        logging.warning("jobs_text index missing; job search falling back to substring match")
+        query.pop("$text")
+        query.update(_job_keyword_filter(search))
+        jobs, next_cursor = await paginate_find(db.jobs, query, [("_id", 1)], clamp_limit(limit), after, {"_id": 0})
+    enriched_jobs = await _enrich_jobs_for_candidate(jobs, current_candidate.id, loader)
+    set_next_cursor(response, next_cursor)
     return enriched_jobs
 
 
+@api_router.get("/candidates/jobs/search")
+async def search_jobs(
+    response: Response,
+    q: str,
+    location: Optional[str] = None,
+    job_type: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    limit: int = 20,
+    after: Optional[str] = None,
+    current_candidate: CandidateUser = Depends(get_current_candidate),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    """Relevance-ranked job search over the weighted jobs text index.
+
+    Ordered by text score, then id; pass `next_cursor` (also sent as X-Next-Cursor) back as
+    `after`. `q` matches whole (stemmed) words, not substrings. Without the index the search
+    falls back to a substring match with every score 0, i.e. id order. The first page
+    carries `total` and location/experience_level facet counts; each facet is counted with
+    every filter except its own, so the UI can offer alternatives.
+    """
+    q = q.strip()
+    if not q:
+        raise HTTPException(status_code=400, detail="q is required")
+    limit = clamp_limit(limit, maximum=100)
+
+    base: Dict[str, Any] = {"$text": {"$search": q}, "status": "active"}
+    if job_type:
+        base["job_type"] = job_type
+    location_filter, experience_filter = _job_filters(location, experience_level)
+
+    order = [("_score", -1), ("id", 1)]
+    page_match = keyset_query({**location_filter, **experience_filter}, order, after)
+    page: List[Dict[str, Any]] = [
+        # page_match is None once the cursor is past the last row; {"_id": None} matches nothing
+        {"$match": {"_id": None} if page_match is None else page_match},
+        {"$sort": dict(order)},
+        {"$limit": limit + 1},
+        {"$project": {"_id": 0}},
+    ]
+
+    facets: Dict[str, List[Dict[str, Any]]] = {"results": page}
+    if not after:
+        facets["total"] = [{"$match": {**location_filter, **experience_filter}}, {"$count": "n"}]
+        facets["location"] = [
+            {"$match": experience_filter},
+            {"$group": {"_id": "$location", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+            {"$limit": 25},
+        ]
+        facets["experience_level"] = [
+            {"$match": location_filter},
+            {"$group": {"_id": "$experience_level", "count": {"$sum": 1}}},
+            {"$sort": {"count": -1, "_id": 1}},
+        ]
+
+    def run(match: Dict[str, Any], score: Any):
+        return db.jobs.aggregate([
+            {"$match": match},
+            {"$addFields": {"_score": score}},
+            {"$facet": facets},
+        ]).to_list(1)
+
+    try:
+        try:
+            rows = await run(base, {"$meta": "textScore"})
+        except OperationFailure as e:
+            if not _missing_text_index(e):
+                raise
+            logging.warning("jobs_text index missing; job search falling back to substring match")
+            fallback = {k: v for k, v in base.items() if k != "$text"}
+            rows = await run({**fallback, **_job_keyword_filter(q)}, {"$literal": 0.0})
+    except Exception as e:
+        logging.error(f"Job text search failed: {e}")
+        raise HTTPException(status_code=503, detail="Job search is unavailable")
+    row = rows[0] if rows else {}
+
+    jobs = row.get("results") or []
+    has_more = len(jobs) > limit
+    jobs = jobs[:limit]
+    scores = [j.pop("_score", 0.0) for j in jobs]
+    results = await _enrich_jobs_for_candidate(jobs, current_candidate.id, loader)
+    for item, score in zip(results, scores):
+        item["score"] = round(float(score), 4)
+
+    next_cursor = encode_cursor([scores[-1], jobs[-1]["id"]]) if has_more else None
+    set_next_cursor(response, next_cursor)
+    payload: Dict[str, Any] = {"results": results, "next_cursor": next_cursor}
+    if not after:
+        total_rows = row.get("total") or []
+        payload["total"] = int(total_rows[0]["n"]) if total_rows else 0
+        payload["facets"] = {
+            name: [{"value": f["_id"], "count": int(f["count"])} for f in row.get(name) or [] if f.get("_id")]
+            for name in ("location", "experience_level")
+        }
+    return payload
+
+
 @api_router.post("/candidates/resume")
 async def upload_resume(
     file: UploadFile = File(...),
     current_candidate: CandidateUser = Depends(get_current_candidate)
 ):
-    """Upload or replace candidate resume. Stores file to local FS and updates candidate profile."""
-    resumes_dir = ROOT_DIR / "resumes" / current_candidate.id
-    resumes_dir.mkdir(parents=True, exist_ok=True)
-    dest_path = resumes_dir / file.filename
-
-    # Save file
-    with dest_path.open("wb") as f:
-        content = await file.read()
-        f.write(content)
-
-    # Optional: parse basic skills
-    try:
-        text_preview = content[:5000].decode(errors="ignore") if isinstance(content, (bytes, bytearray)) else ""
-        parsed_skills = parse_resume_skills(text_preview)
-    except Exception:
-        parsed_skills = []
+    """Upload or replace candidate resume. Stores file in the local content store and updates candidate profile."""
+    filename = Path(file.filename or "resume").name
+    stored = await store_upload(resume_storage, "resumes", current_candidate.id, filename, file.file,
+                                MAX_RESUME_BYTES, file.content_type)
+    dest_path = resume_storage.local_path(stored["key"])
 
     await db.candidates.update_one(
         {"id": current_candidate.id},
-        {"$set": {"resume_path": str(dest_path), "skills": list(set((current_candidate.skills or []) + parsed_skills))}}
+        {"$set": {
+            "resume_path": str(dest_path),
+            "resume_filename": filename,
+            "resume_sha256": stored["sha256"],
+            "resume_parse_status": "pending",
+        }}
     )
+    # Text extraction and skill matching finish in the background (see process_resume)
+    schedule_resume_parse(current_candidate.id, str(dest_path), stored["sha256"])
 
-    return {"message": "Resume uploaded successfully", "filename": file.filename}
+    return {"message": "Resume uploaded successfully", "filename": file.filename, "parse_status": "pending"}
 
 
 @api_router.get("/candidates/{candidate_id}/resume")
@@ -2104,9 +4514,10 @@ async def get_candidate_resume(
     if not path.exists():
         raise HTTPException(status_code=404, detail="Resume file missing on server")
 
-    # Basic content type guess
-    media_type = "application/pdf" if path.suffix.lower() == ".pdf" else "application/octet-stream"
-    return FileResponse(path, media_type=media_type, filename=path.name)
+    # Basic content type guess (content-store paths carry no extension; use the uploaded name)
+    filename = candidate.get("resume_filename") or path.name
+    media_type = "application/pdf" if Path(filename).suffix.lower() == ".pdf" else "application/octet-stream"
+    return FileResponse(path, media_type=media_type, filename=filename)
 
 class ApplicationRequest(BaseModel):
     job_id: str
@@ -2207,43 +4618,63 @@ async def get_job(job_id: str):
     return job
 
 @api_router.get("/candidates/my-applications")
-async def get_my_applications(current_candidate: CandidateUser = Depends(get_current_candidate)):
-    applications = await db.candidate_applications.find({"candidate_id": current_candidate.id}).to_list(1000)
-
-    enriched_applications: list[dict] = []
-    for app in applications:
-        app_payload = {k: v for k, v in dict(app).items() if k != "_id"}
-        job = await db.jobs.find_one({"id": app_payload.get("job_id")})
-        company = await db.companies.find_one({"id": app_payload.get("company_id")}) if job else None
-        interviews = await db.interviews.find({"application_id": app_payload.get("id")}).to_list(100)
+async def get_my_applications(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_candidate: CandidateUser = Depends(get_current_candidate),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    applications, next_cursor = await paginate_find(
+        db.candidate_applications, {"candidate_id": current_candidate.id}, [("_id", 1)],
+        clamp_limit(limit), after, {"_id": 0},
+    )
+    set_next_cursor(response, next_cursor)
 
-        job_payload = {k: v for k, v in dict(job).items() if k != "_id"} if job else None
-        company_payload = {k: v for k, v in dict(company).items() if k != "_id"} if company else None
-        interviews_payload = [{k: v for k, v in dict(itm).items() if k != "_id"} for itm in interviews]
+    jobs, interviews_by_app = await asyncio.gather(
+        loader.load_many("jobs", (a.get("job_id") for a in applications)),
+        loader.load_grouped("interviews", (a.get("id") for a in applications), key="application_id"),
+    )
+    # Company is only resolved for applications whose job still exists
+    companies = await loader.load_many("companies", (a.get("company_id") for a in applications if a.get("job_id") in jobs))
 
+    enriched_applications: list[dict] = []
+    for app_payload in applications:
+        job_payload = jobs.get(app_payload.get("job_id"))
         enriched_applications.append({
             "application": app_payload,
             "job": job_payload,
-            "company": company_payload,
-            "interviews": interviews_payload
+            "company": companies.get(app_payload.get("company_id")) if job_payload else None,
+            "interviews": interviews_by_app.get(app_payload.get("id"), [])[:100]
         })
 
     return enriched_applications
 
 @api_router.get("/candidates/interviews")
-async def get_my_interviews(current_candidate: CandidateUser = Depends(get_current_candidate)):
-    interviews = await db.interviews.find({"candidate_id": current_candidate.id}).to_list(1000)
+async def get_my_interviews(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_candidate: CandidateUser = Depends(get_current_candidate),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    interviews, next_cursor = await paginate_find(
+        db.interviews, {"candidate_id": current_candidate.id}, [("_id", 1)], clamp_limit(limit), after, {"_id": 0}
+    )
+    set_next_cursor(response, next_cursor)
 
-    enriched_interviews: list[dict] = []
-    for iv in interviews:
-        iv_payload = {k: v for k, v in dict(iv).items() if k != "_id"}
-        application = await db.candidate_applications.find_one({"id": iv_payload.get("application_id")})
-        job = await db.jobs.find_one({"id": iv_payload.get("job_id")}) if application else None
-        company = await db.companies.find_one({"id": iv_payload.get("company_id")}) if job else None
+    applications, jobs, companies = await asyncio.gather(
+        loader.load_many("candidate_applications", (iv.get("application_id") for iv in interviews)),
+        loader.load_many("jobs", (iv.get("job_id") for iv in interviews)),
+        loader.load_many("companies", (iv.get("company_id") for iv in interviews)),
+    )
 
-        app_payload = {k: v for k, v in dict(application).items() if k != "_id"} if application else None
-        job_payload = {k: v for k, v in dict(job).items() if k != "_id"} if job else None
-        company_payload = {k: v for k, v in dict(company).items() if k != "_id"} if company else None
+    enriched_interviews: list[dict] = []
+    for iv_payload in interviews:
+        # Preserve the original chain: job requires an application, company requires a job
+        app_payload = applications.get(iv_payload.get("application_id"))
+        job_payload = jobs.get(iv_payload.get("job_id")) if app_payload else None
+        company_payload = companies.get(iv_payload.get("company_id")) if job_payload else None
 
         enriched_interviews.append({
             "interview": iv_payload,
@@ -2256,26 +4687,34 @@ async def get_my_interviews(current_candidate: CandidateUser = Depends(get_curre
 
 @api_router.get("/interviews/completed")
 async def get_completed_interviews(
-    current_recruiter: Recruiter = Depends(get_current_recruiter)
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
 ):
-    """Get recently completed interviews for a recruiter"""
-    interviews = await db.interviews.find({
-        "interviewer_id": current_recruiter.id,
-        "status": "completed"
-    }).sort("ended_at", -1).to_list(1000)
+    """Get recently completed interviews for a recruiter, newest first"""
+    interviews, next_cursor = await paginate_find(
+        db.interviews, {"interviewer_id": current_recruiter.id, "status": "completed"},
+        [("ended_at", -1), ("_id", -1)], clamp_limit(limit), after, {"_id": 0},
+    )
+    set_next_cursor(response, next_cursor)
+
+    # Enrich with candidate, job, application and aptitude results (one query per collection)
+    candidates, jobs, applications, results_by_interview = await asyncio.gather(
+        loader.load_many("candidates", (it.get("candidate_id") for it in interviews)),
+        loader.load_many("jobs", (it.get("job_id") for it in interviews)),
+        loader.load_many("candidate_applications", (it.get("application_id") for it in interviews)),
+        loader.load_grouped("round_results", (it.get("id") for it in interviews), key="interview_id", sort=[("round", 1)]),
+    )
 
-    # Enrich with candidate, job, application and aptitude results
     enriched_interviews = []
     for interview in interviews:
-        candidate = await db.candidates.find_one({"id": interview["candidate_id"]})
-        job = await db.jobs.find_one({"id": interview["job_id"]})
-        application = await db.candidate_applications.find_one({"id": interview.get("application_id")})
-
-        # Fetch round-wise aptitude results for this interview
-        round_results = await db.round_results.find({
-            "interview_id": interview["id"],
-            "candidate_id": interview["candidate_id"],
-        }).sort("round", 1).to_list(10)
+        candidate = candidates.get(interview["candidate_id"])
+        round_results = [
+            r for r in results_by_interview.get(interview["id"], [])
+            if r.get("candidate_id") == interview["candidate_id"]
+        ][:10]
 
         rounds_summary = [
             {
@@ -2286,27 +4725,14 @@ async def get_completed_interviews(
                 "roundStatus": r.get("roundStatus"),
                 "warnings": r.get("warnings", 0),
             }
-            for r in (round_results or [])
+            for r in round_results
         ]
 
-        # Remove MongoDB internal _id so FastAPI can serialize
-        interview = dict(interview)
-        interview.pop("_id", None)
-        if candidate:
-            candidate = dict(candidate)
-            candidate.pop("_id", None)
-        if job:
-            job = dict(job)
-            job.pop("_id", None)
-        if application:
-            application = dict(application)
-            application.pop("_id", None)
-
         enriched_interviews.append({
             "interview": interview,
             "candidate": candidate,
-            "job": job,
-            "application": application,
+            "job": jobs.get(interview["job_id"]),
+            "application": applications.get(interview.get("application_id")),
             "rounds": rounds_summary,
             "finalStatus": (candidate or {}).get("finalStatus"),
         })
@@ -2329,9 +4755,12 @@ async def update_candidate_profile(
         {"id": current_candidate.id},
         {"$set": profile_data}
     )
+    invalidate_principal(current_candidate.id)
     
     # Get updated candidate
     updated_candidate = await db.candidates.find_one({"id": current_candidate.id})
+    match_index.upsert_candidate(updated_candidate)
+    await note_match_change("candidate", current_candidate.id)
     return {"message": "Profile updated successfully", "user": CandidateUser(**updated_candidate)}
 
 # Clerk sync endpoint to provision candidate and mint app JWT
@@ -2363,6 +4792,8 @@ async def candidates_clerk_sync(payload: Dict[str, Any]):
         if clerk_user_id:
             doc["clerk_user_id"] = clerk_user_id
         await db.candidates.insert_one(doc)
+        match_index.upsert_candidate(doc)
+        await note_match_change("candidate", doc["id"])
         candidate_doc = doc
     else:
         update = {
@@ -2373,6 +4804,7 @@ async def candidates_clerk_sync(payload: Dict[str, Any]):
         if clerk_user_id:
             update["clerk_user_id"] = clerk_user_id
         await db.candidates.update_one({"id": existing["id"]}, {"$set": update})
+        invalidate_principal(existing["id"])
         candidate_doc = await db.candidates.find_one({"id": existing["id"]})
 
     # Clean and modelize
@@ -2433,6 +4865,7 @@ async def verify_account_otp(req: VerifyAccountOtpRequest):
         raise HTTPException(status_code=400, detail="Code expired")
     await db.email_verifications.update_one({"_id": doc["_id"]}, {"$set": {"is_verified": True}})
     await db.candidates.update_one({"id": candidate["id"]}, {"$set": {"is_email_verified": True}})
+    invalidate_principal(candidate["id"])
     # Mint fresh JWT after verification
     refreshed = await db.candidates.find_one({"id": candidate["id"]})
     refreshed.pop("_id", None)
@@ -2464,8 +4897,16 @@ async def candidate_has_password(current_candidate: CandidateUser = Depends(get_
     return {"hasPassword": bool(doc and doc.get("password"))}
 
 @api_router.get("/jobs", response_model=List[Job])
-async def get_company_jobs(current_recruiter: Recruiter = Depends(get_current_recruiter)):
-    jobs = await db.jobs.find({"company_id": current_recruiter.company_id}).to_list(1000)
+async def get_company_jobs(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    jobs, next_cursor = await paginate_find(
+        db.jobs, {"company_id": current_recruiter.company_id}, [("_id", 1)], clamp_limit(limit), after
+    )
+    set_next_cursor(response, next_cursor)
     return [Job(**job) for job in jobs]
 
 @api_router.post("/jobs", response_model=Job)
@@ -2502,6 +4943,8 @@ async def create_job(job_data: Dict[str, Any], current_recruiter: Recruiter = De
 
     job = Job(**doc)
     await db.jobs.insert_one(job.dict())
+    match_index.upsert_job(job.dict())
+    await note_match_change("job", job.id)
     return job
 
 @api_router.put("/jobs/{job_id}", response_model=Job)
@@ -2515,6 +4958,8 @@ async def update_job(job_id: str, job_data: Dict[str, Any], current_recruiter: R
     await db.jobs.update_one({"id": job_id}, {"$set": job_data})
     
     updated_job = await db.jobs.find_one({"id": job_id})
+    match_index.upsert_job(updated_job)
+    await note_match_change("job", job_id)
     return Job(**updated_job)
 
 @api_router.post("/jobs/{job_id}/publish")
@@ -2527,15 +4972,21 @@ async def publish_job(job_id: str, current_recruiter: Recruiter = Depends(get_cu
     
     if result.matched_count == 0:
         raise HTTPException(status_code=404, detail="Job not found")
+    await refresh_job_match(job_id)
+    await note_match_change("job", job_id)
     
     return {"message": "Job published successfully"}
 
 # Application Management Routes (Recruiter)
 @api_router.get("/applications")
 async def get_applications(
+    response: Response,
     job_id: Optional[str] = None,
     stage: Optional[PipelineStage] = None,
-    current_recruiter: Recruiter = Depends(get_current_recruiter)
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
 ):
     query = {"company_id": current_recruiter.company_id}
     
@@ -2544,13 +4995,20 @@ async def get_applications(
     if stage:
         query["stage"] = stage
     
-    applications = await db.candidate_applications.find(query).to_list(1000)
+    applications, next_cursor = await paginate_find(
+        db.candidate_applications, query, [("_id", 1)], clamp_limit(limit), after, {"_id": 0}
+    )
+    set_next_cursor(response, next_cursor)
     
     # Enrich with candidate and job data
+    candidates, jobs = await asyncio.gather(
+        loader.load_many("candidates", (a.get("candidate_id") for a in applications)),
+        loader.load_many("jobs", (a.get("job_id") for a in applications)),
+    )
     enriched_applications = []
     for app in applications:
-        candidate = await db.candidates.find_one({"id": app["candidate_id"]})
-        job = await db.jobs.find_one({"id": app["job_id"]})
+        candidate = candidates.get(app["candidate_id"])
+        job = jobs.get(app["job_id"])
         
         enriched_applications.append({
             "application": CandidateApplication(**app),
@@ -2578,9 +5036,15 @@ async def move_application_stage(
 
 
 @api_router.get("/candidates")
-async def list_candidates(current_recruiter: Recruiter = Depends(get_current_recruiter)):
-    """List candidates visible to the recruiter. MVP returns all candidates."""
-    candidates = await db.candidates.find({}).to_list(1000)
+async def list_candidates(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    """List candidates visible to the recruiter. MVP returns all candidates, a page at a time."""
+    candidates, next_cursor = await paginate_find(db.candidates, {}, [("_id", 1)], clamp_limit(limit), after)
+    set_next_cursor(response, next_cursor)
     result = []
     for c in candidates:
         # Remove MongoDB internal id which is not JSON serializable
@@ -2653,6 +5117,9 @@ async def add_note(
 @api_router.get("/applications/{application_id}/notes", response_model=List[Note])
 async def get_application_notes(
     application_id: str,
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
     current_recruiter: Recruiter = Depends(get_current_recruiter)
 ):
     # Verify application exists and belongs to company
@@ -2663,73 +5130,150 @@ async def get_application_notes(
     if not application:
         raise HTTPException(status_code=404, detail="Application not found")
     
-    notes = await db.notes.find({"application_id": application_id}).to_list(1000)
+    notes, next_cursor = await paginate_find(
+        db.notes, {"application_id": application_id}, [("_id", 1)], clamp_limit(limit), after
+    )
+    set_next_cursor(response, next_cursor)
     return [Note(**note) for note in notes]
 
 # Analytics Dashboard
-@api_router.get("/analytics/dashboard")
-async def get_analytics_dashboard(current_recruiter: Recruiter = Depends(get_current_recruiter)):
-    company_id = current_recruiter.company_id
-    
-    # Get basic stats
-    total_jobs = await db.jobs.count_documents({"company_id": company_id})
-    active_jobs = await db.jobs.count_documents({"company_id": company_id, "status": "active"})
-    total_candidates = await db.candidates.count_documents({})
-    total_applications = await db.candidate_applications.count_documents({"company_id": company_id})
-    
-    # Pipeline stats
-    pipeline_stages = {}
-    for stage in PipelineStage:
-        count = await db.candidate_applications.count_documents({
-            "company_id": company_id, 
-            "stage": stage.value
-        })
-        pipeline_stages[stage.value] = count
-    
-    # Recent activity (last 30 days)
-    from datetime import timedelta
-    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
-    
-    recent_applications = await db.candidate_applications.count_documents({
-        "company_id": company_id,
-        "applied_date": {"$gte": thirty_days_ago}
-    })
-    
-    recent_hires = await db.candidate_applications.count_documents({
+# Per-company rollups (company_rollups) hold aptitude round totals. They are seeded from
+# an aggregation on first read and then kept current with $inc by submit_round; the
+# regrade job drops them so they are re-seeded. Pipeline stage counts are not rolled up:
+# they come from the $facet over candidate_applications on every request.
+async def _bump_company_rollup(company_id: Optional[str], inc: Dict[str, Any]) -> None:
+    """Apply $inc deltas to an existing rollup. No-op until the dashboard has seeded it."""
+    inc = {k: v for k, v in inc.items() if v}
+    if not company_id or not inc:
+        return
+    try:
+        await db.company_rollups.update_one(
+            {"company_id": company_id},
+            {"$inc": inc, "$set": {"updated_at": datetime.now(timezone.utc)}},
+        )
+    except Exception as e:
+        logging.warning(f"company rollup update failed for {company_id}: {e}")
+
+
+async def _rebuild_company_rollup(company_id: str, overwrite: bool = False) -> Dict[str, Any]:
+    """Recompute a company's rollup from round_results and store it.
+
+    The first seed uses $setOnInsert, so a rollup created concurrently (and any $inc
+    applied to it since) wins over this snapshot; overwrite=True replaces it outright.
+    """
+    aptitude_rows = await db.interviews.aggregate([
+        {"$match": {"company_id": company_id}},
+        {"$project": {"_id": 0, "id": 1, "candidate_id": 1}},
+        {"$lookup": {"from": "round_results", "localField": "id", "foreignField": "interview_id", "as": "rr"}},
+        {"$unwind": "$rr"},
+        {"$match": {"$expr": {"$eq": ["$rr.candidate_id", "$candidate_id"]}}},
+        {"$group": {
+            "_id": "$rr.round",
+            "submissions": {"$sum": 1},
+            "passed": {"$sum": {"$cond": [{"$eq": ["$rr.roundStatus", "Passed"]}, 1, 0]}},
+            "percentage_sum": {"$sum": {"$ifNull": ["$rr.percentage", 0]}},
+        }},
+    ]).to_list(None)
+    rollup = {
         "company_id": company_id,
-        "stage": "hired",
-        "last_updated": {"$gte": thirty_days_ago}
-    })
+        "aptitude": {
+            str(row["_id"]): {
+                "submissions": int(row["submissions"]),
+                "passed": int(row["passed"]),
+                "percentage_sum": float(row["percentage_sum"]),
+            }
+            for row in aptitude_rows if row.get("_id") is not None
+        },
+        "updated_at": datetime.now(timezone.utc),
+    }
+    if overwrite:
+        await db.company_rollups.update_one({"company_id": company_id}, {"$set": rollup}, upsert=True)
+        return rollup
+    stored = await db.company_rollups.find_one_and_update(
+        {"company_id": company_id},
+        {"$setOnInsert": rollup},
+        upsert=True,
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER,
+    )
+    return stored or rollup
 
-    # Per-interview aptitude performance for this company
-    interviews = await db.interviews.find({"company_id": company_id}).to_list(1000)
-    interview_summaries = []
-    for it in interviews:
-        interview_id = it.get("id")
-        candidate_id = it.get("candidate_id")
-        if not interview_id or not candidate_id:
-            continue
 
-        candidate = await db.candidates.find_one({"id": candidate_id})
+@api_router.get("/analytics/dashboard")
+async def get_analytics_dashboard(
+    refresh: bool = False,
+    current_recruiter: Recruiter = Depends(get_current_recruiter),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
+):
+    """Company overview, pipeline and per-interview aptitude summaries.
+    Raw answers are served separately by /analytics/dashboard/answers.
+    """
+    company_id = current_recruiter.company_id
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
 
-        # Round-wise results (scores, percentage, status, warnings)
-        round_results = await db.round_results.find({
-            "interview_id": interview_id,
-            "candidate_id": candidate_id,
-        }).sort("round", 1).to_list(10)
+    # Overview, stage counts and recent activity in one round trip per collection
+    application_facets = [
+        {"$match": {"company_id": company_id}},
+        {"$facet": {
+            "total": [{"$count": "n"}],
+            "stages": [{"$group": {"_id": "$stage", "n": {"$sum": 1}}}],
+            "recent_applications": [{"$match": {"applied_date": {"$gte": thirty_days_ago}}}, {"$count": "n"}],
+            "recent_hires": [
+                {"$match": {"stage": "hired", "last_updated": {"$gte": thirty_days_ago}}},
+                {"$count": "n"},
+            ],
+        }},
+    ]
+    job_totals = [
+        {"$match": {"company_id": company_id}},
+        {"$group": {
+            "_id": None,
+            "total": {"$sum": 1},
+            "active": {"$sum": {"$cond": [{"$eq": ["$status", "active"]}, 1, 0]}},
+        }},
+    ]
+    rollup, app_stats, job_stats, total_candidates, interviews = await asyncio.gather(
+        db.company_rollups.find_one({"company_id": company_id}, {"_id": 0}),
+        db.candidate_applications.aggregate(application_facets).to_list(1),
+        db.jobs.aggregate(job_totals).to_list(1),
+        db.candidates.estimated_document_count(),
+        db.interviews.find({"company_id": company_id}, {"_id": 0}).to_list(1000),
+    )
 
-        # All MCQ answers for this interview
-        answers = await db.candidate_answers.find({
-            "interview_id": interview_id,
-            "candidate_id": candidate_id,
-        }).sort("timestamp", 1).to_list(2000)
+    facets = app_stats[0] if app_stats else {}
+    jobs_row = job_stats[0] if job_stats else {}
+
+    def facet_count(name: str) -> int:
+        rows = facets.get(name) or []
+        return int(rows[0]["n"]) if rows else 0
+
+    if rollup is None or refresh:
+        rollup = await _rebuild_company_rollup(company_id, overwrite=refresh)
+
+    stage_counts = {row["_id"]: int(row["n"]) for row in (facets.get("stages") or []) if row.get("_id")}
+    pipeline_stages = {stage.value: stage_counts.get(stage.value, 0) for stage in PipelineStage}
+    aptitude = {}
+    for round_key, stats in sorted((rollup.get("aptitude") or {}).items()):
+        submissions = int(stats.get("submissions", 0) or 0)
+        aptitude[round_key] = {
+            "submissions": submissions,
+            "passed": int(stats.get("passed", 0) or 0),
+            "pass_rate": round(stats.get("passed", 0) / submissions * 100.0, 2) if submissions else 0.0,
+            "avg_percentage": round(stats.get("percentage_sum", 0.0) / submissions, 2) if submissions else 0.0,
+        }
 
-        def strip_id(doc):
-            if not isinstance(doc, dict):
-                return doc
-            d = dict(doc)
-            d.pop("_id", None)
-            return d
+    # Per-interview aptitude performance for this company (batched enrichment)
+    interviews = [it for it in interviews if it.get("id") and it.get("candidate_id")]
+    candidates, results_by_interview = await asyncio.gather(
+        loader.load_many("candidates", (it["candidate_id"] for it in interviews)),
+        loader.load_grouped("round_results", (it["id"] for it in interviews), key="interview_id", sort=[("round", 1)]),
+    )
+    interview_summaries = []
+    for it in interviews:
+        interview_id = it["id"]
+        candidate_id = it["candidate_id"]
+        candidate = candidates.get(candidate_id)
+        round_results = [r for r in results_by_interview.get(interview_id, []) if r.get("candidate_id") == candidate_id][:10]
 
         rounds_payload = [
             {
@@ -2742,10 +5286,10 @@ async def get_analytics_dashboard(current_recruiter: Recruiter = Depends(get_cur
                 "duration_sec": r.get("duration_sec", 0),
                 "updated_at": r.get("updated_at"),
             }
-            for r in (round_results or [])
+            for r in round_results
         ]
 
-        warnings_total = sum(int(r.get("warnings", 0) or 0) for r in (round_results or []))
+        warnings_total = sum(int(r.get("warnings", 0) or 0) for r in round_results)
 
         interview_summaries.append(
             {
@@ -2756,27 +5300,728 @@ async def get_analytics_dashboard(current_recruiter: Recruiter = Depends(get_cur
                 "status": it.get("status"),
                 "finalStatus": (candidate or {}).get("finalStatus"),
                 "rounds": rounds_payload,
-                "answers": [strip_id(a) for a in (answers or [])],
                 "total_warnings": warnings_total,
             }
         )
 
     return {
         "overview": {
-            "total_jobs": total_jobs,
-            "active_jobs": active_jobs,
+            "total_jobs": int(jobs_row.get("total", 0)),
+            "active_jobs": int(jobs_row.get("active", 0)),
             "total_candidates": total_candidates,
-            "total_applications": total_applications,
+            "total_applications": facet_count("total"),
         },
         "pipeline": pipeline_stages,
         "recent_activity": {
-            "applications_30_days": recent_applications,
-            "hires_30_days": recent_hires,
+            "applications_30_days": facet_count("recent_applications"),
+            "hires_30_days": facet_count("recent_hires"),
         },
+        "aptitude": aptitude,
         "interviews": interview_summaries,
     }
 
+
+@api_router.get("/analytics/dashboard/answers")
+async def get_analytics_dashboard_answers(
+    interview_id: str,
+    limit: int = 200,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    """Raw MCQ answers for one interview, in submission order.
+    Paginated: pass `next_cursor` back as `after`.
+    """
+    interview = await db.interviews.find_one({"id": interview_id, "company_id": current_recruiter.company_id})
+    if not interview:
+        raise HTTPException(status_code=404, detail="Interview not found")
+
+    answers, next_cursor = await paginate_find(
+        db.candidate_answers, {"interview_id": interview_id, "candidate_id": interview.get("candidate_id")},
+        [("_id", 1)], clamp_limit(limit), after, {"_id": 0},
+    )
+    return {"interview_id": interview_id, "answers": answers, "next_cursor": next_cursor}
+
+# ----------------------
+# Aptitude regrading
+# ----------------------
+# When an answer key is corrected, regrade_round() rescores every stored attempt for that
+# round. It streams candidate_answers in (interview, candidate, timestamp) order, keeps
+# the latest attempt per candidate, grades REGRADE_BATCH_SIZE attempts at a time with
+# CompiledRound.grade_batch, and rewrites round_results (plus the is_correct flags) with
+# bulk writes. Affected company rollups are dropped so the dashboard rebuilds them.
+# Background jobs (start_regrade) run one per round: a partial unique index on
+# regrade_jobs.round covers running jobs. A running job writes heartbeat_at (and its
+# progress) every REGRADE_HEARTBEAT_SECONDS; one whose worker died stops beating and is
+# marked failed once REGRADE_STALE_SECONDS pass, which frees the round again.
+REGRADE_BATCH_SIZE = 2000
+REGRADE_HEARTBEAT_SECONDS = 15
+REGRADE_STALE_SECONDS = 120
+_regrade_tasks: set = set()
+
+
+async def _apply_regrade_batch(compiled: CompiledRound, attempts: List[tuple], stats: Dict[str, int]) -> tuple:
+    """Grade a batch of (interview_id, candidate_id, [(question_id, selected_option)]) and persist it.
+    Returns (interview ids with changed results, {(interview_id, candidate_id): new roundStatus} for flips).
+
+    Questions score exactly as in submit_round: a sampled interview only on its drawn
+    positions, an unsampled one only on the first `sample_size` pool positions."""
+    interview_ids = list({a[0] for a in attempts})
+    field = f"question_samples.{compiled.round}"
+    existing, sampled = await asyncio.gather(
+        db.round_results.find(
+            {"interview_id": {"$in": interview_ids}, "round": compiled.round},
+            {"_id": 0, "interview_id": 1, "candidate_id": 1, "correctAnswers": 1, "roundStatus": 1},
+        ).to_list(None),
+        db.interviews.find(
+            {"id": {"$in": interview_ids}, field: {"$exists": True}}, {"_id": 0, "id": 1, f"{field}.order": 1}
+        ).to_list(None),
+    )
+    previous = {(r["interview_id"], r["candidate_id"]): r for r in existing}
+    papers = {
+        doc["id"]: set(np.frombuffer(bytes(doc["question_samples"][str(compiled.round)]["order"]), dtype="<i2").tolist())
+        for doc in sampled
+    }
+
+    submission, positions, selected = [], [], []
+    for i, (interview_id, _, rows) in enumerate(attempts):
+        paper = papers.get(interview_id)
+        for qid, option in rows:
+            position = compiled.positions.get(qid, -1)
+            if paper is None:
+                position = position if position < compiled.sample_size else -1
+            elif position not in paper:
+                position = -1
+            submission.append(i)
+            positions.append(position)
+            selected.append(option_index(option))
+    _, correct = compiled.grade_batch(submission, positions, selected, len(attempts))
+
+    now = datetime.now(timezone.utc)
+    ops = []
+    changed = set()
+    flipped: Dict[tuple, str] = {}
+    for (interview_id, candidate_id, _), correct_count in zip(attempts, correct.tolist()):
+        old = previous.get((interview_id, candidate_id))
+        if old is None:
+            continue
+        paper = papers.get(interview_id)
+        total_questions = len(paper) if paper is not None else compiled.sample_size
+        wrong_count, percentage, round_status = round_outcome(correct_count, total_questions)
+        if old.get("correctAnswers") == correct_count and old.get("roundStatus") == round_status:
+            continue
+        changed.add(interview_id)
+        if old.get("roundStatus") != round_status:
+            flipped[(interview_id, candidate_id)] = round_status
+        ops.append(UpdateOne(
+            {"interview_id": interview_id, "candidate_id": candidate_id, "round": compiled.round},
+            {"$set": {
+                "correctAnswers": correct_count,
+                "wrongAnswers": wrong_count,
+                "percentage": percentage,
+                "roundStatus": round_status,
+                "regraded_at": now,
+            }},
+        ))
+    if ops:
+        await db.round_results.bulk_write(ops, ordered=False)
+    if flipped:
+        # Keep the interview's round -> roundStatus map (read by submitRound) in step
+        await db.interviews.bulk_write([
+            UpdateOne(
+                {"id": interview_id, "candidate_id": candidate_id},
+                {"$set": {f"round_statuses.{compiled.round}": round_status}},
+            )
+            for (interview_id, candidate_id), round_status in flipped.items()
+        ], ordered=False)
+    stats["attempts"] += len(attempts)
+    stats["changed"] += len(ops)
+    stats["status_flips"] += len(flipped)
+    return changed, flipped
+
+
+async def regrade_round(round_num: int, progress: Optional[Dict[str, int]] = None) -> Dict[str, int]:
+    """Rescore every latest attempt of `round_num` against the current answer key."""
+    compiled = COMPILED_ROUNDS.get(round_num)
+    if compiled is None:
+        raise ValueError(f"unknown round {round_num}")
+    stats = progress if progress is not None else {}
+    stats.update({"attempts": 0, "changed": 0, "status_flips": 0, "answers_relabelled": 0})
+
+    # Fix the per-answer flags first: one update per (question, option) pair that can be right
+    flag_ops = []
+    for qid, key in zip(compiled.question_ids, compiled.answer_key.tolist()):
+        base = {"round": round_num, "question_id": qid, "off_paper": {"$ne": True}}
+        flag_ops.append(UpdateMany({**base, "selected_option": key, "is_correct": {"$ne": True}}, {"$set": {"is_correct": True}}))
+        flag_ops.append(UpdateMany({**base, "selected_option": {"$ne": key}, "is_correct": True}, {"$set": {"is_correct": False}}))
+    flags = await db.candidate_answers.bulk_write(flag_ops, ordered=False)
+    stats["answers_relabelled"] = flags.modified_count
+
+    touched_interviews: set = set()
+    flipped: Dict[tuple, str] = {}
+    batch: List[tuple] = []
+    current: Optional[tuple] = None
+    rows: List[tuple] = []
+    attempt_ts = None
+    cursor = db.candidate_answers.find(
+        {"round": round_num},
+        {"_id": 0, "interview_id": 1, "candidate_id": 1, "question_id": 1, "selected_option": 1, "timestamp": 1,
+         "off_paper": 1},
+    ).sort([("round", 1), ("interview_id", 1), ("candidate_id", 1), ("timestamp", 1)])
+    async for doc in cursor:
+        owner = (doc.get("interview_id"), doc.get("candidate_id"))
+        if owner != current:
+            if current is not None:
+                batch.append((*current, rows))
+            current, rows, attempt_ts = owner, [], doc.get("timestamp")
+        elif doc.get("timestamp") != attempt_ts:
+            # A newer attempt replaces the earlier one
+            rows, attempt_ts = [], doc.get("timestamp")
+        # Off-paper answers still mark the attempt but never score
+        question_id = None if doc.get("off_paper") else doc.get("question_id")
+        rows.append((question_id, coerce_selected_option(doc.get("selected_option"))))
+        if len(batch) >= REGRADE_BATCH_SIZE:
+            changed, flips = await _apply_regrade_batch(compiled, batch, stats)
+            touched_interviews |= changed
+            flipped |= flips
+            batch = []
+    if current is not None:
+        batch.append((*current, rows))
+    if batch:
+        changed, flips = await _apply_regrade_batch(compiled, batch, stats)
+        touched_interviews |= changed
+        flipped |= flips
+
+    if touched_interviews:
+        interviews = await db.interviews.find(
+            {"id": {"$in": list(touched_interviews)}}, {"_id": 0, "id": 1, "company_id": 1, "candidate_id": 1, "status": 1}
+        ).to_list(None)
+        company_ids = list({it.get("company_id") for it in interviews if it.get("company_id")})
+        if company_ids:
+            await db.company_rollups.delete_many({"company_id": {"$in": company_ids}})
+        # finalStatus is only decided once the interview is over
+        for it in interviews:
+            if it.get("status") == "completed" and (it["id"], it.get("candidate_id")) in flipped:
+                await refresh_final_status(it["id"], it["candidate_id"])
+    return stats
+
+
+async def _regrade_heartbeat(job_id: str, progress: Dict[str, int]) -> None:
+    while True:
+        await asyncio.sleep(REGRADE_HEARTBEAT_SECONDS)
+        try:
+            await db.regrade_jobs.update_one({"id": job_id, "status": "running"}, {"$set": {
+                "heartbeat_at": datetime.now(timezone.utc), "stats": dict(progress),
+            }})
+        except Exception as e:
+            logging.warning(f"Regrade job {job_id} heartbeat failed: {e}")
+
+
+async def _run_regrade_job(job_id: str, round_num: int) -> None:
+    progress: Dict[str, int] = {}
+    heartbeat = asyncio.create_task(_regrade_heartbeat(job_id, progress))
+    try:
+        stats = await regrade_round(round_num, progress)
+        result = {"status": "completed", "stats": stats}
+    except Exception as e:
+        logging.error(f"Regrade job {job_id} failed: {e}")
+        result = {"status": "failed", "error": str(e)[:500], "stats": progress}
+    finally:
+        heartbeat.cancel()
+    await db.regrade_jobs.update_one({"id": job_id}, {"$set": {**result, "finished_at": datetime.now(timezone.utc)}})
+
+
+async def _expire_stale_regrade_jobs(query: Dict[str, Any]) -> None:
+    """Mark running jobs matching `query` whose heartbeat stopped as failed."""
+    now = datetime.now(timezone.utc)
+    await db.regrade_jobs.update_many(
+        {**query, "status": "running", "heartbeat_at": {"$lt": now - timedelta(seconds=REGRADE_STALE_SECONDS)}},
+        {"$set": {"status": "failed", "error": "worker stopped (no heartbeat)", "finished_at": now}},
+    )
+
+
+@api_router.post("/interview/rounds/{round_num}/regrade")
+async def start_regrade(round_num: int, current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    """Regrade all stored submissions for a round in the background. Admins only."""
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can regrade rounds")
+    if round_num not in COMPILED_ROUNDS:
+        raise HTTPException(status_code=400, detail="invalid round")
+    await _expire_stale_regrade_jobs({"round": round_num})
+    running = await db.regrade_jobs.find_one({"round": round_num, "status": "running"}, {"_id": 0, "id": 1})
+    now = datetime.now(timezone.utc)
+    job = {
+        "id": str(uuid.uuid4()),
+        "round": round_num,
+        "status": "running",
+        "requested_by": current_recruiter.id,
+        "started_at": now,
+        "heartbeat_at": now,
+    }
+    if running is None:
+        try:
+            await db.regrade_jobs.insert_one(dict(job))
+        except DuplicateKeyError:
+            # Another worker started one between the check and the insert
+            running = await db.regrade_jobs.find_one({"round": round_num, "status": "running"}, {"_id": 0, "id": 1}) or {}
+    if running is not None:
+        raise HTTPException(status_code=409, detail={
+            "message": f"A regrade of round {round_num} is already running", "job_id": running.get("id"),
+        })
+    task = asyncio.create_task(_run_regrade_job(job["id"], round_num))
+    _regrade_tasks.add(task)
+    task.add_done_callback(_regrade_tasks.discard)
+    return job
+
+
+@api_router.get("/interview/regrade-jobs/{job_id}")
+async def get_regrade_job(job_id: str, current_recruiter: Recruiter = Depends(get_current_recruiter)):
+    """Status of a regrade job started with start_regrade. Admins only."""
+    if current_recruiter.role != "admin":
+        raise HTTPException(status_code=403, detail="Only admins can view regrade jobs")
+    await _expire_stale_regrade_jobs({"id": job_id})
+    job = await db.regrade_jobs.find_one({"id": job_id}, {"_id": 0})
+    if not job:
+        raise HTTPException(status_code=404, detail="Regrade job not found")
+    return job
+
+
+async def regrade_round_cli(round_num: int) -> int:
+    """python server.py --regrade-round N"""
+    started = time.perf_counter()
+    stats = await regrade_round(round_num)
+    print(f"round {round_num}: {stats} in {time.perf_counter() - started:.1f}s")
+    return 0
+
+
+# ----------------------
+# Item analysis
+# ----------------------
+# Per-question statistics over candidate_answers for one round: difficulty (p-value, the
+# share of candidates shown the question who answered it correctly), discrimination (upper
+# minus lower 27% by round score), time spent and how often each option was picked.
+# MongoDB collapses the answers to each candidate's latest answer per question with a
+# streaming $group; the statistics are then computed with NumPy over the grouped rows.
+# Correctness is re-derived from the current answer key, so a result belongs to one bank
+# version (CompiledRound.version) and is cached per (round, version).
+ITEM_ANALYSIS_MAX_AGE_SECONDS = int(os.getenv("ITEM_ANALYSIS_MAX_AGE_SECONDS", "900"))
+ITEM_ANALYSIS_GROUP_FRACTION = 0.27
+item_analysis_cache = TTLCache(maxsize=32, ttl=ITEM_ANALYSIS_MAX_AGE_SECONDS)
+
+
+def _item_flags(p_value: float, discrimination: Optional[float], key_share: float, top_distractor_share: float) -> List[str]:
+    flags = []
+    if p_value < 0.2:
+        flags.append("too_hard")
+    elif p_value > 0.95:
+        flags.append("too_easy")
+    if discrimination is not None:
+        if discrimination < 0:
+            flags.append("negative_discrimination")
+        elif discrimination < 0.2:
+            flags.append("low_discrimination")
+    if top_distractor_share > key_share:
+        # More candidates agree on a wrong option than on the key: often a wrong key
+        flags.append("key_suspect")
+    return flags
+
+
+async def compute_item_analysis(round_num: int) -> Dict[str, Any]:
+    compiled = COMPILED_ROUNDS.get(round_num)
+    if compiled is None:
+        raise ValueError(f"unknown round {round_num}")
+    started = time.perf_counter()
+    pipeline = [
+        {"$match": {"round": round_num, "question_id": {"$in": list(compiled.question_ids)}, "off_paper": {"$ne": True}}},
+        {"$sort": {"round": 1, "interview_id": 1, "candidate_id": 1, "timestamp": 1}},
+        {"$group": {
+            "_id": {"i": "$interview_id", "c": "$candidate_id", "q": "$question_id"},
+            "selected_option": {"$last": "$selected_option"},
+            "time_spent_sec": {"$last": "$time_spent_sec"},
+            "timestamp": {"$last": "$timestamp"},
+        }},
+    ]
+    takers: Dict[tuple, int] = {}
+    taker_col: List[int] = []
+    position_col: List[int] = []
+    option_col: List[int] = []
+    seconds_col: List[float] = []
+    stamp_col: List[float] = []
+    answers = 0
+    async for row in db.candidate_answers.aggregate(pipeline, allowDiskUse=True, batchSize=10000):
+        answers += 1
+        owner = (row["_id"].get("i"), row["_id"].get("c"))
+        taker_col.append(takers.setdefault(owner, len(takers)))
+        position_col.append(compiled.positions[row["_id"]["q"]])
+        option_col.append(option_index(coerce_selected_option(row.get("selected_option"))))
+        spent = row.get("time_spent_sec")
+        seconds_col.append(float(spent) if isinstance(spent, (int, float)) and not isinstance(spent, bool) else np.nan)
+        stamp = row.get("timestamp")
+        stamp_col.append(stamp.timestamp() if isinstance(stamp, datetime) else 0.0)
+
+    n_takers = len(takers)
+    n_questions = compiled.count
+    taker = np.asarray(taker_col, dtype=np.int64)
+    position = np.asarray(position_col, dtype=np.int64)
+    option = np.asarray(option_col, dtype=np.int64)
+    seconds = np.asarray(seconds_col, dtype=np.float64)
+    stamp = np.asarray(stamp_col, dtype=np.float64)
+
+    # Keep only each candidate's latest attempt (questions it skipped are not carried over)
+    if n_takers:
+        latest = np.full(n_takers, -np.inf)
+        np.maximum.at(latest, taker, stamp)
+        keep = stamp == latest[taker]
+        taker, position, option, seconds = taker[keep], position[keep], option[keep], seconds[keep]
+
+    # Which pool questions each candidate was shown: their stored sample, or the fixed paper.
+    # Exposure is kept as (taker, position) pairs for sampled papers plus a mask of takers on
+    # the fixed paper, so counting it never needs a takers x questions matrix.
+    takers_by_interview: Dict[str, List[int]] = {}
+    for (interview_id, _), idx in takers.items():
+        takers_by_interview.setdefault(interview_id, []).append(idx)
+    interview_ids = list(takers_by_interview)
+    fixed_paper = np.ones(n_takers, dtype=bool)
+    sampled_takers: List[np.ndarray] = []
+    sampled_positions: List[np.ndarray] = []
+    field = f"question_samples.{round_num}"
+    for start in range(0, len(interview_ids), 1000):
+        async for it in db.interviews.find(
+            {"id": {"$in": interview_ids[start:start + 1000]}, field: {"$exists": True}}, {"_id": 0, "id": 1, field: 1}
+        ):
+            drawn = RoundSample.from_doc(compiled, it["question_samples"][str(round_num)]).order.astype(np.int64)
+            for idx in takers_by_interview[it["id"]]:
+                fixed_paper[idx] = False
+                sampled_takers.append(np.full(drawn.size, idx, dtype=np.int64))
+                sampled_positions.append(drawn)
+    sampled_taker = np.concatenate(sampled_takers) if sampled_takers else np.zeros(0, dtype=np.int64)
+    sampled_position = np.concatenate(sampled_positions) if sampled_positions else np.zeros(0, dtype=np.int64)
+
+    def shown(takers_mask: np.ndarray) -> np.ndarray:
+        """How many of the masked takers were shown each pool question."""
+        counts = np.bincount(sampled_position[takers_mask[sampled_taker]], minlength=n_questions)
+        counts[:compiled.sample_size] += int(np.count_nonzero(takers_mask & fixed_paper))
+        return counts
+
+    seen = shown(np.ones(n_takers, dtype=bool))
+
+    row_correct, scores = compiled.grade_batch(taker, position, option, n_takers)
+    answered = np.bincount(position[option >= 0], minlength=n_questions)
+    correct = np.bincount(position[row_correct], minlength=n_questions)
+    p_values = correct / np.maximum(seen, 1)
+
+    discrimination = None
+    if n_takers >= 2:
+        group = max(1, int(round(n_takers * ITEM_ANALYSIS_GROUP_FRACTION)))
+        order = np.argsort(scores, kind="stable")
+        band = np.zeros(n_takers, dtype=np.int8)
+        band[order[:group]] = -1
+        band[order[-group:]] = 1
+        upper = np.bincount(position[row_correct & (band[taker] == 1)], minlength=n_questions)
+        lower = np.bincount(position[row_correct & (band[taker] == -1)], minlength=n_questions)
+        discrimination = (upper / np.maximum(shown(band == 1), 1)
+                          - lower / np.maximum(shown(band == -1), 1))
+
+    width = max(int(compiled.option_counts.max(initial=0)), int(option.max(initial=-1)) + 1, 1)
+    picked = option >= 0
+    option_counts = np.bincount(
+        position[picked] * width + np.minimum(option[picked], width - 1), minlength=n_questions * width
+    ).reshape(n_questions, width)
+
+    # Timing: sort once by (question, seconds) and slice each question's run
+    timed = np.isfinite(seconds)
+    by_question = np.lexsort((seconds[timed], position[timed]))
+    timed_positions = position[timed][by_question]
+    timed_seconds = seconds[timed][by_question]
+    bounds = np.searchsorted(timed_positions, np.arange(n_questions + 1))
+
+    questions = compiled.questions
+    items = []
+    for i, qid in enumerate(compiled.question_ids):
+        key = int(compiled.answer_key[i])
+        spent = timed_seconds[bounds[i]:bounds[i + 1]]
+        n_answered = int(answered[i])
+        options_payload = [
+            {
+                "option": o,
+                "count": int(option_counts[i, o]),
+                "share": round(float(option_counts[i, o]) / n_answered, 4) if n_answered else 0.0,
+                "is_key": o == key,
+            }
+            for o in range(max(int(compiled.option_counts[i]), 1))
+        ]
+        distractor_shares = [o["share"] for o in options_payload if not o["is_key"]]
+        key_share = next((o["share"] for o in options_payload if o["is_key"]), 0.0)
+        d_value = round(float(discrimination[i]), 4) if discrimination is not None else None
+        items.append({
+            "question_id": qid,
+            "position": i,
+            "text": questions[i].get("text"),
+            "correct_index": key,
+            "answered": n_answered,
+            "seen": int(seen[i]),
+            "omitted": int(seen[i]) - n_answered,
+            "p_value": round(float(p_values[i]), 4),
+            "discrimination": d_value,
+            "time_spent_sec": {
+                "samples": int(spent.size),
+                "mean": round(float(spent.mean()), 2) if spent.size else None,
+                "p50": round(float(np.percentile(spent, 50)), 2) if spent.size else None,
+                "p90": round(float(np.percentile(spent, 90)), 2) if spent.size else None,
+            },
+            "options": options_payload,
+            "flags": _item_flags(float(p_values[i]), d_value, key_share, max(distractor_shares, default=0.0)) if seen[i] else [],
+        })
+
+    return {
+        "round": round_num,
+        "bank_version": compiled.version,
+        "takers": n_takers,
+        "answers": answers,
+        "mean_score": round(float(scores.mean()), 3) if n_takers else None,
+        "items": items,
+        "computed_at": datetime.now(timezone.utc),
+        "compute_ms": round((time.perf_counter() - started) * 1000, 1),
+    }
+
+
+async def get_item_analysis(round_num: int, refresh: bool = False) -> Dict[str, Any]:
+    """Item analysis for the current bank version of a round: in-process cache, then the
+    item_analysis collection, then a fresh computation (each no older than the max age)."""
+    compiled = COMPILED_ROUNDS[round_num]
+    cache_key = (round_num, compiled.version)
+    if not refresh:
+        cached = item_analysis_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        stored = await db.item_analysis.find_one(
+            {"round": round_num, "bank_version": compiled.version}, {"_id": 0}
+        )
+        computed_at = (stored or {}).get("computed_at")
+        if computed_at is not None:
+            if computed_at.tzinfo is None:
+                computed_at = stored["computed_at"] = computed_at.replace(tzinfo=timezone.utc)
+            age = (datetime.now(timezone.utc) - computed_at).total_seconds()
+            if age < ITEM_ANALYSIS_MAX_AGE_SECONDS:
+                item_analysis_cache.set(cache_key, stored, ttl=ITEM_ANALYSIS_MAX_AGE_SECONDS - age)
+                return stored
+    result = await compute_item_analysis(round_num)
+    await db.item_analysis.replace_one(
+        {"round": round_num, "bank_version": compiled.version}, dict(result), upsert=True
+    )
+    item_analysis_cache.set(cache_key, result)
+    return result
+
+
+@api_router.get("/analytics/item-analysis")
+async def item_analysis(
+    round: int,
+    refresh: bool = False,
+    flagged_only: bool = False,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    """Per-question difficulty, discrimination, timing and distractor statistics for a round,
+    across all candidates. Cached for ITEM_ANALYSIS_MAX_AGE_SECONDS; `refresh=true` recomputes."""
+    if round not in COMPILED_ROUNDS:
+        raise HTTPException(status_code=400, detail="invalid round")
+    result = await get_item_analysis(round, refresh=refresh)
+    if flagged_only:
+        result = {**result, "items": [it for it in result["items"] if it["flags"]]}
+    return result
+
+
+async def item_analysis_cli(round_num: int) -> int:
+    """python server.py --item-analysis N: print the questions worth a second look."""
+    result = await get_item_analysis(round_num, refresh=True)
+    print(f"round {round_num} (bank {result['bank_version']}): {result['takers']} candidates, "
+          f"{result['answers']} answers in {result['compute_ms']} ms")
+    for it in result["items"]:
+        if it["flags"]:
+            print(f"  {it['question_id']:>6}  p={it['p_value']:.2f}  D={it['discrimination']}  {', '.join(it['flags'])}")
+    return 0
+
+
 # Secure Interview Telemetry Endpoints
+TELEMETRY_METRICS = {
+    "facial_analyses": ["eye_movement_score", "head_movement_score", "facial_expression_score", "attention_score"],
+    "voice_analyses": ["voice_clarity_score", "speech_pattern_score", "background_noise_score", "voice_authenticity_score"],
+    "screen_analyses": ["screen_sharing_quality", "focus_score"],
+}
+
+
+async def telemetry_aggregates(match: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """Server-side $group over each telemetry collection for the samples matching `match`.
+    Per collection: records, last_timestamp, sum_/avg_/min_/max_/last_<metric>; screen also
+    gets tab_switch_events, unauthorized_apps_events and focus_without_tab_switch_sum.
+    """
+    async def group(coll_name: str) -> Dict[str, Any]:
+        fields: Dict[str, Any] = {"_id": None, "records": {"$sum": 1}, "last_timestamp": {"$max": "$timestamp"}}
+        for metric in TELEMETRY_METRICS[coll_name]:
+            fields[f"sum_{metric}"] = {"$sum": f"${metric}"}
+            fields[f"avg_{metric}"] = {"$avg": f"${metric}"}
+            fields[f"min_{metric}"] = {"$min": f"${metric}"}
+            fields[f"max_{metric}"] = {"$max": f"${metric}"}
+            fields[f"last_{metric}"] = {"$last": f"${metric}"}
+        if coll_name == "screen_analyses":
+            fields["tab_switch_events"] = {"$sum": {"$cond": ["$tab_switching_detected", 1, 0]}}
+            fields["unauthorized_apps_events"] = {"$sum": {"$size": {"$ifNull": ["$unauthorized_apps_detected", []]}}}
+            fields["focus_without_tab_switch_sum"] = {
+                "$sum": {"$cond": ["$tab_switching_detected", 0, {"$ifNull": ["$focus_score", 0]}]}
+            }
+        rows = await db[coll_name].aggregate([{"$match": match}, {"$sort": {"timestamp": 1}}, {"$group": fields}]).to_list(1)
+        row = rows[0] if rows else {"records": 0, "last_timestamp": None}
+        row.pop("_id", None)
+        return row
+
+    facial, voice, screen = await asyncio.gather(*(group(name) for name in TELEMETRY_COLLECTIONS))
+    return {"facial": facial, "voice": voice, "screen": screen}
+
+
+# kind -> (collection, builder(interview_id, candidate_id, data)); shared by the
+# per-sample endpoints and the batch endpoint so both validate the same way.
+TELEMETRY_KINDS = {
+    "facial": ("facial_analyses", lambda interview_id, candidate_id, data: FacialAnalysis(
+        interview_id=interview_id,
+        candidate_id=candidate_id,
+        eye_movement_score=float(data.get("eye_movement_score", 0.0)),
+        head_movement_score=float(data.get("head_movement_score", 0.0)),
+        facial_expression_score=float(data.get("facial_expression_score", 0.0)),
+        attention_score=float(data.get("attention_score", 0.0)),
+        stress_indicators=list(data.get("stress_indicators", [])),
+    )),
+    "voice": ("voice_analyses", lambda interview_id, candidate_id, data: VoiceAnalysis(
+        interview_id=interview_id,
+        candidate_id=candidate_id,
+        voice_clarity_score=float(data.get("voice_clarity_score", 0.0)),
+        speech_pattern_score=float(data.get("speech_pattern_score", 0.0)),
+        background_noise_score=float(data.get("background_noise_score", 0.0)),
+        voice_authenticity_score=float(data.get("voice_authenticity_score", 0.0)),
+        detected_issues=list(data.get("detected_issues", [])),
+    )),
+    "screen": ("screen_analyses", lambda interview_id, candidate_id, data: ScreenAnalysis(
+        interview_id=interview_id,
+        candidate_id=candidate_id,
+        tab_switching_detected=bool(data.get("tab_switching_detected", False)),
+        unauthorized_apps_detected=list(data.get("unauthorized_apps_detected", [])),
+        screen_sharing_quality=float(data.get("screen_sharing_quality", 0.0)),
+        focus_score=float(data.get("focus_score", 0.0)),
+    )),
+}
+TELEMETRY_BATCH_MAX = int(os.getenv("TELEMETRY_BATCH_MAX", "500"))
+
+
+# Running per-interview aggregates (telemetry_rollups), folded in at ingestion time so the
+# summary/decision endpoints read one document instead of every sample. Field names match
+# telemetry_aggregates() output: {kind: {records, sum_<m>, min_<m>, max_<m>, last_<m>, ...}}.
+# Samples folded in at ingestion carry in_rollup=True. Samples stored before rollups
+# existed are merged in once by seed_telemetry_rollup(), which marks the doc seeded.
+TELEMETRY_ROLLUP_COUNTERS = ("tab_switch_events", "unauthorized_apps_events", "focus_without_tab_switch_sum")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def build_telemetry_record(kind: str, interview_id: str, candidate_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Validated sample document for `kind`, marked as folded into the rollup."""
+    record = TELEMETRY_KINDS[kind][1](interview_id, candidate_id, data).dict()
+    record["in_rollup"] = True
+    return record
+
+
+def _telemetry_rollup_merge(rows_by_kind: Dict[str, Dict[str, Any]], extra: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Pipeline update merging telemetry_aggregates()-shaped rows into a rollup doc.
+
+    Counts and sums add up and min/max combine. The last_<metric> values are only replaced
+    when the row's last_timestamp is not older than the stored one, so batches applied out
+    of order (client `ts`, unordered write-behind bulk ops) cannot roll the latest values back.
+    """
+    fields: Dict[str, Any] = {"updated_at": datetime.now(timezone.utc), **(extra or {})}
+    for kind, row in rows_by_kind.items():
+        if not row or not row.get("records"):
+            continue
+        collection = TELEMETRY_KINDS[kind][0]
+        newer = {"$gte": [row["last_timestamp"], {"$ifNull": [f"${kind}.last_timestamp", _EPOCH]}]}
+
+        def add(field: str, value: Any) -> None:
+            fields[f"{kind}.{field}"] = {"$add": [{"$ifNull": [f"${kind}.{field}", 0]}, value or 0]}
+
+        add("records", row["records"])
+        fields[f"{kind}.last_timestamp"] = {"$max": [f"${kind}.last_timestamp", row["last_timestamp"]]}
+        for metric in TELEMETRY_METRICS[collection]:
+            add(f"sum_{metric}", row.get(f"sum_{metric}"))
+            fields[f"{kind}.min_{metric}"] = {"$min": [f"${kind}.min_{metric}", row.get(f"min_{metric}")]}
+            fields[f"{kind}.max_{metric}"] = {"$max": [f"${kind}.max_{metric}", row.get(f"max_{metric}")]}
+            fields[f"{kind}.last_{metric}"] = {
+                "$cond": [newer, {"$literal": row.get(f"last_{metric}")}, f"${kind}.last_{metric}"]
+            }
+        if kind == "screen":
+            for counter in TELEMETRY_ROLLUP_COUNTERS:
+                add(counter, row.get(counter))
+    return [{"$set": fields}]
+
+
+def telemetry_rollup_update(records_by_kind: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Build one upsert update that folds freshly ingested samples into the rollup."""
+    rows: Dict[str, Dict[str, Any]] = {}
+    for kind, records in records_by_kind.items():
+        if not records:
+            continue
+        collection = TELEMETRY_KINDS[kind][0]
+        latest = max(records, key=lambda r: r["timestamp"])
+        row: Dict[str, Any] = {"records": len(records), "last_timestamp": latest["timestamp"]}
+        for metric in TELEMETRY_METRICS[collection]:
+            values = [float(r.get(metric) or 0.0) for r in records]
+            row[f"sum_{metric}"] = sum(values)
+            row[f"min_{metric}"] = min(values)
+            row[f"max_{metric}"] = max(values)
+            row[f"last_{metric}"] = latest.get(metric)
+        if kind == "screen":
+            row["tab_switch_events"] = sum(1 for r in records if r.get("tab_switching_detected"))
+            row["unauthorized_apps_events"] = sum(len(r.get("unauthorized_apps_detected") or []) for r in records)
+            row["focus_without_tab_switch_sum"] = sum(
+                0.0 if r.get("tab_switching_detected") else float(r.get("focus_score") or 0.0) for r in records
+            )
+        rows[kind] = row
+    return _telemetry_rollup_merge(rows)
+
+
+async def seed_telemetry_rollup(interview_id: str) -> None:
+    """Merge samples stored before the rollup existed (no in_rollup flag) into it, once."""
+    legacy = await telemetry_aggregates({"interview_id": interview_id, "in_rollup": {"$ne": True}})
+    await db.telemetry_rollups.update_one(
+        {"interview_id": interview_id, "seeded": {"$ne": True}},
+        _telemetry_rollup_merge(legacy, {"seeded": True}),
+    )
+
+
+async def interview_telemetry_stats(interview_id: str) -> Dict[str, Dict[str, Any]]:
+    """O(1) telemetry stats for one interview from its rollup document.
+    Interviews recorded before rollups existed fall back to the $group aggregation.
+    """
+    doc = await db.telemetry_rollups.find_one({"interview_id": interview_id}, {"_id": 0})
+    if doc is None:
+        return await telemetry_aggregates({"interview_id": interview_id})
+    if not doc.get("seeded"):
+        # Created by the write-behind buffer, which can't tell it inserted the doc
+        await seed_telemetry_rollup(interview_id)
+        doc = await db.telemetry_rollups.find_one({"interview_id": interview_id}, {"_id": 0})
+    stats: Dict[str, Dict[str, Any]] = {}
+    for kind, (collection, _) in TELEMETRY_KINDS.items():
+        row = dict(doc.get(kind) or {})
+        row.setdefault("records", 0)
+        row.setdefault("last_timestamp", None)
+        for metric in TELEMETRY_METRICS[collection]:
+            total = row.get(f"sum_{metric}")
+            row[f"avg_{metric}"] = total / row["records"] if row["records"] and total is not None else None
+        stats[kind] = row
+    return stats
+
+
+async def find_candidate_secure_session(session_id: str, candidate_id: str) -> Optional[Dict[str, Any]]:
+    """Look up a candidate's secure session in either session collection."""
+    session = await db.secure_sessions.find_one({"id": session_id, "candidate_id": candidate_id})
+    if not session:
+        session = await db.secure_interview_sessions.find_one({"id": session_id, "candidate_id": candidate_id})
+    return session
+
+
 @api_router.post("/secure-interview/start")
 async def start_secure_interview(
     interview_id: str,
@@ -2817,16 +6062,12 @@ async def post_facial_analysis(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    record = FacialAnalysis(
-        interview_id=session["interview_id"],
-        candidate_id=current_candidate.id,
-        eye_movement_score=float(data.get("eye_movement_score", 0.0)),
-        head_movement_score=float(data.get("head_movement_score", 0.0)),
-        facial_expression_score=float(data.get("facial_expression_score", 0.0)),
-        attention_score=float(data.get("attention_score", 0.0)),
-        stress_indicators=list(data.get("stress_indicators", [])),
-    )
-    await db.facial_analyses.insert_one(record.dict())
+    collection = TELEMETRY_KINDS["facial"][0]
+    record = build_telemetry_record("facial", session["interview_id"], current_candidate.id, data)
+    await write_buffer.insert(collection, record)
+    await write_buffer.write("telemetry_rollups", UpdateOne(
+        {"interview_id": session["interview_id"]}, telemetry_rollup_update({"facial": [record]}), upsert=True
+    ))
     return {"message": "Facial analysis recorded"}
 
 
@@ -2840,16 +6081,12 @@ async def post_voice_analysis(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    record = VoiceAnalysis(
-        interview_id=session["interview_id"],
-        candidate_id=current_candidate.id,
-        voice_clarity_score=float(data.get("voice_clarity_score", 0.0)),
-        speech_pattern_score=float(data.get("speech_pattern_score", 0.0)),
-        background_noise_score=float(data.get("background_noise_score", 0.0)),
-        voice_authenticity_score=float(data.get("voice_authenticity_score", 0.0)),
-        detected_issues=list(data.get("detected_issues", [])),
-    )
-    await db.voice_analyses.insert_one(record.dict())
+    collection = TELEMETRY_KINDS["voice"][0]
+    record = build_telemetry_record("voice", session["interview_id"], current_candidate.id, data)
+    await write_buffer.insert(collection, record)
+    await write_buffer.write("telemetry_rollups", UpdateOne(
+        {"interview_id": session["interview_id"]}, telemetry_rollup_update({"voice": [record]}), upsert=True
+    ))
     return {"message": "Voice analysis recorded"}
 
 
@@ -2863,18 +6100,76 @@ async def post_screen_analysis(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    record = ScreenAnalysis(
-        interview_id=session["interview_id"],
-        candidate_id=current_candidate.id,
-        tab_switching_detected=bool(data.get("tab_switching_detected", False)),
-        unauthorized_apps_detected=list(data.get("unauthorized_apps_detected", [])),
-        screen_sharing_quality=float(data.get("screen_sharing_quality", 0.0)),
-        focus_score=float(data.get("focus_score", 0.0)),
-    )
-    await db.screen_analyses.insert_one(record.dict())
+    collection = TELEMETRY_KINDS["screen"][0]
+    record = build_telemetry_record("screen", session["interview_id"], current_candidate.id, data)
+    await write_buffer.insert(collection, record)
+    await write_buffer.write("telemetry_rollups", UpdateOne(
+        {"interview_id": session["interview_id"]}, telemetry_rollup_update({"screen": [record]}), upsert=True
+    ))
     return {"message": "Screen analysis recorded"}
 
 
+@api_router.post("/secure-interview/{session_id}/telemetry:batch")
+async def post_telemetry_batch(
+    session_id: str,
+    payload: Dict[str, Any],
+    current_candidate: CandidateUser = Depends(get_current_candidate)
+):
+    """Ingest a batch of mixed telemetry samples in one request.
+    Body: {"samples": [{"kind": "facial"|"voice"|"screen", "ts": <epoch ms, optional>, ...metrics}]}.
+    The batch is validated as a whole; any invalid sample rejects it with 422.
+    """
+    samples = payload.get("samples")
+    if not isinstance(samples, list) or not samples:
+        raise HTTPException(status_code=400, detail="samples must be a non-empty list")
+    if len(samples) > TELEMETRY_BATCH_MAX:
+        raise HTTPException(status_code=413, detail=f"at most {TELEMETRY_BATCH_MAX} samples per batch")
+
+    session = await find_candidate_secure_session(session_id, current_candidate.id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found")
+    interview_id = session["interview_id"]
+
+    now = datetime.now(timezone.utc)
+    docs: Dict[str, List[Dict[str, Any]]] = {}
+    by_kind: Dict[str, List[Dict[str, Any]]] = {}
+    errors = []
+    for idx, sample in enumerate(samples):
+        kind = sample.get("kind") if isinstance(sample, dict) else None
+        if kind not in TELEMETRY_KINDS:
+            errors.append({"index": idx, "error": "unknown kind"})
+            continue
+        collection = TELEMETRY_KINDS[kind][0]
+        try:
+            record = build_telemetry_record(kind, interview_id, current_candidate.id, sample)
+            if sample.get("ts") is not None:
+                # Client capture time, never in the future
+                record["timestamp"] = min(datetime.fromtimestamp(float(sample["ts"]) / 1000.0, tz=timezone.utc), now)
+        except (TypeError, ValueError, OverflowError) as e:
+            errors.append({"index": idx, "error": str(e)})
+            continue
+        docs.setdefault(collection, []).append(record)
+        by_kind.setdefault(kind, []).append(record)
+    if errors:
+        raise HTTPException(status_code=422, detail={"invalid_samples": errors[:20]})
+
+    results = await asyncio.gather(
+        db.telemetry_rollups.update_one({"interview_id": interview_id}, telemetry_rollup_update(by_kind), upsert=True),
+        *(db[collection].insert_many(rows, ordered=False) for collection, rows in docs.items()),
+    )
+    if results[0].upserted_id is not None:
+        # First rollup for this interview: fold in any samples that predate it
+        await seed_telemetry_rollup(interview_id)
+
+    # One combined message for recruiters watching this interview
+    await manager.send_to_recruiters(interview_id, {
+        "type": "telemetry_batch",
+        "data": jsonable_encoder({kind: [{k: v for k, v in r.items() if k != "_id"} for r in rows] for kind, rows in by_kind.items()}),
+    })
+
+    return {"message": "Telemetry recorded", "accepted": {kind: len(rows) for kind, rows in by_kind.items()}}
+
+
 @api_router.post("/secure-interview/{session_id}/end")
 async def end_secure_interview(
     session_id: str,
@@ -2886,13 +6181,11 @@ async def end_secure_interview(
 
     # Compute simple overall authenticity score
     interview_id = session["interview_id"]
-    last_facial = await db.facial_analyses.find({"interview_id": interview_id}).sort("timestamp", -1).to_list(1)
-    last_voice = await db.voice_analyses.find({"interview_id": interview_id}).sort("timestamp", -1).to_list(1)
-    last_screen = await db.screen_analyses.find({"interview_id": interview_id}).sort("timestamp", -1).to_list(1)
+    stats = await interview_telemetry_stats(interview_id)
 
-    facial_score = last_facial[0]["attention_score"] if last_facial else 0.0
-    voice_score = last_voice[0]["voice_authenticity_score"] if last_voice else 0.0
-    screen_score = last_screen[0]["focus_score"] if last_screen else 0.0
+    facial_score = stats["facial"].get("last_attention_score") or 0.0
+    voice_score = stats["voice"].get("last_voice_authenticity_score") or 0.0
+    screen_score = stats["screen"].get("last_focus_score") or 0.0
     overall = round((facial_score + voice_score + screen_score) / 3.0, 4)
 
     await db.secure_sessions.update_one(
@@ -2970,18 +6263,14 @@ async def upload_recordings(
     audio: UploadFile | None = File(default=None),
     current_candidate: CandidateUser = Depends(get_current_candidate)
 ):
-    """Accepts uploaded recording files and stores them under backend/recordings/ locally."""
+    """Accepts uploaded recording files and stores them under <interview_id>/ in the recording storage backend."""
     # Validate session belongs to candidate
     # Support both legacy and new collection names due to duplicate route definitions
-    session = await db.secure_sessions.find_one({"id": session_id, "candidate_id": current_candidate.id})
-    if not session:
-        session = await db.secure_interview_sessions.find_one({"id": session_id, "candidate_id": current_candidate.id})
+    session = await find_candidate_secure_session(session_id, current_candidate.id)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
     interview_id = session["interview_id"]
-    recordings_root = ROOT_DIR / "recordings" / interview_id
-    recordings_root.mkdir(parents=True, exist_ok=True)
 
     saved = []
     async def _save_file(kind: str, f: UploadFile | None):
@@ -2989,18 +6278,21 @@ async def upload_recordings(
             return
         suffix = Path(f.filename).suffix or ".webm"
         filename = f"{kind}-{uuid.uuid4().hex}{suffix}"
-        target = recordings_root / filename
-        content = await f.read()
-        with open(target, "wb") as out:
-            out.write(content)
+        stored = await store_upload(interview_recording_storage, "recordings", interview_id, filename, f.file,
+                                    MAX_RECORDING_BYTES, f.content_type)
+        local_path = interview_recording_storage.local_path(stored["key"])
         doc = {
             "id": str(uuid.uuid4()),
             "interview_id": interview_id,
             "session_id": session_id,
             "candidate_id": current_candidate.id,
             "kind": kind,
-            "path": str(target),
-            "size_bytes": len(content),
+            "filename": filename,
+            "storage": stored["storage"],
+            "storage_key": stored["key"],
+            "path": str(local_path) if local_path else None,
+            "size_bytes": stored["size_bytes"],
+            "sha256": stored["sha256"],
             "created_at": datetime.now(timezone.utc),
         }
         await db.interview_recordings.insert_one(doc)
@@ -3016,6 +6308,9 @@ async def upload_recordings(
 @api_router.get("/secure-interview/{interview_id}/recordings")
 async def list_recordings(
     interview_id: str,
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
     current_recruiter: Recruiter = Depends(get_current_recruiter)
 ):
     """List recordings for an interview for recruiters of the same company."""
@@ -3026,7 +6321,10 @@ async def list_recordings(
     if interview.get("company_id") != current_recruiter.company_id:
         raise HTTPException(status_code=403, detail="Forbidden")
 
-    recs = await db.interview_recordings.find({"interview_id": interview_id}).to_list(1000)
+    recs, next_cursor = await paginate_find(
+        db.interview_recordings, {"interview_id": interview_id}, [("_id", 1)], clamp_limit(limit), after
+    )
+    set_next_cursor(response, next_cursor)
     # Always expose a stable string id to the frontend. For older docs that
     # don't have an explicit 'id', fall back to MongoDB's '_id'.
     result = []
@@ -3046,6 +6344,7 @@ async def list_recordings(
 @api_router.get("/secure-interview/recordings/{recording_id}")
 async def get_recording_file(
     recording_id: str,
+    request: Request,
     current_recruiter: Recruiter = Depends(get_current_recruiter)
 ):
     """Serve a recording file to authorized recruiters."""
@@ -3062,12 +6361,17 @@ async def get_recording_file(
     interview = await db.interviews.find_one({"id": rec["interview_id"]})
     if not interview or interview.get("company_id") != current_recruiter.company_id:
         raise HTTPException(status_code=403, detail="Forbidden")
+    if rec.get("storage_key"):
+        return await stored_file_response(request, {
+            "storage": rec.get("storage"),
+            "key": rec["storage_key"],
+            "owner": rec["interview_id"],
+            "filename": rec.get("filename"),
+        })
     path = Path(rec["path"])
     if not path.exists():
         raise HTTPException(status_code=404, detail="File missing on server")
-    # Best-effort content type
-    media_type = "video/webm" if path.suffix.lower() in [".webm", ".mkv"] else "application/octet-stream"
-    return FileResponse(path, media_type=media_type, filename=path.name)
+    return serve_file_with_range(request, path, filename=path.name)
 
 
 @api_router.get("/secure-interview/{interview_id}/report")
@@ -3255,10 +6559,14 @@ async def seed_demo_data(current_recruiter: Recruiter = Depends(get_current_recr
             **job_data
         )
         await db.jobs.insert_one(job.dict())
+        match_index.upsert_job(job.dict())
+        await note_match_change("job", job.id)
     
     for candidate_data in sample_candidates:
         candidate = CandidateUser(**candidate_data)
         await db.candidates.insert_one(candidate.dict())
+        match_index.upsert_candidate(candidate.dict())
+        await note_match_change("candidate", candidate.id)
     
     return {"message": "Demo data seeded successfully"}
 
@@ -3310,27 +6618,23 @@ async def upload_interview_recording(
     if not recording:
         raise HTTPException(status_code=404, detail="Interview recording not found")
     
-    # Create recordings directory if it doesn't exist
-    recordings_dir = ROOT_DIR / "recordings" / interview_id
-    recordings_dir.mkdir(parents=True, exist_ok=True)
-    
     # Save file
     file_extension = file.filename.split('.')[-1] if file.filename else 'webm'
     filename = f"{recording_type}_{int(datetime.now().timestamp())}.{file_extension}"
-    file_path = recordings_dir / filename
     
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
+    stored = await store_upload(interview_recording_storage, "recordings", interview_id, filename, file.file,
+                                MAX_RECORDING_BYTES, file.content_type)
+    size_bytes = stored["size_bytes"]
+    local_path = interview_recording_storage.local_path(stored["key"])
     
     # Update recording record
     file_url = f"/recordings/{interview_id}/{filename}"
     update_data = {f"{recording_type}_recording_url": file_url}
     
     if not recording.get("file_size_mb"):
-        update_data["file_size_mb"] = len(content) / (1024 * 1024)  # Convert to MB
+        update_data["file_size_mb"] = size_bytes / (1024 * 1024)  # Convert to MB
     else:
-        update_data["file_size_mb"] = recording["file_size_mb"] + len(content) / (1024 * 1024)
+        update_data["file_size_mb"] = recording["file_size_mb"] + size_bytes / (1024 * 1024)
     
     await db.interview_recordings.update_one(
         {"interview_id": interview_id, "candidate_id": current_candidate.id},
@@ -3345,8 +6649,12 @@ async def upload_interview_recording(
             "candidate_id": current_candidate.id,
             "recruiter_id": recording.get("recruiter_id") if isinstance(recording, dict) else getattr(recording, "recruiter_id", None),
             "kind": recording_type,
-            "path": str(file_path),
-            "size_bytes": len(content),
+            "filename": filename,
+            "storage": stored["storage"],
+            "storage_key": stored["key"],
+            "path": str(local_path) if local_path else None,
+            "size_bytes": size_bytes,
+            "sha256": stored["sha256"],
             "created_at": datetime.now(timezone.utc),
         }
         await db.interview_recordings.insert_one(per_file_doc)
@@ -3413,13 +6721,13 @@ async def log_security_violation(
         severity=violation_data.get("severity", "warning")
     )
     
-    await db.security_violations.insert_one(violation.dict())
+    await write_buffer.insert("security_violations", violation.dict())
     
     # Add to interview recording security log
-    await db.interview_recordings.update_one(
+    await write_buffer.write("interview_recordings", UpdateOne(
         {"interview_id": interview_id, "candidate_id": current_candidate.id},
         {"$push": {"security_log": violation.dict()}}
-    )
+    ))
     
     # Notify recruiters via WebSocket
     await manager.send_to_recruiters(interview_id, {
@@ -3583,43 +6891,40 @@ async def get_interview_summary(
 
     candidate = await db.candidates.find_one({"id": interview["candidate_id"]})
 
-    # Fetch analyses
-    facial = await db.facial_analyses.find({"interview_id": interview_id}).to_list(10000)
-    voice = await db.voice_analyses.find({"interview_id": interview_id}).to_list(10000)
-    screen = await db.screen_analyses.find({"interview_id": interview_id}).to_list(10000)
+    # Running aggregates maintained at ingestion
+    stats = await interview_telemetry_stats(interview_id)
+    facial, voice, screen = stats["facial"], stats["voice"], stats["screen"]
 
-    def avg(lst, key):
-        vals = [float(x.get(key, 0) or 0) for x in lst if x.get(key) is not None]
-        return sum(vals) / len(vals) if vals else None
+    def last_ts(row):
+        ts = row.get("last_timestamp")
+        return ts.isoformat() if ts else None
 
     facial_summary = {
-        "avg_eye_movement": avg(facial, "eye_movement_score"),
-        "avg_head_movement": avg(facial, "head_movement_score"),
-        "avg_facial_expression": avg(facial, "facial_expression_score"),
-        "avg_attention": avg(facial, "attention_score"),
-        "records": len(facial),
-        "last_timestamp": (facial[-1]["timestamp"].isoformat() if facial else None)
+        "avg_eye_movement": facial.get("avg_eye_movement_score"),
+        "avg_head_movement": facial.get("avg_head_movement_score"),
+        "avg_facial_expression": facial.get("avg_facial_expression_score"),
+        "avg_attention": facial.get("avg_attention_score"),
+        "records": facial["records"],
+        "last_timestamp": last_ts(facial)
     }
 
     voice_summary = {
-        "avg_voice_clarity": avg(voice, "voice_clarity_score"),
-        "avg_speech_pattern": avg(voice, "speech_pattern_score"),
-        "avg_background_noise": avg(voice, "background_noise_score"),
-        "avg_voice_authenticity": avg(voice, "voice_authenticity_score"),
-        "records": len(voice),
-        "last_timestamp": (voice[-1]["timestamp"].isoformat() if voice else None)
+        "avg_voice_clarity": voice.get("avg_voice_clarity_score"),
+        "avg_speech_pattern": voice.get("avg_speech_pattern_score"),
+        "avg_background_noise": voice.get("avg_background_noise_score"),
+        "avg_voice_authenticity": voice.get("avg_voice_authenticity_score"),
+        "records": voice["records"],
+        "last_timestamp": last_ts(voice)
     }
 
     # For screen, aggregate booleans and quality/focus scores
-    tab_switches = sum(1 for x in screen if bool(x.get("tab_switching_detected")))
-    unauthorized_counts = sum(len(x.get("unauthorized_apps_detected", [])) for x in screen)
     screen_summary = {
-        "avg_sharing_quality": avg(screen, "screen_sharing_quality"),
-        "avg_focus": avg(screen, "focus_score"),
-        "tab_switch_events": tab_switches,
-        "unauthorized_apps_events": unauthorized_counts,
-        "records": len(screen),
-        "last_timestamp": (screen[-1]["timestamp"].isoformat() if screen else None)
+        "avg_sharing_quality": screen.get("avg_screen_sharing_quality"),
+        "avg_focus": screen.get("avg_focus_score"),
+        "tab_switch_events": screen.get("tab_switch_events", 0),
+        "unauthorized_apps_events": screen.get("unauthorized_apps_events", 0),
+        "records": screen["records"],
+        "last_timestamp": last_ts(screen)
     }
 
     # Resume info
@@ -3726,15 +7031,6 @@ async def interview_websocket(websocket: WebSocket, interview_id: str, user_type
     except WebSocketDisconnect:
         manager.disconnect(websocket, interview_id)
 
-# File serving endpoint for recordings
-@api_router.get("/recordings/{interview_id}/{filename}")
-async def serve_recording(interview_id: str, filename: str):
-    file_path = ROOT_DIR / "recordings" / interview_id / filename
-    if not file_path.exists():
-        raise HTTPException(status_code=404, detail="Recording not found")
-    
-    return {"file_path": str(file_path), "message": "File exists"}  # In production, return actual file
-
 # AI Monitoring and Secure Interview Endpoints
 @api_router.post("/secure-interview/start")
 async def start_secure_interview(
@@ -3900,36 +7196,18 @@ async def get_ai_decision(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    # Get all analysis data
-    facial_analyses = await db.facial_analyses.find({
-        "interview_id": session["interview_id"]
-    }).to_list(1000)
-    
-    voice_analyses = await db.voice_analyses.find({
-        "interview_id": session["interview_id"]
-    }).to_list(1000)
-    
-    screen_analyses = await db.screen_analyses.find({
-        "interview_id": session["interview_id"]
-    }).to_list(1000)
+    # Running aggregates maintained at ingestion
+    stats = await interview_telemetry_stats(session["interview_id"])
+    facial, voice, screen = stats["facial"], stats["voice"], stats["screen"]
     
     # Calculate overall authenticity score
-    total_score = 0.0
-    count = 0
-    
-    for analysis in facial_analyses:
-        total_score += analysis["attention_score"] * 0.3
-        total_score += analysis["facial_expression_score"] * 0.2
-        count += 1
-    
-    for analysis in voice_analyses:
-        total_score += analysis["voice_authenticity_score"] * 0.3
-        count += 1
-    
-    for analysis in screen_analyses:
-        if not analysis["tab_switching_detected"]:
-            total_score += analysis["focus_score"] * 0.2
-        count += 1
+    total_score = (
+        facial.get("sum_attention_score", 0.0) * 0.3
+        + facial.get("sum_facial_expression_score", 0.0) * 0.2
+        + voice.get("sum_voice_authenticity_score", 0.0) * 0.3
+        + screen.get("focus_without_tab_switch_sum", 0.0) * 0.2
+    )
+    count = facial["records"] + voice["records"] + screen["records"]
     
     overall_score = total_score / max(count, 1)
     
@@ -3956,7 +7234,7 @@ async def get_ai_decision(
         "confidence": "high" if overall_score >= 0.8 or overall_score <= 0.4 else "medium",
         "recommendations": [
             "Candidate shows good engagement" if overall_score >= 0.7 else "Review candidate behavior",
-            "Screen sharing quality is acceptable" if any(a.get("screen_sharing_quality", 0) >= 0.7 for a in screen_analyses) else "Screen sharing quality needs improvement"
+            "Screen sharing quality is acceptable" if (screen.get("max_screen_sharing_quality") or 0) >= 0.7 else "Screen sharing quality needs improvement"
         ]
     }
 
@@ -3987,14 +7265,17 @@ async def end_secure_interview(
 
 @api_router.get("/secure-interview/active-sessions")
 async def get_active_sessions(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
     current_recruiter: Recruiter = Depends(get_current_recruiter)
 ):
     """Get all active secure interview sessions for the recruiter"""
-    sessions = await db.secure_interview_sessions.find({
-        "recruiter_id": current_recruiter.id,
-        "is_active": True
-    }).to_list(1000)
-    
+    sessions, next_cursor = await paginate_find(
+        db.secure_interview_sessions, {"recruiter_id": current_recruiter.id, "is_active": True},
+        [("_id", 1)], clamp_limit(limit), after, {"_id": 0},
+    )
+    set_next_cursor(response, next_cursor)
     return sessions
 
 @api_router.get("/analytics/ai-monitoring")
@@ -4002,42 +7283,30 @@ async def get_ai_monitoring_data(
     current_recruiter: Recruiter = Depends(get_current_recruiter)
 ):
     """Get AI monitoring analytics data"""
-    # Get recent analysis data
-    facial_analyses = await db.facial_analyses.find({
-        "interview_id": {"$in": await get_recruiter_interview_ids(current_recruiter.id)}
-    }).to_list(1000)
-    
-    voice_analyses = await db.voice_analyses.find({
-        "interview_id": {"$in": await get_recruiter_interview_ids(current_recruiter.id)}
-    }).to_list(1000)
-    
-    screen_analyses = await db.screen_analyses.find({
-        "interview_id": {"$in": await get_recruiter_interview_ids(current_recruiter.id)}
-    }).to_list(1000)
-    
-    violations = await db.security_violations.find({
-        "interview_id": {"$in": await get_recruiter_interview_ids(current_recruiter.id)}
-    }).to_list(1000)
+    interview_ids = await get_recruiter_interview_ids(current_recruiter.id)
+    violation_filter = {"interview_id": {"$in": interview_ids}}
+    stats, violations_count, latest_violations = await asyncio.gather(
+        telemetry_aggregates(violation_filter),
+        db.security_violations.count_documents(violation_filter),
+        db.security_violations.find(violation_filter, {"_id": 0}).sort("_id", -1).to_list(10),
+    )
     
     # Calculate averages
-    facial_avg = sum(a.get("attention_score", 0) for a in facial_analyses) / max(len(facial_analyses), 1) * 100
-    voice_avg = sum(a.get("voice_authenticity_score", 0) for a in voice_analyses) / max(len(voice_analyses), 1) * 100
-    screen_avg = sum(a.get("focus_score", 0) for a in screen_analyses) / max(len(screen_analyses), 1) * 100
+    facial_avg = (stats["facial"].get("avg_attention_score") or 0) * 100
+    voice_avg = (stats["voice"].get("avg_voice_authenticity_score") or 0) * 100
+    screen_avg = (stats["screen"].get("avg_focus_score") or 0) * 100
     
     return {
         "facial_accuracy": round(facial_avg, 1),
         "voice_authenticity": round(voice_avg, 1),
         "screen_focus": round(screen_avg, 1),
-        "violations_count": len(violations),
-        "violations": violations[-10:]  # Last 10 violations
+        "violations_count": violations_count,
+        "violations": latest_violations[::-1]  # Last 10 violations
     }
 
 async def get_recruiter_interview_ids(recruiter_id: str):
     """Helper function to get interview IDs for a recruiter"""
-    interviews = await db.interviews.find({
-        "interviewer_id": recruiter_id
-    }).to_list(1000)
-    return [interview["id"] for interview in interviews]
+    return await db.interviews.distinct("id", {"interviewer_id": recruiter_id})
 
 # Interview Management Endpoints
 @api_router.post("/interviews/schedule")
@@ -4086,41 +7355,34 @@ async def schedule_interview(
 
 @api_router.get("/interviews/upcoming")
 async def get_upcoming_interviews(
-    current_recruiter: Recruiter = Depends(get_current_recruiter)
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter),
+    loader: EnrichmentLoader = Depends(get_enrichment_loader)
 ):
-    """Get upcoming interviews for a recruiter"""
+    """Get upcoming interviews for a recruiter, soonest first"""
     now = datetime.now(timezone.utc)
-    interviews = await db.interviews.find({
+    interviews, next_cursor = await paginate_find(db.interviews, {
         "interviewer_id": current_recruiter.id,
         "scheduled_date": {"$gte": now},
         "status": "scheduled"
-    }).to_list(1000)
+    }, [("scheduled_date", 1), ("_id", 1)], clamp_limit(limit), after, {"_id": 0})
+    set_next_cursor(response, next_cursor)
     
     # Enrich with candidate and job data
+    candidates, jobs, applications = await asyncio.gather(
+        loader.load_many("candidates", (it.get("candidate_id") for it in interviews)),
+        loader.load_many("jobs", (it.get("job_id") for it in interviews)),
+        loader.load_many("candidate_applications", (it.get("application_id") for it in interviews)),
+    )
     enriched_interviews = []
     for interview in interviews:
-        candidate = await db.candidates.find_one({"id": interview["candidate_id"]})
-        job = await db.jobs.find_one({"id": interview["job_id"]})
-        application = await db.candidate_applications.find_one({"id": interview["application_id"]})
-
-        # Remove MongoDB internal _id so FastAPI can serialize
-        interview = dict(interview)
-        interview.pop("_id", None)
-        if candidate:
-            candidate = dict(candidate)
-            candidate.pop("_id", None)
-        if job:
-            job = dict(job)
-            job.pop("_id", None)
-        if application:
-            application = dict(application)
-            application.pop("_id", None)
-        
         enriched_interviews.append({
             "interview": interview,
-            "candidate": candidate,
-            "job": job,
-            "application": application
+            "candidate": candidates.get(interview["candidate_id"]),
+            "job": jobs.get(interview["job_id"]),
+            "application": applications.get(interview["application_id"])
         })
     
     return enriched_interviews
@@ -4239,8 +7501,16 @@ async def create_question_set(
     return qs
 
 @api_router.get("/question-sets", response_model=List[QuestionSet])
-async def list_question_sets(current_recruiter: Recruiter = Depends(get_current_recruiter)):
-    items = await db.question_sets.find({"company_id": current_recruiter.company_id}).to_list(1000)
+async def list_question_sets(
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
+    items, next_cursor = await paginate_find(
+        db.question_sets, {"company_id": current_recruiter.company_id}, [("_id", 1)], clamp_limit(limit), after
+    )
+    set_next_cursor(response, next_cursor)
     return [QuestionSet(**{k: v for k, v in dict(it).items() if k != "_id"}) for it in items]
 
 @api_router.get("/question-sets/{qs_id}", response_model=QuestionSet)
@@ -4338,11 +7608,20 @@ async def submit_recruiter_evaluation(
     return eval_doc
 
 @api_router.get("/interviews/{interview_id}/evaluations", response_model=List[RecruiterEvaluation])
-async def list_recruiter_evaluations(interview_id: str, current_recruiter: Recruiter = Depends(get_current_recruiter)):
+async def list_recruiter_evaluations(
+    interview_id: str,
+    response: Response,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+    current_recruiter: Recruiter = Depends(get_current_recruiter)
+):
     interview = await db.interviews.find_one({"id": interview_id, "company_id": current_recruiter.company_id})
     if not interview:
         raise HTTPException(status_code=404, detail="Interview not found")
-    items = await db.evaluations.find({"interview_id": interview_id}).to_list(1000)
+    items, next_cursor = await paginate_find(
+        db.evaluations, {"interview_id": interview_id}, [("_id", 1)], clamp_limit(limit), after
+    )
+    set_next_cursor(response, next_cursor)
     return [RecruiterEvaluation(**{k: v for k, v in dict(it).items() if k != "_id"}) for it in items]
 
 # Webhooks for integrations (placeholders)
@@ -4399,7 +7678,14 @@ async def create_video_submission(payload: Dict[str, Any]):
     return {"ok": True, "submission": doc}
 
 @api_router.get("/video-submissions")
-async def list_video_submissions(companyId: Optional[str] = None, jobId: Optional[str] = None, candidateId: Optional[str] = None):
+async def list_video_submissions(
+    response: Response,
+    companyId: Optional[str] = None,
+    jobId: Optional[str] = None,
+    candidateId: Optional[str] = None,
+    limit: int = PAGE_LIMIT_DEFAULT,
+    after: Optional[str] = None,
+):
     query: Dict[str, Any] = {}
     if companyId:
         query["company_id"] = companyId
@@ -4407,10 +7693,309 @@ async def list_video_submissions(companyId: Optional[str] = None, jobId: Optiona
         query["job_id"] = jobId
     if candidateId:
         query["candidate_id"] = candidateId
-    items = await db.video_submissions.find(query).sort("created_at", -1).to_list(1000)
-    for it in items:
-        it.pop("_id", None)
-    return {"items": items}
+    items, next_cursor = await paginate_find(
+        db.video_submissions, query, [("created_at", -1), ("_id", -1)], clamp_limit(limit), after, {"_id": 0}
+    )
+    set_next_cursor(response, next_cursor)
+    return {"items": items, "next_cursor": next_cursor}
+
+# ----------------------
+# MongoDB Indexes
+# ----------------------
+# Declared against the filter/sort shapes the routes above actually issue.
+# Each entry is (keys, options); ensure_indexes() creates missing ones at startup.
+ENSURE_INDEXES = os.getenv("ENSURE_INDEXES", "true").lower() == "true"
+
+INDEX_SPECS: Dict[str, List[tuple]] = {
+    "companies": [
+        ([("id", 1)], {"unique": True}),
+    ],
+    "recruiters": [
+        ([("id", 1)], {"unique": True}),
+        ([("email", 1)], {}),
+        ([("company_id", 1)], {}),
+    ],
+    "candidates": [
+        ([("id", 1)], {"unique": True}),
+        ([("email", 1)], {}),
+    ],
+    "user_passwords": [
+        ([("user_id", 1), ("role", 1)], {}),
+    ],
+    "email_verifications": [
+        ([("user_id", 1), ("is_verified", 1)], {}),
+    ],
+    "phone_verifications": [
+        ([("user_id", 1), ("is_verified", 1)], {}),
+    ],
+    "jobs": [
+        ([("id", 1)], {"unique": True}),
+        ([("company_id", 1), ("status", 1)], {}),
+        ([("company_id", 1), ("_id", 1)], {}),
+        ([("status", 1), ("_id", 1)], {}),
+        # Full-text search for /candidates/jobs(/search); one text index per collection
+        ([("title", "text"), ("skills", "text"), ("technical_requirements", "text"), ("description", "text")],
+         {"name": "jobs_text", "weights": {"title": 10, "skills": 6, "technical_requirements": 3, "description": 1}}),
+    ],
+    "candidate_applications": [
+        ([("id", 1)], {"unique": True}),
+        ([("company_id", 1), ("_id", 1)], {}),
+        ([("candidate_id", 1), ("_id", 1)], {}),
+        ([("company_id", 1), ("stage", 1), ("last_updated", -1)], {}),
+        ([("company_id", 1), ("applied_date", -1)], {}),
+        ([("company_id", 1), ("job_id", 1)], {}),
+        ([("candidate_id", 1), ("job_id", 1)], {}),
+    ],
+    "interviews": [
+        ([("id", 1)], {"unique": True}),
+        ([("candidate_id", 1), ("status", 1)], {}),
+        ([("candidate_id", 1), ("_id", 1)], {}),
+        ([("company_id", 1), ("status", 1)], {}),
+        ([("interviewer_id", 1), ("status", 1), ("scheduled_date", 1), ("_id", 1)], {}),
+        ([("interviewer_id", 1), ("status", 1), ("ended_at", -1), ("_id", -1)], {}),
+        ([("application_id", 1)], {}),
+    ],
+    "interview_otps": [
+        ([("interview_id", 1), ("candidate_id", 1), ("is_verified", 1)], {}),
+    ],
+    "interview_round_submissions": [
+        ([("interview_id", 1), ("candidate_id", 1), ("round", 1)], {"unique": True}),
+    ],
+    "round_results": [
+        ([("interview_id", 1), ("candidate_id", 1), ("round", 1)], {"unique": True}),
+    ],
+    "regrade_jobs": [
+        ([("id", 1)], {"unique": True}),
+        ([("round", 1)], {"unique": True, "partialFilterExpression": {"status": "running"}}),
+    ],
+    "item_analysis": [
+        ([("round", 1), ("bank_version", 1)], {"unique": True}),
+    ],
+    "candidate_answers": [
+        ([("interview_id", 1), ("candidate_id", 1), ("timestamp", 1)], {}),
+        ([("round", 1), ("interview_id", 1), ("candidate_id", 1), ("timestamp", 1)], {}),
+        ([("round", 1), ("question_id", 1), ("selected_option", 1)], {}),
+    ],
+    "secure_sessions": [
+        ([("id", 1)], {"unique": True}),
+        ([("interview_id", 1), ("session_start", -1)], {}),
+    ],
+    "secure_interview_sessions": [
+        ([("id", 1)], {"unique": True}),
+        ([("recruiter_id", 1), ("is_active", 1), ("_id", 1)], {}),
+        ([("interview_id", 1), ("session_start", -1)], {}),
+    ],
+    "facial_analyses": [
+        ([("interview_id", 1), ("timestamp", 1)], {}),
+    ],
+    "voice_analyses": [
+        ([("interview_id", 1), ("timestamp", 1)], {}),
+    ],
+    "screen_analyses": [
+        ([("interview_id", 1), ("timestamp", 1)], {}),
+    ],
+    "telemetry_rollups": [
+        ([("interview_id", 1)], {"unique": True}),
+    ],
+    "security_violations": [
+        ([("interview_id", 1), ("timestamp", 1)], {}),
+    ],
+    "interview_recordings": [
+        ([("id", 1)], {}),
+        ([("interview_id", 1), ("candidate_id", 1)], {}),
+        ([("interview_id", 1), ("_id", 1)], {}),
+    ],
+    "submissions": [
+        ([("interview_id", 1), ("candidate_id", 1)], {}),
+    ],
+    "ai_decisions": [
+        ([("interview_id", 1)], {"unique": True}),
+    ],
+    "notes": [
+        ([("application_id", 1), ("_id", 1)], {}),
+    ],
+    "evaluations": [
+        ([("interview_id", 1), ("_id", 1)], {}),
+    ],
+    "question_sets": [
+        ([("id", 1)], {"unique": True}),
+        ([("company_id", 1), ("_id", 1)], {}),
+    ],
+    "video_submissions": [
+        ([("company_id", 1), ("created_at", -1), ("_id", -1)], {}),
+        ([("job_id", 1), ("created_at", -1), ("_id", -1)], {}),
+        ([("candidate_id", 1), ("created_at", -1), ("_id", -1)], {}),
+        ([("created_at", -1), ("_id", -1)], {}),
+    ],
+    "recording_files": [
+        ([("namespace", 1), ("owner", 1), ("filename", 1)], {"unique": True}),
+    ],
+    "skill_taxonomy": [
+        ([("name", 1)], {"unique": True}),
+    ],
+    "recording_uploads": [
+        ([("id", 1)], {"unique": True}),
+        ([("session_id", 1), ("status", 1)], {}),
+    ],
+    "login_events": [
+        ([("user_id", 1), ("timestamp", -1)], {}),
+    ],
+    "company_rollups": [
+        ([("company_id", 1)], {"unique": True}),
+    ],
+    "match_index_changes": [
+        ([("at", 1)], {"expireAfterSeconds": MATCH_INDEX_CHANGE_TTL}),
+    ],
+}
+
+
+def _index_key(keys) -> tuple:
+    """Normalize an index key spec (list of pairs or SON) into a comparable tuple."""
+    items = keys.items() if hasattr(keys, "items") else keys
+    normalized = []
+    for field, direction in items:
+        if direction == "text" or field == "_ftsx":
+            # The server stores all text fields of an index as a single _fts/_ftsx pair
+            if ("_fts", "text") not in normalized:
+                normalized += [("_fts", "text"), ("_ftsx", 1)]
+            continue
+        normalized.append((field, int(direction) if isinstance(direction, (int, float)) else direction))
+    return tuple(normalized)
+
+
+async def ensure_indexes(database=None) -> Dict[str, List[str]]:
+    """Idempotently create every index in INDEX_SPECS.
+    Indexes are created one at a time so a single conflict (e.g. duplicate values under a
+    unique spec) is logged without blocking the rest.
+    """
+    database = database if database is not None else db
+    created: Dict[str, List[str]] = {}
+    for coll_name, specs in INDEX_SPECS.items():
+        for keys, options in specs:
+            try:
+                name = await database[coll_name].create_index(keys, **options)
+                created.setdefault(coll_name, []).append(name)
+            except Exception as e:
+                logging.warning(f"Index {coll_name}{list(keys)} not created: {e}")
+    return created
+
+
+async def index_report(database=None) -> Dict[str, Dict[str, Any]]:
+    """Compare declared indexes with what the database has.
+    missing: declared but absent; undeclared: present but not in INDEX_SPECS;
+    unused: present with zero recorded accesses since the server started ($indexStats).
+    """
+    database = database if database is not None else db
+    collections = set(INDEX_SPECS) | set(await database.list_collection_names())
+    report: Dict[str, Dict[str, Any]] = {}
+    for coll_name in sorted(collections):
+        if coll_name.startswith("system."):
+            continue
+        coll = database[coll_name]
+        existing = await coll.index_information()
+        present = {_index_key(info["key"]): name for name, info in existing.items()}
+        declared = [_index_key(keys) for keys, _ in INDEX_SPECS.get(coll_name, [])]
+
+        usage: Optional[Dict[str, int]] = {}
+        try:
+            async for stat in coll.aggregate([{"$indexStats": {}}]):
+                usage[stat["name"]] = int((stat.get("accesses") or {}).get("ops", 0))
+        except Exception:
+            usage = None  # $indexStats requires clusterMonitor-like privileges
+
+        report[coll_name] = {
+            "missing": [list(k) for k in declared if k not in present],
+            "undeclared": sorted(name for key, name in present.items() if name != "_id_" and key not in declared),
+            "unused": sorted(name for name, ops in (usage or {}).items() if name != "_id_" and ops == 0),
+            "usage_available": usage is not None,
+        }
+    return report
+
+
+async def check_indexes_cli() -> int:
+    """Print index_report() for the configured database; exit code 1 when indexes are missing."""
+    report = await index_report()
+    missing_total = 0
+    for coll_name, entry in report.items():
+        if not (entry["missing"] or entry["undeclared"] or entry["unused"]):
+            continue
+        print(f"{coll_name}:")
+        for keys in entry["missing"]:
+            print(f"  MISSING     {keys}")
+        for name in entry["undeclared"]:
+            print(f"  UNDECLARED  {name}")
+        for name in entry["unused"]:
+            print(f"  UNUSED      {name}")
+        missing_total += len(entry["missing"])
+    if not any(e["usage_available"] for e in report.values()):
+        print("note: $indexStats unavailable; unused-index detection skipped")
+    print(f"{missing_total} missing index(es)")
+    client.close()
+    return 1 if missing_total else 0
+
+
+# ----------------------
+# Telemetry time-series collections
+# ----------------------
+# Facial/voice/screen samples are stored in MongoDB time-series collections bucketed by
+# interview_id, with automatic expiry. Existing regular collections are left in place
+# (MongoDB cannot convert them) and keep their history: they only get a TTL index on
+# timestamp when TELEMETRY_TTL_EXISTING=true, since that deletes older samples at once.
+TELEMETRY_COLLECTIONS = ("facial_analyses", "voice_analyses", "screen_analyses")
+TELEMETRY_TTL_DAYS = int(os.getenv("TELEMETRY_TTL_DAYS", "180"))
+TELEMETRY_TTL_EXISTING = os.getenv("TELEMETRY_TTL_EXISTING", "false").lower() == "true"
+
+
+async def ensure_telemetry_collections(database=None) -> Dict[str, str]:
+    """Create the telemetry collections as time-series if they do not exist yet.
+    Returns {collection: "timeseries" | "regular"} describing what is in place.
+    """
+    database = database if database is not None else db
+    ttl_seconds = TELEMETRY_TTL_DAYS * 86400
+    existing = {info["name"]: info async for info in await database.list_collections()}
+    layout: Dict[str, str] = {}
+    for name in TELEMETRY_COLLECTIONS:
+        info = existing.get(name)
+        if info is None:
+            try:
+                await database.create_collection(
+                    name,
+                    timeseries={"timeField": "timestamp", "metaField": "interview_id", "granularity": "seconds"},
+                    expireAfterSeconds=ttl_seconds,
+                )
+                layout[name] = "timeseries"
+                continue
+            except Exception as e:
+                logging.warning(f"time-series collection {name} not created, using a regular collection: {e}")
+        elif info.get("type") == "timeseries":
+            layout[name] = "timeseries"
+            continue
+        layout[name] = "regular"
+        if info is not None and not TELEMETRY_TTL_EXISTING:
+            continue
+        try:
+            await database[name].create_index([("timestamp", 1)], expireAfterSeconds=ttl_seconds)
+        except Exception as e:
+            logging.warning(f"TTL index on {name}.timestamp not created: {e}")
+    return layout
+
+
+@app.on_event("startup")
+async def ensure_telemetry_layout():
+    # Collection layout is independent of ENSURE_INDEXES: samples written before the
+    # collections exist would create them as regular collections for good.
+    try:
+        layout = await ensure_telemetry_collections()
+        logging.info(f"Telemetry collections: {layout}")
+    except Exception as e:
+        logging.warning(f"Telemetry collection setup failed: {e}")
+
+
+@app.on_event("startup")
+async def ensure_db_indexes():
+    if ENSURE_INDEXES:
+        created = await ensure_indexes()
+        logging.info(f"MongoDB indexes ensured for {len(created)} collections")
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -4424,8 +8009,34 @@ logger = logging.getLogger(__name__)
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    global _match_sync_task
+    if _match_sync_task is not None:
+        _match_sync_task.cancel()
+        _match_sync_task = None
+    await write_buffer.close()
+    s3_io.close()
+    close_resume_pool()
     client.close()
 
 if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="SecuHire API server")
+    parser.add_argument("--check-indexes", action="store_true", help="report missing/unused MongoDB indexes and exit")
+    parser.add_argument("--bench-storage", action="store_true", help="benchmark the local and in-memory storage backends and exit")
+    parser.add_argument("--reparse-resumes", action="store_true", help="re-extract text and skills for every stored resume and exit")
+    parser.add_argument("--regrade-round", type=int, metavar="N", help="rescore all stored submissions for round N and exit")
+    parser.add_argument("--item-analysis", type=int, metavar="N", help="recompute item analysis for round N, print flagged questions and exit")
+    args = parser.parse_args()
+    if args.check_indexes:
+        raise SystemExit(asyncio.run(check_indexes_cli()))
+    if args.bench_storage:
+        raise SystemExit(asyncio.run(bench_storage_cli()))
+    if args.reparse_resumes:
+        raise SystemExit(asyncio.run(reparse_resumes_cli()))
+    if args.regrade_round is not None:
+        raise SystemExit(asyncio.run(regrade_round_cli(args.regrade_round)))
+    if args.item_analysis is not None:
+        raise SystemExit(asyncio.run(item_analysis_cli(args.item_analysis)))
+
     port = int(os.environ.get("PORT", 5000))
     uvicorn.run("server:app", host="0.0.0.0", port=port)
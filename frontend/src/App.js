@@ -1,6 +1,7 @@
 import React, { useState, useEffect, useRef, useCallback } from "react";
 import { Routes, Route, Navigate, useNavigate } from "react-router-dom";
 import axios from "axios";
+import { getAllPages } from "./lib/pagination";
 import { Button } from "./components/ui/button";
 import { Card, CardContent, CardDescription, CardHeader, CardTitle } from "./components/ui/card";
 import { Input } from "./components/ui/input";
@@ -1116,6 +1117,7 @@ const CandidateDashboard = () => {
     job_type: '',
     experience_level: ''
   });
+  const [searchCursor, setSearchCursor] = useState(null);
   const [selectedInterview, setSelectedInterview] = useState(null);
   const [showSecureInterview, setShowSecureInterview] = useState(false);
   const [interviewData, setInterviewData] = useState(null);
@@ -1134,9 +1136,9 @@ const CandidateDashboard = () => {
       };
 
       const [jobsRes, applicationsRes, interviewsRes] = await Promise.all([
-        axios.get(`${API}/candidates/jobs`, { headers }),
-        axios.get(`${API}/candidates/my-applications`, { headers }),
-        axios.get(`${API}/candidates/interviews`, { headers })
+        getAllPages(`${API}/candidates/jobs`, { headers }),
+        getAllPages(`${API}/candidates/my-applications`, { headers }),
+        getAllPages(`${API}/candidates/interviews`, { headers })
       ]);
 
       setJobs(jobsRes.data);
@@ -1264,7 +1266,7 @@ const CandidateDashboard = () => {
     }
   };
 
-  const searchJobs = async () => {
+  const searchJobs = async (after = null) => {
     try {
       const params = new URLSearchParams();
       Object.entries(searchFilters).forEach(([key, value]) => {
@@ -1276,8 +1278,20 @@ const CandidateDashboard = () => {
         'Content-Type': 'application/json'
       };
       
-      const response = await axios.get(`${API}/candidates/jobs?${params}`, { headers });
+      // Keyword searches go through the relevance-ranked endpoint
+      if (searchFilters.search) {
+        params.delete('search');
+        params.append('q', searchFilters.search);
+        params.append('limit', '100');
+        if (after) params.append('after', after);
+        const response = await axios.get(`${API}/candidates/jobs/search?${params}`, { headers });
+        setJobs(prev => (after ? [...prev, ...response.data.results] : response.data.results));
+        setSearchCursor(response.data.next_cursor || null);
+        return;
+      }
+      const response = await getAllPages(`${API}/candidates/jobs?${params}`, { headers });
       setJobs(response.data);
+      setSearchCursor(null);
     } catch (error) {
       console.error('Search failed:', error);
     }
@@ -1468,7 +1482,7 @@ const CandidateDashboard = () => {
                     </div>
                   </div>
 
-                  <Button onClick={searchJobs} className="bg-gradient-to-r from-teal-600 to-purple-600 hover:from-teal-700 hover:to-purple-700 text-white">
+                  <Button onClick={() => searchJobs()} className="bg-gradient-to-r from-teal-600 to-purple-600 hover:from-teal-700 hover:to-purple-700 text-white">
                     <Search className="w-4 h-4 mr-2" />
                     Search Jobs
                   </Button>
@@ -1491,6 +1505,13 @@ const CandidateDashboard = () => {
                   </Card>
                 )}
               </div>
+              {searchCursor && (
+                <div className="text-center">
+                  <Button variant="outline" onClick={() => searchJobs(searchCursor)}>
+                    Load more jobs
+                  </Button>
+                </div>
+              )}
             </TabsContent>
 
 
@@ -2578,7 +2599,7 @@ const ATSDashboard = () => {
     try {
       setQsLoading(true);
       const headers = { 'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}` };
-      const res = await axios.get(`${API}/question-sets`, { headers });
+      const res = await getAllPages(`${API}/question-sets`, { headers });
       setQsSets(res.data || []);
     } catch (e) {
       console.error('Failed to fetch question sets:', e);
@@ -2677,10 +2698,10 @@ const ATSDashboard = () => {
 
       const [analyticsRes, jobsRes, candidatesRes, applicationsRes, interviewsRes] = await Promise.all([
         axios.get(`${API}/analytics/dashboard`, { headers }),
-        axios.get(`${API}/jobs`, { headers }),
-        axios.get(`${API}/candidates`, { headers }),
-        axios.get(`${API}/applications`, { headers }),
-        axios.get(`${API}/interviews/upcoming`, { headers })
+        getAllPages(`${API}/jobs`, { headers }),
+        getAllPages(`${API}/candidates`, { headers }),
+        getAllPages(`${API}/applications`, { headers }),
+        getAllPages(`${API}/interviews/upcoming`, { headers })
       ]);
 
       setAnalytics(analyticsRes.data);
@@ -2724,7 +2745,7 @@ const ATSDashboard = () => {
 
   const fetchActiveSessions = async () => {
     try {
-      const response = await axios.get(`${API}/secure-interview/active-sessions`);
+      const response = await getAllPages(`${API}/secure-interview/active-sessions`);
       setActiveSessions(response.data);
     } catch (error) {
       console.error('Failed to fetch active sessions:', error);
@@ -2743,7 +2764,7 @@ const ATSDashboard = () => {
 
   const fetchUpcomingInterviews = async () => {
     try {
-      const response = await axios.get(`${API}/interviews/upcoming`, {
+      const response = await getAllPages(`${API}/interviews/upcoming`, {
         headers: {
           'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}`,
           'Content-Type': 'application/json'
@@ -13,6 +13,7 @@ import { Checkbox } from './ui/checkbox';
 import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from './ui/select';
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from './ui/dialog';
 import { Tabs, TabsContent, TabsList, TabsTrigger } from './ui/tabs';
+import { getAllPages } from '../lib/pagination';
 
 export const JobMultipostingSystem = () => {
   const [jobBoards, setJobBoards] = useState([]);
@@ -44,13 +45,10 @@ export const JobMultipostingSystem = () => {
 
   const fetchJobs = async () => {
     try {
-      const response = await fetch(`${process.env.REACT_APP_BACKEND_URL}/api/jobs`, {
+      const { data } = await getAllPages(`${process.env.REACT_APP_BACKEND_URL}/api/jobs`, {
         headers: { 'Authorization': `Bearer ${localStorage.getItem('token')}` }
       });
-      if (response.ok) {
-        const data = await response.json();
-        setJobs(data);
-      }
+      setJobs(data);
     } catch (error) {
       console.error('Failed to fetch jobs:', error);
     }
@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { exchangePhoneToken } from '../lib/proctorApi';
+import { exchangePhoneToken, createRecordingUploader } from '../lib/proctorApi';
 import { joinAndPublish } from '../lib/livekitClient';
 
 export default function PhoneJoinPage() {
@@ -41,17 +41,22 @@ export default function PhoneJoinPage() {
             : 'video/webm';
           const rec = new MediaRecorder(mediaStream, { mimeType: mime });
           recorderRef.current = rec;
-          rec.ondataavailable = async (e) => {
-            if (e.data && e.data.size > 0) {
-              try {
-                const { uploadRecordingChunk } = await import('../lib/proctorApi');
-                const sid = sessionIdRef.current;
-                if (sid) await uploadRecordingChunk(sid, 'phone', e.data);
-              } catch (err) {
-                console.error('Phone chunk upload failed', err);
-              }
+          // Each start()..stop() is one recording, uploaded as the parts of one upload session
+          let uploader = null;
+          rec.onstart = () => {
+            const sid = sessionIdRef.current;
+            uploader = sid ? createRecordingUploader(sid, 'phone', { contentType: mime }) : null;
+          };
+          rec.ondataavailable = (e) => {
+            if (uploader && e.data && e.data.size > 0) {
+              uploader.push(e.data).catch((err) => console.error('Phone chunk upload failed', err));
             }
           };
+          rec.onstop = () => {
+            if (!uploader) return;
+            uploader.finish().catch((err) => console.error('Phone upload completion failed', err));
+            uploader = null;
+          };
           // Poll state every 3s
           const { getRecordingState } = await import('../lib/proctorApi');
           pollRef.current = setInterval(async () => {
@@ -1,6 +1,6 @@
 import React, { useEffect, useRef, useState } from 'react';
 import QRForPhoneJoin from './QRForPhoneJoin';
-import { createSession, laptopJoinToken, getRecordingState } from '../lib/proctorApi';
+import { createSession, laptopJoinToken, getRecordingState, createRecordingUploader } from '../lib/proctorApi';
 import { joinAndPublish } from '../lib/livekitClient';
 export default function ProctorSetup() {
   const [sessionId, setSessionId] = useState('');
@@ -35,16 +35,21 @@ export default function ProctorSetup() {
           : 'video/webm';
         const rec = new MediaRecorder(mediaStream, { mimeType: mime });
         recorderRef.current = rec;
-        rec.ondataavailable = async (e) => {
-          if (e.data && e.data.size > 0) {
-            try {
-              const { uploadRecordingChunk } = await import('../lib/proctorApi');
-              await uploadRecordingChunk(sessionId, 'laptop', e.data);
-            } catch (err) {
-              console.error('Upload chunk failed', err);
-            }
+        // Each start()..stop() is one recording, uploaded as the parts of one upload session
+        let uploader = null;
+        rec.onstart = () => {
+          uploader = createRecordingUploader(sessionId, 'laptop', { contentType: mime });
+        };
+        rec.ondataavailable = (e) => {
+          if (uploader && e.data && e.data.size > 0) {
+            uploader.push(e.data).catch((err) => console.error('Upload chunk failed', err));
           }
         };
+        rec.onstop = () => {
+          if (!uploader) return;
+          uploader.finish().catch((err) => console.error('Upload completion failed', err));
+          uploader = null;
+        };
       }
 
       setStatus('ready');
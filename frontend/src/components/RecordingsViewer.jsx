@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useParams, useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { getAllPages } from '../lib/pagination';
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from './ui/card';
 import { Button } from './ui/button';
 import { Badge } from './ui/badge';
@@ -97,7 +98,7 @@ export default function RecordingsViewer() {
       try {
         setLoading(true);
         // Get recordings list
-        const recRes = await axios.get(`${API}/secure-interview/${interviewId}/recordings`, { headers });
+        const recRes = await getAllPages(`${API}/secure-interview/${interviewId}/recordings`, { headers });
         const filtered = (recRes.data || []).filter(r => !!r.kind && (r.size_bytes ?? 0) >= 0);
         setRecordings(filtered);
         // Fetch interview monitoring snapshot (candidate info, violations, live status)
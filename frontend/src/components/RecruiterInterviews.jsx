@@ -1,6 +1,7 @@
 import React, { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
 import axios from 'axios';
+import { getAllPages } from '../lib/pagination';
 import { Card, CardHeader, CardTitle, CardContent, CardDescription } from './ui/card';
 import { Button } from './ui/button';
 import { Badge } from './ui/badge';
@@ -47,9 +48,9 @@ export default function RecruiterInterviews() {
     try {
       setLoading(true);
       const [res, compRes, qsRes] = await Promise.all([
-        axios.get(`${API}/interviews/upcoming`, { headers }),
-        axios.get(`${API}/interviews/completed`, { headers }),
-        axios.get(`${API}/question-sets`, { headers }),
+        getAllPages(`${API}/interviews/upcoming`, { headers }),
+        getAllPages(`${API}/interviews/completed`, { headers }),
+        getAllPages(`${API}/question-sets`, { headers }),
       ]);
       setUpcoming(res.data || []);
       setCompleted(compRes.data || []);
@@ -231,7 +232,7 @@ export default function RecruiterInterviews() {
         { headers }
       );
       // refresh evaluations list for this interview
-      const res = await axios.get(`${API}/interviews/${showEvalFor.id}/evaluations`, { headers });
+      const res = await getAllPages(`${API}/interviews/${showEvalFor.id}/evaluations`, { headers });
       setEvaluations((prev) => ({ ...prev, [showEvalFor.id]: res.data || [] }));
       setShowEvalFor(null);
       setEvalForm({ overall_score: '', rubric_scores: {}, notes: '' });
@@ -245,7 +246,7 @@ export default function RecruiterInterviews() {
     setShowEvalFor(interview);
     setEvalForm({ overall_score: '', rubric_scores: { communication: 0, technical: 0, culture_fit: 0 }, notes: '' });
     try {
-      const res = await axios.get(`${API}/interviews/${interview.id}/evaluations`, { headers });
+      const res = await getAllPages(`${API}/interviews/${interview.id}/evaluations`, { headers });
       setEvaluations(prev => ({ ...prev, [interview.id]: res.data || [] }));
     } catch (e) {
       setEvaluations(prev => ({ ...prev, [interview.id]: [] }));
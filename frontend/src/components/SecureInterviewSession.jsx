@@ -37,6 +37,8 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
   const [currentRound, setCurrentRound] = useState(1);
   const [roundTimeRemaining, setRoundTimeRemaining] = useState(0); // per-round timer
   const roundTimerRef = useRef(null);
+  // round -> { score, total } as graded by submitRound
+  const roundResultsRef = useRef({});
   const [roundAnswers, setRoundAnswers] = useState([]); // answers for current round only
   const [roundCompletionInfo, setRoundCompletionInfo] = useState(null); // { round, percentage, roundStatus, nextRound, completed }
   const [nextRoundToStart, setNextRoundToStart] = useState(null);
@@ -174,6 +176,8 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
     try {
       const url = new URL(`${API}/interview/getRoundQuestions`);
       url.searchParams.set('round', roundNo);
+      // Per-interview paper: the backend draws a seeded question sample and option order
+      if (interview?.id) url.searchParams.set('interview_id', interview.id);
       const res = await fetch(url.toString(), {
         headers: { 'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}` }
       });
@@ -185,7 +189,7 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
         type: 'multiple_choice',
         question: q.text || 'Select the best answer',
         options: q.options || [],
-        correctAnswer: typeof q.correctIndex === 'number' ? q.correctIndex : (typeof q.correctAnswer === 'number' ? q.correctAnswer : undefined),
+        // Served papers carry no answer key; rounds are scored by submitRound
         timeLimit: q.max_duration_sec || 60,
       }));
       if (!cancelled) {
@@ -229,7 +233,7 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
       }, 1000);
     }
     return () => { cancelled = true; };
-  }, [API]);
+  }, [API, interview?.id]);
 
   useEffect(() => {
     if (sessionPhase === 'monitoring') {
@@ -378,55 +382,44 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
           const a = analysisDataRef.current || {};
           if (!sessionId || !a || !a.facialExpressions || !a.gazeTracking || !a.audioAnalysis) return;
 
-          // Facial telemetry
+          // Facial, voice and screen samples go out in a single batch request
+          const ts = Date.now();
           try {
-            await fetch(`${API}/secure-interview/${sessionId}/facial-analysis`, {
+            await fetch(`${API}/secure-interview/${sessionId}/telemetry:batch`, {
               method: 'POST',
               headers: {
                 'Content-Type': 'application/json',
                 'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}`
               },
               body: JSON.stringify({
-                eye_movement_score: a.gazeTracking.score ?? 0,
-                head_movement_score: a.headMovement?.score ?? 0,
-                facial_expression_score: a.facialExpressions.score ?? 0,
-                attention_score: a.facialExpressions.attention ?? 0,
-                stress_indicators: [],
-              })
-            });
-          } catch {}
-
-          // Voice telemetry
-          try {
-            await fetch(`${API}/secure-interview/${sessionId}/voice-analysis`, {
-              method: 'POST',
-              headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}`
-              },
-              body: JSON.stringify({
-                voice_clarity_score: a.audioAnalysis.voiceClarity ?? 0,
-                speech_pattern_score: a.audioAnalysis.score ?? 0,
-                background_noise_score: a.audioAnalysis.noiseLevel ?? 0,
-                voice_authenticity_score: a.audioAnalysis.score ?? 0,
-                detected_issues: [],
-              })
-            });
-          } catch {}
-
-          // Screen telemetry (focus / tab switches)
-          try {
-            await fetch(`${API}/secure-interview/${sessionId}/screen-analysis`, {
-              method: 'POST',
-              headers: {
-                'Content-Type': 'application/json',
-                'Authorization': `Bearer ${localStorage.getItem('secuhire_token')}`
-              },
-              body: JSON.stringify({
-                tab_switching_detected: !!(a.tabSwitching && a.tabSwitching.detected),
-                unauthorized_apps_detected: [],
-                screen_sharing_quality: 1.0,
-                focus_score: a.gazeTracking.avgFocus ?? a.gazeTracking.score ?? 0,
+                samples: [
+                  {
+                    kind: 'facial',
+                    ts,
+                    eye_movement_score: a.gazeTracking.score ?? 0,
+                    head_movement_score: a.headMovement?.score ?? 0,
+                    facial_expression_score: a.facialExpressions.score ?? 0,
+                    attention_score: a.facialExpressions.attention ?? 0,
+                    stress_indicators: [],
+                  },
+                  {
+                    kind: 'voice',
+                    ts,
+                    voice_clarity_score: a.audioAnalysis.voiceClarity ?? 0,
+                    speech_pattern_score: a.audioAnalysis.score ?? 0,
+                    background_noise_score: a.audioAnalysis.noiseLevel ?? 0,
+                    voice_authenticity_score: a.audioAnalysis.score ?? 0,
+                    detected_issues: [],
+                  },
+                  {
+                    kind: 'screen',
+                    ts,
+                    tab_switching_detected: !!(a.tabSwitching && a.tabSwitching.detected),
+                    unauthorized_apps_detected: [],
+                    screen_sharing_quality: 1.0,
+                    focus_score: a.gazeTracking.avgFocus ?? a.gazeTracking.score ?? 0,
+                  },
+                ]
               })
             });
           } catch {}
@@ -694,6 +687,11 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
         clearInterval(roundTimerRef.current);
       }
 
+      roundResultsRef.current[roundNo] = {
+        score: Number(data?.roundScore) || 0,
+        total: Number(data?.totalQuestions) || 0,
+      };
+
       const info = {
         round: roundNo,
         percentage: data?.percentage,
@@ -811,20 +809,27 @@ const SecureInterviewSession = ({ interview, company, job, onEnd, onClose }) =>
 
   const calculateOverallScore = () => {
     let score = 0;
-    const totalQuestions = interviewQuestions.length || 0;
-
-    // Score MCQs by exact match to correctAnswer index; descriptive gets partial credit
-    (sessionData.answers || []).forEach(ans => {
-      const q = interviewQuestions.find(qi => qi.id === ans.questionId);
-      if (!q) return;
-      if (q.type === 'multiple_choice') {
-        if (String(ans.answer) === String(q.correctAnswer)) score += 1;
-      } else if (q.type === 'descriptive') {
-        const len = (ans.answer || '').length;
-        const attention = ans.analysisData?.facialExpressions?.attention ?? 0.5;
-        score += Math.min(1, (len / 100) * attention);
-      }
-    });
+    let totalQuestions = interviewQuestions.length || 0;
+
+    const graded = Object.values(roundResultsRef.current);
+    if (graded.length) {
+      // Server-graded rounds: the answer key never reaches the browser
+      graded.forEach(r => { score += r.score; });
+      totalQuestions = graded.reduce((n, r) => n + r.total, 0);
+    } else {
+      // Local sample questions: score MCQs by exact match to correctAnswer index; descriptive gets partial credit
+      (sessionData.answers || []).forEach(ans => {
+        const q = interviewQuestions.find(qi => qi.id === ans.questionId);
+        if (!q) return;
+        if (q.type === 'multiple_choice') {
+          if (String(ans.answer) === String(q.correctAnswer)) score += 1;
+        } else if (q.type === 'descriptive') {
+          const len = (ans.answer || '').length;
+          const attention = ans.analysisData?.facialExpressions?.attention ?? 0.5;
+          score += Math.min(1, (len / 100) * attention);
+        }
+      });
+    }
 
     // Penalize violations lightly
     const violationPenalty = (sessionData.violations?.length || 0) * 0.1;
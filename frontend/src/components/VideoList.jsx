@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from "react";
-import axios from "axios";
+import { getAllPages } from "../lib/pagination";
 
 // Props: filters { companyId?, jobId?, candidateId? }
 export default function VideoList({ filters = {} }) {
@@ -17,7 +17,7 @@ export default function VideoList({ filters = {} }) {
         if (filters.companyId) params.companyId = filters.companyId;
         if (filters.jobId) params.jobId = filters.jobId;
         if (filters.candidateId) params.candidateId = filters.candidateId;
-        const { data } = await axios.get(`${backendUrl}/api/video-submissions`, { params });
+        const { data } = await getAllPages(`${backendUrl}/api/video-submissions`, { params });
         setItems(data?.items || []);
       } catch (e) {
         console.error(e);
@@ -0,0 +1,20 @@
+import axios from 'axios';
+
+const pageRows = (data) => (Array.isArray(data) ? data : (data?.items || []));
+
+// List endpoints return one page at a time (100 rows unless `limit` says otherwise) and
+// send the cursor for the next page in the X-Next-Cursor header. getAllPages follows it
+// and resolves like axios.get, with `data` holding the rows of every page (or, for
+// {items, next_cursor} responses, `data.items`).
+export async function getAllPages(url, config = {}) {
+  let response = await axios.get(url, config);
+  const first = response.data;
+  const rows = [...pageRows(first)];
+  let after = response.headers['x-next-cursor'];
+  while (after) {
+    response = await axios.get(url, { ...config, params: { ...(config.params || {}), after } });
+    rows.push(...pageRows(response.data));
+    after = response.headers['x-next-cursor'];
+  }
+  return { ...response, data: Array.isArray(first) ? rows : { ...first, items: rows, next_cursor: null } };
+}
@@ -91,3 +91,96 @@ export async function uploadRecordingChunk(sessionId, source, blob) {
   if (!r.ok) throw new Error('Failed to upload recording');
   return r.json();
 }
+
+async function putRecordingPart(uploadId, n, part, retries) {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      const r = await fetch(`${BACKEND}/recordings/uploads/${uploadId}/parts/${n}`, { method: 'PUT', body: part });
+      if (r.ok) return;
+      // 4xx will fail the same way again; only 5xx and network errors are retried
+      if (r.status < 500) throw Object.assign(new Error(`Failed to upload part ${n} (${r.status})`), { retryable: false });
+      throw new Error(`Failed to upload part ${n} (${r.status})`);
+    } catch (e) {
+      if (e.retryable === false || attempt >= retries) throw Object.assign(e, { uploadId });
+    }
+    await new Promise(res => setTimeout(res, 500 * 2 ** attempt));
+  }
+}
+
+async function startRecordingUpload(sessionId, source, contentType, partSize) {
+  const r = await fetch(`${BACKEND}/recordings/uploads`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ sessionId, source, filename: `${source}-${Date.now()}.webm`, content_type: contentType, part_size: partSize })
+  });
+  if (!r.ok) throw new Error('Failed to start upload');
+  return r.json();
+}
+
+async function completeRecordingUpload(uploadId) {
+  const c = await fetch(`${BACKEND}/recordings/uploads/${uploadId}/complete`, { method: 'POST' });
+  if (!c.ok) throw new Error('Failed to complete upload');
+  return c.json();
+}
+
+// Resumable upload: sends the blob in parts and retries only the parts that fail.
+// Pass a previous uploadId to resume; parts the server already has are skipped.
+export async function uploadRecordingResumable(sessionId, source, blob, { uploadId, partSize = 8 * 1024 * 1024, retries = 3 } = {}) {
+  let upload;
+  if (uploadId) {
+    const s = await fetch(`${BACKEND}/recordings/uploads/${uploadId}/status`);
+    if (!s.ok) throw new Error('Failed to load upload status');
+    upload = await s.json();
+  } else {
+    upload = await startRecordingUpload(sessionId, source, blob.type || 'video/webm', partSize);
+  }
+  const size = upload.part_size;
+  const have = new Set((upload.parts || []).map(p => p.part_number));
+  const total = Math.max(1, Math.ceil(blob.size / size));
+  for (let n = 1; n <= total; n++) {
+    if (have.has(n)) continue;
+    await putRecordingPart(upload.upload_id, n, blob.slice((n - 1) * size, Math.min(n * size, blob.size)), retries);
+  }
+  return completeRecordingUpload(upload.upload_id);
+}
+
+// One upload session for a whole MediaRecorder recording: push() each dataavailable
+// chunk and call finish() on stop. Chunks are buffered until a full part (S3 needs
+// 5 MB for every part but the last) and parts are sent in order, one at a time.
+export function createRecordingUploader(sessionId, source, { contentType = 'video/webm', partSize = 8 * 1024 * 1024, retries = 3 } = {}) {
+  let upload = null;
+  let pending = [];
+  let pendingBytes = 0;
+  let nextPart = 1;
+  let queue = Promise.resolve();
+
+  const enqueue = (task) => {
+    queue = queue.then(task);
+    return queue;
+  };
+  const flush = async () => {
+    if (!pendingBytes) return;
+    const part = new Blob(pending, { type: contentType });
+    pending = [];
+    pendingBytes = 0;
+    if (!upload) upload = await startRecordingUpload(sessionId, source, contentType, partSize);
+    await putRecordingPart(upload.upload_id, nextPart, part, retries);
+    nextPart += 1;
+  };
+
+  return {
+    push(blob) {
+      if (!blob || !blob.size) return queue;
+      pending.push(blob);
+      pendingBytes += blob.size;
+      // the server may round part_size up; until it answers, buffer to the requested size
+      return pendingBytes >= (upload ? upload.part_size : partSize) ? enqueue(flush) : queue;
+    },
+    finish() {
+      return enqueue(async () => {
+        await flush();
+        return upload ? completeRecordingUpload(upload.upload_id) : null;
+      });
+    },
+  };
+}
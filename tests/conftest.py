@@ -0,0 +1,72 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+os.environ.setdefault("ENSURE_INDEXES", "false")
+
+import server  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+CACHES = ("principal_cache", "presign_cache", "s3_listing_cache", "s3_listing_versions", "question_sample_cache",
+          "item_analysis_cache")
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """A fresh in-memory database patched in as server.db, with process caches emptied."""
+    database = AsyncMongoMockClient()["secuhire_test"]
+    monkeypatch.setattr(server, "db", database)
+    for name in CACHES:
+        getattr(server, name)._data.clear()
+    monkeypatch.setattr(server, "match_index", server.MatchIndex())
+    return database
+
+
+@pytest.fixture
+def run():
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
+
+
+@pytest.fixture
+def client(db):
+    with TestClient(server.app) as test_client:
+        yield test_client
+
+
+def auth(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture
+def make_candidate(db, run):
+    def make(**fields):
+        candidate = server.CandidateUser(
+            email=fields.pop("email", f"{server.uuid.uuid4().hex[:8]}@mail.io"),
+            full_name=fields.pop("full_name", "Candidate"),
+            phone=fields.pop("phone", "5550100"),
+            experience_years=fields.pop("experience_years", 3),
+            **fields,
+        )
+        run(db.candidates.insert_one(candidate.dict()))
+        return candidate, server.create_jwt_token(candidate.id, candidate.email, "candidate")
+    return make
+
+
+@pytest.fixture
+def make_recruiter(db, run):
+    def make(role: str = "recruiter", company_id: str = None):
+        if company_id is None:
+            company = server.Company(name="Acme", domain="acme.io", size="1-10", industry="Software")
+            run(db.companies.insert_one(company.dict()))
+            company_id = company.id
+        recruiter = server.Recruiter(email=f"{server.uuid.uuid4().hex[:8]}@acme.io", full_name="Recruiter",
+                                     company_id=company_id, role=role)
+        run(db.recruiters.insert_one(recruiter.dict()))
+        return recruiter, server.create_jwt_token(recruiter.id, recruiter.email, "recruiter", company_id)
+    return make
@@ -0,0 +1,50 @@
+import uuid
+
+from tests.conftest import auth
+
+
+def insert_jobs(db, run, titles, **fields):
+    docs = [{"id": str(uuid.uuid4()), "title": title, "company_id": "co-1", "status": "active", **fields}
+            for title in titles]
+    run(db.jobs.insert_many([dict(d) for d in docs]))
+    return docs
+
+
+def test_jobs_are_listed_oldest_first_across_pages(db, run, client, make_candidate):
+    _, token = make_candidate()
+    titles = [f"Job {i}" for i in range(7)]
+    insert_jobs(db, run, titles)
+
+    seen, after = [], None
+    while True:
+        params = {"limit": 3, **({"after": after} if after else {})}
+        response = client.get("/api/candidates/jobs", headers=auth(token), params=params)
+        assert response.status_code == 200
+        seen += [row["job"]["title"] for row in response.json()]
+        after = response.headers.get("X-Next-Cursor")
+        if not after:
+            break
+    assert seen == titles
+
+
+def test_new_jobs_do_not_reshuffle_existing_order(db, run, client, make_candidate):
+    _, token = make_candidate()
+    insert_jobs(db, run, ["a", "b", "c"])
+    first = [row["job"]["title"] for row in client.get("/api/candidates/jobs", headers=auth(token)).json()]
+    insert_jobs(db, run, ["d", "e"])
+    second = [row["job"]["title"] for row in client.get("/api/candidates/jobs", headers=auth(token)).json()]
+    assert second[:3] == first == ["a", "b", "c"]
+
+
+def test_enrichment_marks_applied_jobs_and_attaches_company(db, run, client, make_candidate):
+    candidate, token = make_candidate()
+    run(db.companies.insert_one({"id": "co-1", "name": "Acme"}))
+    applied, other = insert_jobs(db, run, ["applied", "other"])
+    run(db.candidate_applications.insert_one({"id": "app-1", "candidate_id": candidate.id, "job_id": applied["id"]}))
+
+    rows = {row["job"]["title"]: row for row in client.get("/api/candidates/jobs", headers=auth(token)).json()}
+    assert rows["applied"]["has_applied"] is True
+    assert rows["applied"]["application_id"] == "app-1"
+    assert rows["other"]["has_applied"] is False
+    assert rows["other"]["company"]["name"] == "Acme"
+    assert "_id" not in rows["other"]["job"]
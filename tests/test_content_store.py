@@ -0,0 +1,63 @@
+import hashlib
+import io
+
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+@pytest.fixture
+def store(tmp_path):
+    return server.LocalContentStore(tmp_path)
+
+
+def read_all(run, store, key, chunk_size=4):
+    async def collect():
+        return b"".join([chunk async for chunk in store.iter_chunks(key, chunk_size)])
+    return run(collect())
+
+
+def test_put_addresses_objects_by_content(run, store, tmp_path):
+    stored = run(store.put(io.BytesIO(b"hello world"), "s1/a.webm", 1024))
+    digest = hashlib.sha256(b"hello world").hexdigest()
+    assert stored == {"storage": "local", "key": digest, "size_bytes": 11, "sha256": digest, "deduplicated": False}
+    assert store.local_path(digest) == tmp_path / digest[:2] / digest[2:4] / digest
+    assert store.local_path(digest).read_bytes() == b"hello world"
+    assert run(store.exists(digest))
+    assert read_all(run, store, digest) == b"hello world"
+
+
+def test_identical_content_is_stored_once(run, store, tmp_path):
+    first = run(store.put(io.BytesIO(b"same"), "s1/a.webm", 1024))
+    second = run(store.put(io.BytesIO(b"same"), "s2/b.webm", 1024))
+    assert second["key"] == first["key"]
+    assert second["deduplicated"] is True
+    assert [p for p in tmp_path.rglob("*") if p.is_file()] == [store.local_path(first["key"])]
+
+
+def test_oversized_put_leaves_nothing_behind(run, store, tmp_path):
+    with pytest.raises(server.UploadTooLarge):
+        run(store.put(io.BytesIO(b"x" * 100), "s1/big.webm", 10))
+    assert not [p for p in tmp_path.rglob("*") if p.is_file()]
+
+
+@pytest.mark.parametrize("key", ["", "../etc/passwd", "A" * 64, "ab" * 31])
+def test_keys_that_are_not_digests_have_no_path(run, store, key):
+    assert store.local_path(key) is None
+    assert not run(store.exists(key))
+
+
+def test_store_upload_registers_the_logical_name(db, run, store):
+    stored = run(server.store_upload(store, "recordings", "s1", "laptop.webm", io.BytesIO(b"clip"), 1024,
+                                     "video/webm"))
+    entry = run(db.recording_files.find_one({"namespace": "recordings", "owner": "s1", "filename": "laptop.webm"}))
+    assert entry["storage"] == "local"
+    assert entry["key"] == stored["key"]
+    assert entry["size_bytes"] == 4
+    assert entry["content_type"] == "video/webm"
+
+    with pytest.raises(HTTPException) as exc:
+        run(server.store_upload(store, "recordings", "s1", "big.webm", io.BytesIO(b"x" * 100), 10))
+    assert exc.value.status_code == 413
+    assert run(db.recording_files.count_documents({"filename": "big.webm"})) == 0
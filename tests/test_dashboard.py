@@ -0,0 +1,79 @@
+import server
+from tests.conftest import auth
+
+
+def seed_results(db, run, company_id, results):
+    """results: [(interview_id, round, roundStatus, percentage)]"""
+    for interview_id in {r[0] for r in results}:
+        run(db.interviews.insert_one({"id": interview_id, "candidate_id": f"cand-{interview_id}",
+                                      "company_id": company_id}))
+    run(db.round_results.insert_many([
+        {"interview_id": iv, "candidate_id": f"cand-{iv}", "round": rnd, "roundStatus": status, "percentage": pct}
+        for iv, rnd, status, pct in results
+    ]))
+
+
+def test_rebuild_seeds_aptitude_from_round_results(db, run):
+    seed_results(db, run, "co", [("iv1", 1, "Passed", 80.0), ("iv2", 1, "Failed", 40.0), ("iv1", 2, "Passed", 70.0)])
+    rollup = run(server._rebuild_company_rollup("co"))
+    assert rollup["aptitude"]["1"] == {"submissions": 2, "passed": 1, "percentage_sum": 120.0}
+    assert rollup["aptitude"]["2"] == {"submissions": 1, "passed": 1, "percentage_sum": 70.0}
+
+
+def test_bump_is_a_noop_until_seeded_then_increments(db, run):
+    run(server._bump_company_rollup("co", {"aptitude.1.submissions": 1}))
+    assert run(db.company_rollups.find_one({"company_id": "co"})) is None
+
+    run(server._rebuild_company_rollup("co"))
+    run(server._bump_company_rollup("co", {"aptitude.1.submissions": 1, "aptitude.1.passed": 1,
+                                           "aptitude.1.percentage_sum": 90.0}))
+    run(server._bump_company_rollup("co", {"aptitude.1.submissions": 0, "aptitude.1.passed": -1}))
+    stored = run(db.company_rollups.find_one({"company_id": "co"}))
+    assert stored["aptitude"]["1"] == {"submissions": 1, "passed": 0, "percentage_sum": 90.0}
+
+
+def test_seed_does_not_clobber_a_concurrently_created_rollup(db, run):
+    seed_results(db, run, "co", [("iv1", 1, "Passed", 80.0)])
+    # Another request seeded and bumped the rollup first
+    run(db.company_rollups.insert_one({"company_id": "co", "aptitude": {"1": {"submissions": 5, "passed": 5,
+                                                                              "percentage_sum": 500.0}}}))
+    rollup = run(server._rebuild_company_rollup("co"))
+    assert rollup["aptitude"]["1"]["submissions"] == 5
+
+    rebuilt = run(server._rebuild_company_rollup("co", overwrite=True))
+    assert rebuilt["aptitude"]["1"]["submissions"] == 1
+    assert run(db.company_rollups.find_one({"company_id": "co"}))["aptitude"]["1"]["submissions"] == 1
+
+
+def test_dashboard_counts_pipeline_stages_live(db, run, client, make_recruiter):
+    recruiter, token = make_recruiter()
+    company_id = recruiter.company_id
+    run(db.candidate_applications.insert_many([
+        {"id": "a1", "company_id": company_id, "stage": "new"},
+        {"id": "a2", "company_id": company_id, "stage": "new"},
+        {"id": "a3", "company_id": company_id, "stage": "hired"},
+        {"id": "a4", "company_id": "other", "stage": "new"},
+    ]))
+    seed_results(db, run, company_id, [("iv1", 1, "Passed", 80.0)])
+
+    body = client.get("/api/analytics/dashboard", headers=auth(token)).json()
+    assert body["pipeline"]["new"] == 2
+    assert body["pipeline"]["hired"] == 1
+    assert body["overview"]["total_applications"] == 3
+    assert body["aptitude"]["1"] == {"submissions": 1, "passed": 1, "pass_rate": 100.0, "avg_percentage": 80.0}
+
+    # Rows written outside the API still show up: stages are not served from the rollup
+    run(db.candidate_applications.delete_one({"id": "a1"}))
+    body = client.get("/api/analytics/dashboard", headers=auth(token)).json()
+    assert body["pipeline"]["new"] == 1
+
+
+def test_dashboard_refresh_rebuilds_the_rollup(db, run, client, make_recruiter):
+    recruiter, token = make_recruiter()
+    seed_results(db, run, recruiter.company_id, [("iv1", 2, "Failed", 20.0)])
+    client.get("/api/analytics/dashboard", headers=auth(token))
+    run(db.company_rollups.update_one({"company_id": recruiter.company_id},
+                                      {"$set": {"aptitude.2.submissions": 99}}))
+    assert client.get("/api/analytics/dashboard", headers=auth(token)).json()["aptitude"]["2"]["submissions"] == 99
+    body = client.get("/api/analytics/dashboard", headers=auth(token), params={"refresh": True}).json()
+    assert body["aptitude"]["2"]["submissions"] == 1
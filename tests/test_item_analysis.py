@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+import server
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    # Six pool questions, three per paper; every key is option 0
+    questions = [{"id": f"q{i}", "text": f"Q{i}", "options": ["a", "b", "c"], "correctIndex": 0} for i in range(6)]
+    compiled = server.CompiledRound(1, questions, sample_size=3)
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", {1: compiled})
+    return compiled
+
+
+def take(db, run, compiled, interview_id, answers, order=None):
+    """answers: {question position: selected option}; order: the interview's drawn sample, if any."""
+    interview = {"id": interview_id, "candidate_id": f"c-{interview_id}"}
+    if order is not None:
+        sample = server.RoundSample(compiled, 7, np.asarray(order, dtype=np.int16))
+        interview["question_samples"] = {"1": sample.to_doc()}
+    run(db.interviews.insert_one(interview))
+    run(db.candidate_answers.insert_many([
+        {"interview_id": interview_id, "candidate_id": f"c-{interview_id}", "round": 1, "question_id": f"q{p}",
+         "selected_option": option, "time_spent_sec": 10, "timestamp": NOW}
+        for p, option in answers.items()
+    ]))
+
+
+def test_exposure_counts_mix_fixed_and_sampled_papers(db, run, pool):
+    take(db, run, pool, "fixed", {0: 0, 1: 0, 2: 0})
+    take(db, run, pool, "s1", {3: 0, 4: 1}, order=[3, 4, 5])
+    take(db, run, pool, "s2", {0: 1, 4: 1, 5: 2}, order=[0, 4, 5])
+
+    result = run(server.compute_item_analysis(1))
+    assert result["takers"] == 3
+    items = {item["question_id"]: item for item in result["items"]}
+    assert {qid: item["seen"] for qid, item in items.items()} == {"q0": 2, "q1": 1, "q2": 1, "q3": 1, "q4": 2, "q5": 2}
+    assert (items["q5"]["answered"], items["q5"]["omitted"]) == (1, 1)
+    assert items["q0"]["p_value"] == 0.5
+    # Upper band is the fixed paper (3 correct), lower band s2 (none): each is scored on what it was shown
+    assert items["q0"]["discrimination"] == 1.0
+    assert items["q4"]["discrimination"] == 0.0
+    assert items["q3"]["discrimination"] == 0.0
+
+
+def test_no_takers_yields_empty_counts(db, run, pool):
+    result = run(server.compute_item_analysis(1))
+    assert result["takers"] == 0 and result["mean_score"] is None
+    assert all(item["seen"] == 0 and item["discrimination"] is None for item in result["items"])
@@ -0,0 +1,112 @@
+from datetime import datetime, timedelta, timezone
+
+import server
+
+
+def candidate(cid, skills, years=3):
+    return {"id": cid, "skills": skills, "experience_years": years}
+
+
+def job(jid, skills, level="mid", status="active", requirements=()):
+    return {"id": jid, "skills": skills, "experience_level": level, "status": status,
+            "technical_requirements": list(requirements)}
+
+
+def test_candidates_rank_by_weighted_coverage_then_experience():
+    index = server.MatchIndex()
+    index.upsert_job(job("j1", ["Python", "Docker"], requirements=["Experience with Kubernetes"]))
+    index.upsert_candidate(candidate("full", ["python", "Docker", "K8s"], years=3))
+    index.upsert_candidate(candidate("skills-only", ["Python", "Docker"], years=3))
+    index.upsert_candidate(candidate("junior", ["Python", "Docker"], years=0))
+    index.upsert_candidate(candidate("none", ["Excel"]))
+
+    ranked = index.top_candidates("j1", 10)
+    assert [r["candidate_id"] for r in ranked] == ["full", "skills-only", "junior"]
+    assert ranked[0]["skill_coverage"] == 1.0
+    assert ranked[1]["skill_coverage"] == round(2 / 2.5, 4)
+    assert ranked[1]["missing_skills"] == ["Kubernetes"]
+    assert ranked[0]["score"] > ranked[1]["score"] > ranked[2]["score"]
+
+
+def test_jobs_rank_for_a_candidate_and_skip_inactive_ones():
+    index = server.MatchIndex()
+    index.upsert_candidate(candidate("c1", ["Python", "SQL"], years=6))
+    index.upsert_job(job("senior", ["Python", "SQL"], level="senior"))
+    index.upsert_job(job("junior", ["Python", "SQL"], level="junior"))
+    index.upsert_job(job("draft", ["Python"], status="draft"))
+    index.upsert_job(job("closed", ["Python"], status="closed"))
+    assert [r["job_id"] for r in index.top_jobs("c1", 10)] == ["senior", "junior"]
+    assert [r["job_id"] for r in index.top_jobs("c1", 1)] == ["senior"]
+
+
+def test_updates_and_removals_move_postings():
+    index = server.MatchIndex()
+    index.upsert_job(job("j1", ["Go"]))
+    index.upsert_candidate(candidate("c1", ["Go"]))
+    assert [r["candidate_id"] for r in index.top_candidates("j1", 5)] == ["c1"]
+
+    index.upsert_candidate(candidate("c1", ["Rust"]))
+    assert index.top_candidates("j1", 5) == []
+    index.upsert_candidate(candidate("c1", ["Go"]))
+    index.remove_candidate("c1")
+    assert index.top_candidates("j1", 5) == []
+    assert index.stats()["candidates"] == 0
+
+    index.upsert_candidate(candidate("c2", ["Go"]))
+    index.upsert_job(job("j1", ["Go"], status="closed"))
+    assert index.top_jobs("c2", 5) == []
+
+
+def test_reload_replays_updates_made_while_it_reads(db, run, monkeypatch):
+    run(db.candidates.insert_one(candidate("c1", ["Python"])))
+    run(db.jobs.insert_one(job("j1", ["Python"])))
+    live = server.match_index
+    original_gather = server.asyncio.gather
+
+    async def gather_then_update(*aws):
+        results = await original_gather(*aws)
+        live.upsert_candidate(candidate("late", ["Python"]))
+        live.remove_candidate("c1")
+        return results
+
+    monkeypatch.setattr(server.asyncio, "gather", gather_then_update)
+    index = run(server.load_match_index())
+    assert index is server.match_index and index.loaded
+    assert [r["candidate_id"] for r in index.top_candidates("j1", 5)] == ["late"]
+
+
+def test_workers_pick_up_each_others_changes(db, run):
+    run(server.load_match_index())
+    # Stored times are truncated to milliseconds, so each phase's notes sit well apart
+    start = datetime.now(timezone.utc) - timedelta(seconds=2)
+    # Another worker created a job and a candidate and noted both
+    run(db.jobs.insert_one(job("j1", ["Docker"])))
+    run(db.candidates.insert_one(candidate("c1", ["Docker"])))
+    run(db.match_index_changes.insert_many([
+        {"kind": "job", "entity_id": "j1", "origin": "other", "at": start},
+        {"kind": "candidate", "entity_id": "c1", "origin": "other", "at": start},
+    ]))
+    assert server.match_index.top_candidates("j1", 5) == []
+
+    run(server.sync_match_index(start))
+    assert [r["candidate_id"] for r in server.match_index.top_candidates("j1", 5)] == ["c1"]
+
+    # Our own notes are skipped; deletions reach the index the same way
+    since = start + timedelta(seconds=1)
+    run(db.candidates.delete_one({"id": "c1"}))
+    run(server.note_match_change("candidate", "c1"))
+    run(server.sync_match_index(since))
+    assert server.match_index.top_candidates("j1", 5) != []
+    run(db.match_index_changes.insert_one({"kind": "candidate", "entity_id": "c1", "origin": "other",
+                                           "at": datetime.now(timezone.utc)}))
+    run(server.sync_match_index(since))
+    assert server.match_index.top_candidates("j1", 5) == []
+
+
+def test_a_worker_that_fell_behind_reloads_everything(db, run):
+    run(db.candidates.insert_one(candidate("c1", ["Docker"])))
+    run(db.jobs.insert_one(job("j1", ["Docker"])))
+    stale = datetime.now(timezone.utc) - timedelta(seconds=server.MATCH_INDEX_CHANGE_TTL)
+    run(server.sync_match_index(stale))
+    assert server.match_index.loaded
+    assert [r["candidate_id"] for r in server.match_index.top_candidates("j1", 5)] == ["c1"]
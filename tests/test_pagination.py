@@ -0,0 +1,80 @@
+import pytest
+from fastapi import HTTPException
+
+import server
+
+
+def walk(run, collection, sort, limit, query=None, projection=None):
+    """The ids on every page, following the cursor to the end."""
+    pages, after = [], None
+    while True:
+        docs, after = run(server.paginate_find(collection, query or {}, sort, limit, after, projection))
+        pages.append([d["id"] for d in docs])
+        if not after:
+            return pages
+
+
+def test_pages_cover_every_row_once_in_sort_order(db, run):
+    run(db.items.insert_many([{"id": f"i{n}", "n": n} for n in range(7)]))
+    pages = walk(run, db.items, [("n", 1), ("_id", 1)], 3)
+    assert pages == [["i0", "i1", "i2"], ["i3", "i4", "i5"], ["i6"]]
+
+
+def test_an_exact_last_page_has_no_cursor(db, run):
+    run(db.items.insert_many([{"id": f"i{n}", "n": n} for n in range(4)]))
+    assert walk(run, db.items, [("n", 1), ("_id", 1)], 2) == [["i0", "i1"], ["i2", "i3"]]
+
+
+def test_descending_ties_are_broken_by_the_unique_key(db, run):
+    rows = [{"id": "a", "score": 5}, {"id": "b", "score": 9}, {"id": "c", "score": 5}, {"id": "d", "score": 5},
+            {"id": "e", "score": 1}]
+    run(db.items.insert_many(rows))
+    pages = walk(run, db.items, [("score", -1), ("id", -1)], 2)
+    assert pages == [["b", "d"], ["c", "a"], ["e"]]
+
+
+@pytest.mark.parametrize("direction, expected", [
+    (1, ["none", "missing", "a1", "a2"]),
+    (-1, ["a2", "a1", "none", "missing"]),
+])
+def test_null_and_missing_values_sort_lowest(db, run, direction, expected):
+    run(db.items.insert_many([
+        {"id": "a2", "due": 2, "seq": 4}, {"id": "none", "due": None, "seq": 1},
+        {"id": "a1", "due": 1, "seq": 3}, {"id": "missing", "seq": 2},
+    ]))
+    pages = walk(run, db.items, [("due", direction), ("seq", direction if direction == 1 else 1)], 1)
+    assert [p[0] for p in pages] == expected
+
+
+def test_keyset_query_builds_one_branch_per_sort_key():
+    after = server.encode_cursor([5, "x"])
+    query = server.keyset_query({"company_id": "co"}, [("score", -1), ("id", 1)], after)
+    assert query == {"$and": [{"company_id": "co"}, {"$or": [
+        {"$or": [{"score": {"$lt": 5}}, {"score": None}]},
+        {"$and": [{"score": 5}, {"id": {"$gt": "x"}}]},
+    ]}]}
+    assert server.keyset_query({"a": 1}, [("id", 1)], None) == {"a": 1}
+    # Nothing sorts after a null on a descending key and a null unique key
+    assert server.keyset_query({}, [("due", -1)], server.encode_cursor([None])) is None
+
+
+def test_invalid_cursors_are_rejected():
+    for cursor in ("not-base64!", server.encode_cursor([1]), server.encode_cursor({"a": 1})):
+        with pytest.raises(HTTPException) as exc:
+            server.keyset_query({}, [("n", 1), ("_id", 1)], cursor)
+        assert exc.value.status_code == 400
+
+
+def test_hidden_id_can_still_order_the_pages(db, run):
+    run(db.items.insert_many([{"id": f"i{n}"} for n in range(3)]))
+    docs, after = run(server.paginate_find(db.items, {}, [("_id", 1)], 2, None, {"_id": 0}))
+    assert [d["id"] for d in docs] == ["i0", "i1"] and all("_id" not in d for d in docs)
+    docs, after = run(server.paginate_find(db.items, {}, [("_id", 1)], 2, after, {"_id": 0}))
+    assert [d["id"] for d in docs] == ["i2"] and after is None
+
+
+def test_limits_are_clamped():
+    assert server.clamp_limit(None) == server.PAGE_LIMIT_DEFAULT == 100
+    assert server.clamp_limit(0) == 100
+    assert server.clamp_limit(-5) == 1
+    assert server.clamp_limit(10 ** 6) == server.PAGE_LIMIT_MAX
@@ -0,0 +1,77 @@
+from collections import OrderedDict
+
+import pytest
+from fastapi.security import HTTPAuthorizationCredentials
+
+import server
+
+
+@pytest.fixture(autouse=True)
+def fresh_generations(monkeypatch):
+    monkeypatch.setattr(server, "_principal_generation", OrderedDict())
+    monkeypatch.setattr(server, "_principal_generation_last", 0)
+    monkeypatch.setattr(server, "_principal_generation_floor", 0)
+
+
+def resolve(run, token):
+    credentials = HTTPAuthorizationCredentials(scheme="Bearer", credentials=token)
+    return run(server._resolve_principal(credentials, "candidate", "candidates", server.CandidateUser))
+
+
+def rename(db, run, candidate, name):
+    run(db.candidates.update_one({"id": candidate.id}, {"$set": {"full_name": name}}))
+
+
+def test_principals_are_cached_until_invalidated(db, run, make_candidate):
+    candidate, token = make_candidate(full_name="Before")
+    assert resolve(run, token).full_name == "Before"
+    rename(db, run, candidate, "After")
+    assert resolve(run, token).full_name == "Before"
+    server.invalidate_principal(candidate.id)
+    assert resolve(run, token).full_name == "After"
+
+
+class RacingDatabase:
+    """server.db stand-in: the next candidate lookup reads the old document, then sees a
+    profile write land and bump the user's generation before it returns."""
+
+    def __init__(self, db, monkeypatch, candidate, bump_lifetime: float):
+        self.db, self.monkeypatch, self.candidate, self.bump_lifetime = db, monkeypatch, candidate, bump_lifetime
+        self.raced = False
+
+    def __getitem__(self, name):
+        return self if name == "candidates" and not self.raced else self.db[name]
+
+    async def find_one(self, *args, **kwargs):
+        doc = await self.db.candidates.find_one(*args, **kwargs)
+        self.raced = True
+        await self.db.candidates.update_one({"id": self.candidate.id}, {"$set": {"full_name": "After"}})
+        self.monkeypatch.setattr(server, "PRINCIPAL_CACHE_SECONDS", self.bump_lifetime)
+        server.invalidate_principal(self.candidate.id)
+        self.monkeypatch.setattr(server, "PRINCIPAL_CACHE_SECONDS", 30.0)
+        return doc
+
+
+def racing_lookup(db, monkeypatch, candidate, bump_lifetime: float):
+    monkeypatch.setattr(server, "db", RacingDatabase(db, monkeypatch, candidate, bump_lifetime))
+
+
+def test_a_lookup_that_raced_a_bump_is_not_served(db, run, make_candidate, monkeypatch):
+    candidate, token = make_candidate(full_name="Before")
+    racing_lookup(db, monkeypatch, candidate, bump_lifetime=30.0)
+    assert resolve(run, token).full_name == "Before"
+    assert resolve(run, token).full_name == "After"
+
+
+def test_pruning_the_bump_does_not_revive_the_stale_entry(db, run, make_candidate, monkeypatch):
+    candidate, token = make_candidate(full_name="Before")
+    other, _ = make_candidate()
+    racing_lookup(db, monkeypatch, candidate, bump_lifetime=0.0)
+    assert resolve(run, token).full_name == "Before"
+    # The next bump prunes the candidate's (already expired) generation
+    server.invalidate_principal(other.id)
+    assert candidate.id not in server._principal_generation
+    assert resolve(run, token).full_name == "After"
+    # Entries stamped after the pruned bump stay valid
+    rename(db, run, candidate, "Later")
+    assert resolve(run, token).full_name == "After"
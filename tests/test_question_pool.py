@@ -0,0 +1,126 @@
+import json
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend"))
+
+from server import CompiledRound, RoundSample  # noqa: E402
+
+
+def make_round(pool=12, sample_size=5):
+    questions = [
+        {
+            "id": f"q{i}",
+            "text": f"Question {i}",
+            "options": [f"q{i}-opt{o}" for o in range(4 if i % 2 else 5)],
+            "correctIndex": i % 4,
+        }
+        for i in range(pool)
+    ]
+    return CompiledRound(2, questions, sample_size)
+
+
+@pytest.fixture
+def compiled():
+    return make_round()
+
+
+def test_draw_is_deterministic_per_seed(compiled):
+    first = compiled.draw(1234)
+    assert first.dtype == np.int16
+    assert np.array_equal(first, compiled.draw(1234))
+    assert len(first) == compiled.sample_size
+    assert len(set(first.tolist())) == compiled.sample_size
+    assert all(0 <= p < compiled.count for p in first.tolist())
+
+
+def test_draw_varies_with_seed_and_round(compiled):
+    draws = {tuple(compiled.draw(seed).tolist()) for seed in range(20)}
+    assert len(draws) > 1
+    other_round = CompiledRound(3, list(compiled.questions), compiled.sample_size)
+    assert any(
+        not np.array_equal(compiled.draw(seed), other_round.draw(seed)) for seed in range(20)
+    )
+
+
+def test_option_order_is_a_stable_permutation(compiled):
+    for position in range(compiled.count):
+        order = compiled.option_order(99, position)
+        assert sorted(order.tolist()) == list(range(int(compiled.option_counts[position])))
+        assert np.array_equal(order, compiled.option_order(99, position))
+
+
+def test_option_order_does_not_depend_on_the_drawn_questions(compiled):
+    before = [compiled.option_order(7, p).tolist() for p in range(compiled.count)]
+    compiled.draw(7)
+    compiled.draw(8)
+    assert [compiled.option_order(7, p).tolist() for p in range(compiled.count)] == before
+
+
+def test_sample_round_trips_through_its_stored_doc(compiled):
+    sample = RoundSample(compiled, 42, compiled.draw(42))
+    restored = RoundSample.from_doc(compiled, sample.to_doc())
+    assert restored.seed == sample.seed
+    assert np.array_equal(restored.order, sample.order)
+    assert restored.option_orders.keys() == sample.option_orders.keys()
+    assert restored.body() == sample.body()
+
+
+def test_resolve_maps_displayed_options_back_to_the_pool(compiled):
+    sample = RoundSample(compiled, 42, compiled.draw(42))
+    served = {q["id"]: q for q in json.loads(sample.body())["questions"]}
+    for qid, position in sample.slots.items():
+        pool_options = compiled.questions[position]["options"]
+        for displayed, text in enumerate(served[qid]["options"]):
+            assert sample.resolve(qid, displayed) == (position, pool_options.index(text))
+
+
+def test_resolve_handles_off_paper_and_invalid_answers(compiled):
+    sample = RoundSample(compiled, 42, compiled.draw(42))
+    off_paper = next(qid for qid in compiled.question_ids if qid not in sample.slots)
+    assert sample.resolve(off_paper, 1) == (-1, 1)
+    assert sample.resolve("unknown", 0) == (-1, 0)
+    qid, position = next(iter(sample.slots.items()))
+    assert sample.resolve(qid, None) == (position, None)
+    assert sample.resolve(qid, 10) == (position, None)
+    assert sample.resolve(qid, -1) == (position, None)
+
+
+def test_served_papers_carry_no_answer_key(compiled):
+    sample = RoundSample(compiled, 5, compiled.draw(5))
+    for body in (sample.body(), compiled.body):
+        questions = json.loads(body)["questions"]
+        assert questions
+        assert all("correctIndex" not in q for q in questions)
+    assert all("correctIndex" in q for q in compiled.questions)
+
+
+def test_grade_batch_scores_a_repeated_question_once_by_its_last_answer(compiled):
+    key = compiled.answer_key.tolist()
+    wrong = [(k + 1) % 4 for k in key]
+    # submission 0: q0 wrong then right, q1 right twice; submission 1: q0 right then wrong
+    submission = [0, 0, 0, 0, 1, 1]
+    positions = [0, 0, 1, 1, 0, 0]
+    selected = [wrong[0], key[0], key[1], key[1], key[0], wrong[0]]
+    row_correct, correct = compiled.grade_batch(submission, positions, selected, 2)
+    assert row_correct.tolist() == [False, True, True, True, True, False]
+    assert correct.tolist() == [2, 0]
+
+
+def test_grade_batch_ignores_unanswered_rows_and_unknown_positions(compiled):
+    key = compiled.answer_key.tolist()
+    # a later unanswered row does not cancel an earlier answer
+    submission = [0, 0, 0, 0]
+    positions = [3, 3, -1, compiled.count]
+    selected = [key[3], -1, 0, 0]
+    row_correct, correct = compiled.grade_batch(submission, positions, selected, 1)
+    assert row_correct.tolist() == [True, False, False, False]
+    assert correct.tolist() == [1]
+
+
+def test_grade_batch_counts_every_submission(compiled):
+    _, correct = compiled.grade_batch([], [], [], 3)
+    assert correct.tolist() == [0, 0, 0]
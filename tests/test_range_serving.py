@@ -0,0 +1,72 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+import server
+
+BODY = bytes(range(10))
+
+
+@pytest.fixture
+def clip_client(tmp_path):
+    path = tmp_path / "clip.webm"
+    path.write_bytes(BODY)
+    app = FastAPI()
+
+    @app.api_route("/clip", methods=["GET", "HEAD"])
+    async def clip(request: Request):
+        return server.serve_file_with_range(request, path, filename="clip.webm")
+
+    return TestClient(app)
+
+
+def test_full_response_carries_validators(clip_client):
+    response = clip_client.get("/clip")
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["content-type"].startswith("video/webm")
+    assert response.headers["etag"].startswith('"')
+
+
+@pytest.mark.parametrize("header, status, content_range, body", [
+    ("bytes=2-5", 206, "bytes 2-5/10", BODY[2:6]),
+    ("bytes=7-", 206, "bytes 7-9/10", BODY[7:]),
+    ("bytes=-3", 206, "bytes 7-9/10", BODY[7:]),
+    ("bytes=-30", 206, "bytes 0-9/10", BODY),
+    ("bytes=4-100", 206, "bytes 4-9/10", BODY[4:]),
+    ("bytes=10-", 416, "bytes */10", b""),
+    ("bytes=6-2", 416, "bytes */10", b""),
+    ("bytes=-", 416, "bytes */10", b""),
+    ("bytes=0-1,4-5", 416, "bytes */10", b""),
+])
+def test_single_byte_ranges(clip_client, header, status, content_range, body):
+    response = clip_client.get("/clip", headers={"Range": header})
+    assert response.status_code == status
+    assert response.headers["content-range"] == content_range
+    if status == 206:
+        assert response.content == body
+        assert response.headers["content-length"] == str(len(body))
+
+
+def test_if_none_match_answers_304(clip_client):
+    etag = clip_client.get("/clip").headers["etag"]
+    assert clip_client.get("/clip", headers={"If-None-Match": etag}).status_code == 304
+    assert clip_client.get("/clip", headers={"If-None-Match": f'"other", {etag}'}).status_code == 304
+    assert clip_client.get("/clip", headers={"If-None-Match": "*"}).status_code == 304
+    assert clip_client.get("/clip", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_if_range_with_a_stale_etag_sends_the_whole_file(clip_client):
+    etag = clip_client.get("/clip").headers["etag"]
+    assert clip_client.get("/clip", headers={"Range": "bytes=0-1", "If-Range": etag}).status_code == 206
+    stale = clip_client.get("/clip", headers={"Range": "bytes=0-1", "If-Range": '"stale"'})
+    assert stale.status_code == 200
+    assert stale.content == BODY
+
+
+def test_head_sends_headers_only(clip_client):
+    response = clip_client.head("/clip", headers={"Range": "bytes=0-3"})
+    assert response.status_code == 206
+    assert response.headers["content-length"] == "4"
+    assert response.content == b""
@@ -0,0 +1,85 @@
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+
+import pytest
+
+import server
+from tests.conftest import auth
+
+
+def make_bank(key):
+    questions = [{"id": f"q{i}", "text": f"Q{i}", "options": ["a", "b", "c", "d"], "correctIndex": k}
+                 for i, k in enumerate(key)]
+    return MappingProxyType({1: server.CompiledRound(1, questions)})
+
+
+@pytest.fixture
+def interview(db, run, monkeypatch):
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", make_bank([0, 1, 2, 3]))
+    run(db.interviews.insert_one({"id": "iv1", "candidate_id": "c1", "company_id": "co"}))
+    return "iv1"
+
+
+def submit(client, interview_id, choices):
+    answers = [{"questionId": f"q{i}", "answer": c} for i, c in enumerate(choices)]
+    response = client.post("/api/interview/submitRound", json={"interview_id": interview_id, "round": 1,
+                                                                "answers": answers})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_regrade_applies_a_corrected_answer_key(db, run, client, interview, monkeypatch):
+    assert submit(client, interview, [0, 1, 2, 3])["roundStatus"] == "Passed"
+    run(db.company_rollups.insert_one({"company_id": "co", "aptitude": {}}))
+
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", make_bank([0, 0, 0, 0]))
+    stats = run(server.regrade_round(1))
+    assert stats == {"attempts": 1, "changed": 1, "status_flips": 1, "answers_relabelled": 3}
+
+    result = run(db.round_results.find_one({"interview_id": interview, "round": 1}))
+    assert (result["correctAnswers"], result["wrongAnswers"], result["roundStatus"]) == (1, 3, "Failed")
+    assert run(db.interviews.find_one({"id": interview}))["round_statuses"]["1"] == "Failed"
+    flags = {a["question_id"]: a["is_correct"] for a in run(db.candidate_answers.find().to_list(None))}
+    assert flags == {"q0": True, "q1": False, "q2": False, "q3": False}
+    # The dashboard rebuilds the company's rollup from the new results
+    assert run(db.company_rollups.count_documents({})) == 0
+
+    # Nothing changes on a second pass
+    assert run(server.regrade_round(1))["changed"] == 0
+
+
+def test_only_the_latest_attempt_is_regraded(db, run, client, interview, monkeypatch):
+    submit(client, interview, [0, 1, 2, 3])
+    submit(client, interview, [3, 3, 3, 3])
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", make_bank([3, 3, 3, 0]))
+    stats = run(server.regrade_round(1))
+    assert stats["attempts"] == 1
+    result = run(db.round_results.find_one({"interview_id": interview}))
+    assert result["correctAnswers"] == 3 and result["roundStatus"] == "Passed"
+
+
+def test_one_regrade_job_per_round(db, run, client, interview, make_recruiter):
+    _, recruiter = make_recruiter()
+    _, admin = make_recruiter(role="admin")
+    assert client.post("/api/interview/rounds/1/regrade", headers=auth(recruiter)).status_code == 403
+
+    now = datetime.now(timezone.utc)
+    run(db.regrade_jobs.insert_one({"id": "busy", "round": 1, "status": "running", "started_at": now,
+                                    "heartbeat_at": now}))
+    conflict = client.post("/api/interview/rounds/1/regrade", headers=auth(admin))
+    assert conflict.status_code == 409
+    assert conflict.json()["detail"]["job_id"] == "busy"
+
+
+def test_a_job_that_stopped_beating_is_failed_and_frees_the_round(db, run, client, interview, make_recruiter):
+    _, admin = make_recruiter(role="admin")
+    stale = datetime.now(timezone.utc) - timedelta(seconds=server.REGRADE_STALE_SECONDS + 1)
+    run(db.regrade_jobs.insert_one({"id": "dead", "round": 1, "status": "running", "started_at": stale,
+                                    "heartbeat_at": stale}))
+
+    dead = client.get("/api/interview/regrade-jobs/dead", headers=auth(admin)).json()
+    assert dead["status"] == "failed" and "heartbeat" in dead["error"]
+
+    started = client.post("/api/interview/rounds/1/regrade", headers=auth(admin))
+    assert started.status_code == 200
+    assert started.json()["status"] == "running"
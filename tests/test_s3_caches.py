@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+import server
+
+
+def test_listing_fetched_before_an_upload_is_not_cached(db, run, monkeypatch):
+    listings = iter([["old"], ["old", "new"]])
+
+    async def list_racing_an_upload(op, fn, session_id):
+        items = next(listings)
+        if items == ["old"]:
+            server.invalidate_session_listing(session_id)
+        return items
+
+    monkeypatch.setattr(server.s3_io, "run", list_racing_an_upload)
+    assert run(server.cached_list_session("s1")) == ["old"]
+    assert server.s3_listing_cache.get("s1") is None
+    assert run(server.cached_list_session("s1")) == ["old", "new"]
+    assert server.s3_listing_cache.get("s1") == ["old", "new"]
+
+
+def test_presigned_urls_are_cached_no_longer_than_the_credentials_last(db, run, monkeypatch):
+    signed = []
+    monkeypatch.setattr(server, "s3_presign_get", lambda *args, **kwargs: signed.append(args) or f"url{len(signed)}")
+
+    monkeypatch.setattr(server, "_s3_credentials_expiry", lambda: None)
+    run(server.cached_presign_get("s1", "static.webm"))
+    expires_at, _ = server.presign_cache._data[("s1", "static.webm")]
+    assert expires_at - server.time.monotonic() > server.presign_cache.ttl - 5
+
+    soon = datetime.now(timezone.utc) + timedelta(seconds=server.PRESIGN_CACHE_MARGIN + 60)
+    monkeypatch.setattr(server, "_s3_credentials_expiry", lambda: soon)
+    run(server.cached_presign_get("s1", "sts.webm"))
+    expires_at, _ = server.presign_cache._data[("s1", "sts.webm")]
+    assert expires_at - server.time.monotonic() <= 60
+
+    nearly = datetime.now(timezone.utc) + timedelta(seconds=server.PRESIGN_CACHE_MARGIN - 1)
+    monkeypatch.setattr(server, "_s3_credentials_expiry", lambda: nearly)
+    assert run(server.cached_presign_get("s1", "late.webm")) == "url3"
+    assert run(server.cached_presign_get("s1", "late.webm")) == "url4"
@@ -0,0 +1,41 @@
+import pytest
+
+import server
+
+
+@pytest.fixture
+def matcher():
+    return server.SkillMatcher(server.DEFAULT_SKILL_TAXONOMY)
+
+
+def test_aliases_report_canonical_names_in_order_of_appearance(matcher):
+    text = "Deployed on K8s with Postgres; built ReactJS front ends and Amazon Web Services infra."
+    assert matcher.find(text) == ["Kubernetes", "PostgreSQL", "React", "AWS"]
+
+
+def test_matches_respect_word_boundaries(matcher):
+    assert matcher.find("JavaScript developer") == ["JavaScript"]
+    assert matcher.find("Java and JavaScript") == ["Java", "JavaScript"]
+    assert matcher.find("gitlab, digital, mlops") == []
+
+
+def test_node_needs_the_js_suffix(matcher):
+    assert matcher.find("Wrote graph node traversal and tuned cluster nodes") == []
+    assert matcher.find("Services in Node.js and nodejs") == ["Node.js"]
+
+
+def test_python3_is_python(matcher):
+    assert matcher.find("Scripts in Python3") == ["Python"]
+    assert matcher.canonical("python3") == "Python"
+
+
+def test_overlapping_hits_resolve_to_the_longest(matcher):
+    custom = server.SkillMatcher([{"name": "C"}, {"name": "C++"}, {"name": "Google Cloud Platform", "aliases": []},
+                                  {"name": "Google Cloud"}])
+    assert custom.find("C++ on Google Cloud Platform, some C") == ["C++", "Google Cloud Platform", "C"]
+
+
+def test_matching_ignores_case_and_whitespace_runs(matcher):
+    assert matcher.find("MACHINE\n  learning and project\tmanagement") == ["Machine Learning", "Project Management"]
+    assert matcher.canonical("  k8S ") == "Kubernetes"
+    assert matcher.canonical("Elixir") == "Elixir"
@@ -0,0 +1,156 @@
+from types import MappingProxyType
+
+import mongomock
+import pytest
+
+import server
+
+
+class FakeSession:
+    """Stands in for a Motor ClientSession: runs the callback once, recording the call."""
+
+    def __init__(self, log):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def with_transaction(self, callback):
+        self.log.append("begin")
+        result = await callback(self)
+        self.log.append("commit")
+        return result
+
+
+class FakeClient:
+    def __init__(self):
+        self.log = []
+
+    async def start_session(self):
+        return FakeSession(self.log)
+
+    def close(self):
+        pass
+
+
+class SessionCheckingDatabase:
+    """server.db stand-in recording each collection call, whether it carried the session and
+    whether it ran while the transaction was open."""
+
+    def __init__(self, db, log, calls):
+        self._db, self._log, self._calls = db, log, calls
+
+    def __getattr__(self, name):
+        return SessionCheckingCollection(getattr(self._db, name), name, self._log, self._calls)
+
+
+class SessionCheckingCollection:
+    def __init__(self, collection, name, log, calls):
+        self._collection, self._name, self._log, self._calls = collection, name, log, calls
+
+    def __getattr__(self, method):
+        target = getattr(self._collection, method)
+
+        def call(*args, **kwargs):
+            in_transaction = self._log[-1:] == ["begin"]
+            self._calls.append((self._name, method, in_transaction, isinstance(kwargs.get("session"), FakeSession)))
+            return target(*args, **kwargs)
+        return call
+
+
+@pytest.fixture
+def sessions():
+    # mongomock raises on session= unless told to ignore it; the fake session only needs to pass through
+    mongomock.ignore_feature("session")
+    yield
+    mongomock.warn_on_feature("session")
+
+
+def bank():
+    questions = [{"id": f"q{i}", "text": f"Q{i}", "options": ["a", "b", "c", "d"], "correctIndex": i % 4}
+                 for i in range(5)]
+    return MappingProxyType({r: server.CompiledRound(r, questions) for r in (1, 2, 3)})
+
+
+@pytest.fixture(params=[False, True], ids=["no-transactions", "transactions"])
+def transactions(request, db, run, monkeypatch):
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", bank())
+    monkeypatch.setattr(server, "SUBMIT_ROUND_TRANSACTIONS", request.param)
+    if request.param:
+        request.getfixturevalue("sessions")
+    fake = FakeClient()
+    monkeypatch.setattr(server, "client", fake)
+    run(db.candidates.insert_one({"id": "c1", "email": "c1@mail.io"}))
+    run(db.interviews.insert_one({"id": "iv1", "candidate_id": "c1", "company_id": "co"}))
+    run(server._rebuild_company_rollup("co"))
+    return request.param, fake.log
+
+
+def submit(client, round_num, correct, interview_id="iv1"):
+    answers = [{"questionId": f"q{i}", "answer": (i % 4) if i < correct else (i + 1) % 4} for i in range(5)]
+    return client.post("/api/interview/submitRound", json={"interview_id": interview_id, "round": round_num,
+                                                           "answers": answers})
+
+
+def test_a_round_stores_answers_result_and_rollup(db, run, client, transactions):
+    enabled, log = transactions
+    body = submit(client, 1, correct=4).json()
+    assert (body["roundScore"], body["totalQuestions"], body["roundStatus"], body["nextRound"]) == (4, 5, "Passed", 2)
+    assert log == (["begin", "commit"] if enabled else [])
+
+    assert run(db.candidate_answers.count_documents({"interview_id": "iv1", "round": 1})) == 5
+    assert run(db.candidate_answers.count_documents({"is_correct": True})) == 4
+    assert run(db.interview_round_submissions.count_documents({})) == 1
+    result = run(db.round_results.find_one({"interview_id": "iv1", "round": 1}))
+    assert result["candidate_id"] == "c1" and result["percentage"] == 80.0
+    assert run(db.interviews.find_one({"id": "iv1"}))["round_statuses"] == {"1": "Passed"}
+    rollup = run(db.company_rollups.find_one({"company_id": "co"}))["aptitude"]["1"]
+    assert rollup == {"submissions": 1, "passed": 1, "percentage_sum": 80.0}
+
+
+def test_a_resubmission_replaces_the_result_in_the_rollup(db, run, client, transactions):
+    submit(client, 1, correct=4)
+    submit(client, 1, correct=1)
+    assert run(db.round_results.count_documents({})) == 1
+    rollup = run(db.company_rollups.find_one({"company_id": "co"}))["aptitude"]["1"]
+    assert rollup == {"submissions": 1, "passed": 0, "percentage_sum": 20.0}
+
+
+def test_the_last_round_closes_the_interview_with_a_final_status(db, run, client, transactions):
+    for round_num, correct in ((1, 5), (2, 4), (3, 2)):
+        body = submit(client, round_num, correct).json()
+    assert body["completed"] is True and body["nextRound"] is None
+    interview = run(db.interviews.find_one({"id": "iv1"}))
+    assert interview["status"] == "completed"
+    assert interview["round_statuses"] == {"1": "Passed", "2": "Passed", "3": "Failed"}
+    assert run(db.candidates.find_one({"id": "c1"}))["finalStatus"] == "Rejected"
+
+
+def test_unknown_interviews_write_nothing(db, run, client, transactions):
+    assert submit(client, 1, correct=5, interview_id="missing").status_code == 404
+    assert submit(client, 9, correct=5).status_code == 400
+    for name in ("candidate_answers", "round_results", "interview_round_submissions"):
+        assert run(db[name].count_documents({})) == 0
+
+
+def test_with_transactions_every_write_runs_in_the_session(db, run, client, sessions, monkeypatch):
+    monkeypatch.setattr(server, "COMPILED_ROUNDS", bank())
+    monkeypatch.setattr(server, "SUBMIT_ROUND_TRANSACTIONS", True)
+    fake = FakeClient()
+    monkeypatch.setattr(server, "client", fake)
+    run(db.interviews.insert_one({"id": "iv1", "candidate_id": "c1", "company_id": "co",
+                                  "round_statuses": {"1": "Passed", "2": "Passed"}}))
+    calls = []
+    monkeypatch.setattr(server, "db", SessionCheckingDatabase(db, fake.log, calls))
+    assert submit(client, 3, correct=5).status_code == 200
+
+    inside = [(name, method) for name, method, in_transaction, _ in calls if in_transaction]
+    assert {name for name, _ in inside} == {"interviews", "interview_round_submissions", "round_results",
+                                            "candidate_answers", "candidates"}
+    assert all(with_session for _, _, in_transaction, with_session in calls if in_transaction)
+    # Outside the transaction there are only reads and the best-effort rollup bump
+    outside = {(name, method) for name, method, in_transaction, _ in calls if not in_transaction}
+    assert all(method.startswith("find") or name == "company_rollups" for name, method in outside)
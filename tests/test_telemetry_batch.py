@@ -0,0 +1,77 @@
+import time
+from datetime import timezone
+
+import pytest
+
+import server
+from tests.conftest import auth
+
+
+@pytest.fixture
+def session(db, run, make_candidate):
+    candidate, token = make_candidate()
+    run(db.secure_sessions.insert_one({"id": "s1", "candidate_id": candidate.id, "interview_id": "iv1",
+                                       "is_active": True}))
+    return candidate, token
+
+
+def post_batch(client, token, samples):
+    return client.post("/api/secure-interview/s1/telemetry:batch", headers=auth(token), json={"samples": samples})
+
+
+def test_batch_stores_each_kind_and_updates_the_rollup(db, run, client, session):
+    candidate, token = session
+    response = post_batch(client, token, [
+        {"kind": "facial", "attention_score": 0.9},
+        {"kind": "facial", "attention_score": 0.7},
+        {"kind": "voice", "voice_authenticity_score": 0.8},
+        {"kind": "screen", "focus_score": 0.6, "tab_switching_detected": True, "unauthorized_apps_detected": ["x"]},
+    ])
+    assert response.status_code == 200
+    assert response.json()["accepted"] == {"facial": 2, "voice": 1, "screen": 1}
+
+    facial = run(db.facial_analyses.find({}, {"_id": 0}).to_list(None))
+    assert len(facial) == 2
+    assert all(doc["interview_id"] == "iv1" and doc["candidate_id"] == candidate.id for doc in facial)
+    assert run(db.voice_analyses.count_documents({})) == 1
+
+    rollup = run(db.telemetry_rollups.find_one({"interview_id": "iv1"}))
+    assert rollup["seeded"] is True
+    assert rollup["facial"]["records"] == 2
+    assert rollup["facial"]["sum_attention_score"] == pytest.approx(1.6)
+    assert rollup["screen"]["tab_switch_events"] == 1
+    assert rollup["screen"]["unauthorized_apps_events"] == 1
+
+
+def test_invalid_sample_rejects_the_whole_batch(db, run, client, session):
+    _, token = session
+    response = post_batch(client, token, [
+        {"kind": "facial", "attention_score": 0.9},
+        {"kind": "gaze"},
+        {"kind": "voice", "voice_clarity_score": "loud"},
+    ])
+    assert response.status_code == 422
+    assert [e["index"] for e in response.json()["detail"]["invalid_samples"]] == [1, 2]
+    assert run(db.facial_analyses.count_documents({})) == 0
+    assert run(db.telemetry_rollups.count_documents({})) == 0
+
+
+def test_batch_limits_and_unknown_session(db, client, session, make_candidate, monkeypatch):
+    _, token = session
+    assert post_batch(client, token, []).status_code == 400
+    monkeypatch.setattr(server, "TELEMETRY_BATCH_MAX", 2)
+    assert post_batch(client, token, [{"kind": "facial"}] * 3).status_code == 413
+
+    _, stranger = make_candidate()
+    assert post_batch(client, stranger, [{"kind": "facial"}]).status_code == 404
+
+
+def test_client_timestamps_are_kept_but_never_in_the_future(db, run, client, session):
+    _, token = session
+    past_ms = (time.time() - 60) * 1000
+    future_ms = (time.time() + 3600) * 1000
+    post_batch(client, token, [{"kind": "facial", "ts": past_ms}, {"kind": "facial", "ts": future_ms}])
+    docs = run(db.facial_analyses.find().to_list(None))
+    stamps = sorted(doc["timestamp"].replace(tzinfo=timezone.utc).timestamp() for doc in docs)
+    assert stamps[0] == pytest.approx(past_ms / 1000, abs=0.01)
+    assert stamps[1] <= time.time()
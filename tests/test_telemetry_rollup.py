@@ -0,0 +1,70 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+import server
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def facial(score: float, minutes: int, in_rollup: bool = True):
+    record = server.build_telemetry_record("facial", "iv1", "cand", {"attention_score": score})
+    record["timestamp"] = T0 + timedelta(minutes=minutes)
+    if not in_rollup:
+        record.pop("in_rollup")
+    return record
+
+
+def fold(db, run, records):
+    update = server.telemetry_rollup_update({"facial": records})
+    return run(db.telemetry_rollups.update_one({"interview_id": "iv1"}, update, upsert=True))
+
+
+def test_rollup_matches_the_aggregation_over_all_samples(db, run):
+    batches = [[facial(0.5, 1), facial(0.9, 2)], [facial(0.2, 3)]]
+    for records in batches:
+        run(db.facial_analyses.insert_many([dict(r) for r in records]))
+        fold(db, run, records)
+    run(db.telemetry_rollups.update_one({"interview_id": "iv1"}, {"$set": {"seeded": True}}))
+
+    stats = run(server.interview_telemetry_stats("iv1"))["facial"]
+    expected = run(server.telemetry_aggregates({"interview_id": "iv1"}))["facial"]
+    assert stats["records"] == expected["records"] == 3
+    for field in ("sum_attention_score", "avg_attention_score", "min_attention_score", "max_attention_score",
+                  "last_attention_score"):
+        assert stats[field] == pytest.approx(expected[field]), field
+
+
+def test_an_older_batch_does_not_roll_back_last_values(db, run):
+    fold(db, run, [facial(0.8, 10)])
+    fold(db, run, [facial(0.1, 5), facial(0.3, 6)])
+    stored = run(db.telemetry_rollups.find_one({"interview_id": "iv1"}))["facial"]
+    assert stored["last_attention_score"] == pytest.approx(0.8)
+    assert stored["last_timestamp"].replace(tzinfo=timezone.utc) == T0 + timedelta(minutes=10)
+    assert stored["records"] == 3
+    assert stored["min_attention_score"] == pytest.approx(0.1)
+    assert stored["max_attention_score"] == pytest.approx(0.8)
+
+
+def test_samples_from_before_the_rollup_are_seeded_once(db, run):
+    legacy = [facial(0.4, 1, in_rollup=False), facial(0.6, 2, in_rollup=False)]
+    run(db.facial_analyses.insert_many(legacy))
+    fresh = [facial(1.0, 3)]
+    run(db.facial_analyses.insert_many([dict(r) for r in fresh]))
+    fold(db, run, fresh)
+
+    # The first read seeds the rollup with the legacy samples; later reads do not add them again
+    for _ in range(2):
+        stats = run(server.interview_telemetry_stats("iv1"))["facial"]
+        assert stats["records"] == 3
+        assert stats["sum_attention_score"] == pytest.approx(2.0)
+        assert stats["last_attention_score"] == pytest.approx(1.0)
+
+
+def test_interviews_without_a_rollup_fall_back_to_aggregation(db, run):
+    run(db.facial_analyses.insert_many([facial(0.3, 1, in_rollup=False), facial(0.7, 2, in_rollup=False)]))
+    stats = run(server.interview_telemetry_stats("iv1"))
+    assert stats["facial"]["records"] == 2
+    assert stats["facial"]["avg_attention_score"] == pytest.approx(0.5)
+    assert stats["voice"]["records"] == 0
+    assert run(db.telemetry_rollups.count_documents({})) == 0
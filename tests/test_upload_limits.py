@@ -0,0 +1,52 @@
+import pytest
+
+import server
+from tests.conftest import auth
+
+LIMIT = 4096
+
+
+@pytest.fixture
+def uploads(tmp_path, monkeypatch):
+    monkeypatch.setattr(server, "MAX_RESUME_BYTES", LIMIT)
+    monkeypatch.setattr(server, "MULTIPART_OVERHEAD_BYTES", 1024)
+    monkeypatch.setattr(server, "resume_storage", server.LocalContentStore(tmp_path))
+    monkeypatch.setattr(server, "schedule_resume_parse", lambda *args: None)
+    return tmp_path
+
+
+def multipart(payload: bytes, boundary: str = "limit-test") -> tuple:
+    head = (f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"cv.pdf\"\r\n"
+            f"Content-Type: application/pdf\r\n\r\n").encode()
+    return head + payload + f"\r\n--{boundary}--\r\n".encode(), f"multipart/form-data; boundary={boundary}"
+
+
+def test_small_resume_is_stored(db, run, client, make_candidate, uploads):
+    candidate, token = make_candidate()
+    response = client.post("/api/candidates/resume", headers=auth(token),
+                           files={"file": ("cv.pdf", b"%PDF small", "application/pdf")})
+    assert response.status_code == 200
+    stored = run(db.candidates.find_one({"id": candidate.id}))
+    assert server.Path(stored["resume_path"]).read_bytes() == b"%PDF small"
+
+
+def test_oversized_content_length_is_rejected_before_the_body_is_read(client, make_candidate, uploads):
+    _, token = make_candidate()
+    response = client.post("/api/candidates/resume", headers=auth(token),
+                           files={"file": ("cv.pdf", b"x" * (3 * LIMIT), "application/pdf")})
+    assert response.status_code == 413
+    assert not (uploads / "tmp").exists()
+
+
+def test_oversized_chunked_body_is_cut_off_while_streaming(client, make_candidate, uploads):
+    _, token = make_candidate()
+    body, content_type = multipart(b"x" * (3 * LIMIT))
+
+    def chunks():
+        for start in range(0, len(body), 1024):
+            yield body[start:start + 1024]
+
+    response = client.post("/api/candidates/resume", headers={**auth(token), "Content-Type": content_type},
+                           content=chunks())
+    assert response.status_code == 413
+    assert "MB limit" in response.json()["detail"]
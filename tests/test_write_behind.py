@@ -0,0 +1,130 @@
+import asyncio
+
+import pytest
+
+import server
+from tests.conftest import auth
+
+
+class GatedCollection:
+    """Records writes; each write waits until the test opens the gate."""
+
+    def __init__(self, gate: asyncio.Event, written: list):
+        self.gate = gate
+        self.written = written
+
+    async def insert_many(self, docs, ordered=False):
+        await self.gate.wait()
+        self.written.extend(docs)
+
+    async def bulk_write(self, ops, ordered=False):
+        await self.gate.wait()
+        self.written.extend(ops)
+
+
+class GatedDatabase:
+    def __init__(self):
+        self.gate = asyncio.Event()
+        self.written = {}
+
+    def __getitem__(self, name):
+        return GatedCollection(self.gate, self.written.setdefault(name, []))
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_writes_go_straight_through_before_start(db, run):
+    buffer = server.WriteBehindBuffer(database=db)
+    run(buffer.insert("login_events", {"n": 1}))
+    assert run(db.login_events.count_documents({})) == 1
+    assert buffer.stats()["running"] is False
+
+
+def test_queued_writes_are_batched_per_collection(db, run):
+    async def scenario():
+        buffer = server.WriteBehindBuffer(database=db, max_batch=3, flush_interval=60)
+        buffer.start()
+        for n in range(7):
+            await buffer.insert("login_events", {"n": n})
+        await buffer.write("telemetry_rollups", server.UpdateOne({"k": 1}, {"$inc": {"n": 1}}, upsert=True))
+        await buffer.close()
+        return buffer
+
+    buffer = run(scenario())
+    assert run(db.login_events.count_documents({})) == 7
+    assert run(db.telemetry_rollups.find_one({"k": 1}))["n"] == 1
+    # 7 inserts at max_batch=3 flush as 3 + 3 + 1, plus one bulk_write
+    assert buffer.counters["batches"] == 4
+    assert buffer.stats()["queued"] == 0
+
+
+@pytest.mark.parametrize("policy, kept", [("drop_new", [0, 1]), ("drop_oldest", [1, 2])])
+def test_drop_policies(db, run, policy, kept):
+    async def scenario():
+        buffer = server.WriteBehindBuffer(database=db, flush_interval=60, max_queued=2, policy=policy)
+        buffer.start()
+        for n in range(3):
+            await buffer.insert("login_events", {"n": n})
+        await buffer.close()
+        return buffer
+
+    buffer = run(scenario())
+    assert buffer.counters["dropped"] == 1
+    assert sorted(d["n"] for d in run(db.login_events.find().to_list(None))) == kept
+
+
+def test_in_flight_batches_count_against_the_bound(run):
+    async def scenario():
+        database = GatedDatabase()
+        buffer = server.WriteBehindBuffer(database=database, flush_interval=60, max_queued=2, policy="drop_oldest")
+        buffer.start()
+        await buffer.insert("login_events", {"n": 0})
+        await buffer.insert("login_events", {"n": 1})
+        flushing = asyncio.create_task(buffer.flush())
+        await settle()
+        # Both items are being written: nothing old is droppable, so the new one goes
+        await buffer.insert("login_events", {"n": 2})
+        assert buffer.stats()["queued"] == 2
+        assert buffer.counters["dropped"] == 1
+        database.gate.set()
+        await flushing
+        assert buffer.stats()["queued"] == 0
+        await buffer.insert("login_events", {"n": 3})
+        await buffer.close()
+        return database
+
+    database = run(scenario())
+    assert [d["n"] for d in database.written["login_events"]] == [0, 1, 3]
+
+
+def test_security_violations_block_instead_of_dropping(run):
+    async def scenario():
+        database = GatedDatabase()
+        buffer = server.WriteBehindBuffer(database=database, flush_interval=60, max_queued=1, policy="drop_new",
+                                          never_drop=("security_violations",))
+        buffer.start()
+        await buffer.insert("security_violations", {"n": 0})
+        waiting = asyncio.create_task(buffer.insert("security_violations", {"n": 1}))
+        await settle()
+        assert not waiting.done()
+        database.gate.set()
+        await asyncio.wait_for(waiting, 5)
+        await buffer.close()
+        return database, buffer
+
+    database, buffer = run(scenario())
+    assert [d["n"] for d in database.written["security_violations"]] == [0, 1]
+    assert buffer.counters["dropped"] == 0
+    assert buffer.counters["blocked"] == 1
+
+
+def test_metrics_require_an_admin(client, make_recruiter):
+    _, recruiter = make_recruiter()
+    _, admin = make_recruiter(role="admin")
+    assert client.get("/metrics").status_code in (401, 403)
+    assert client.get("/metrics", headers=auth(recruiter)).status_code == 403
+    body = client.get("/metrics", headers=auth(admin)).json()
+    assert body["write_behind"]["policy"] in server.WriteBehindBuffer.POLICIES